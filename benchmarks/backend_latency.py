@@ -0,0 +1,119 @@
+""":mod:`ultralight_cffi` benchmark: ABI-mode vs API-mode call latency.
+
+Measures, for each backend (see :data:`ultralight_cffi.Backend`):
+
+* ``call``: a trivial Python -> C call (``lib.ulVersionMajor()``).
+* ``callback``: a Python -> C -> Python round trip through a :class:`CustomSurface`
+  callback (``lib.ulSurfaceGetWidth(surface)``).
+
+Each backend runs in its own subprocess, since the bindings are chosen per process.
+The ``abi`` run dispatches the callback through a libffi closure
+(``ffi.callback``), and the ``api`` run through an ``extern "Python"`` function.
+The API-mode bindings must be built first (``python scripts/_build.py --api``).
+
+Configure the ``ULTRALIGHT_SDK_PATH`` environment variable so that the shared libraries
+show up in ``$ULTRALIGHT_SDK_PATH/bin``.
+"""
+
+import argparse
+import os
+import pathlib
+import subprocess
+import sys
+import timeit
+import ultralight_cffi as ultra
+from collections.abc import Callable
+from typing import Self
+from typing_extensions import Buffer
+from ultralight_cffi import _base
+
+_SDK_PATH = pathlib.Path(os.environ.get('ULTRALIGHT_SDK_PATH', 'ultralight-sdk'))
+_NUMBER = 200_000
+_REPEAT = 5
+_BACKENDS: list[ultra.Backend] = ['abi', 'api']
+
+
+class _Surface(ultra.CustomSurface):
+    def __init__(self, width: int, height: int) -> None:
+        super().__init__()
+        self._width = width
+        self._height = height
+        self._pixels = bytearray(width * height * 4)
+
+    @classmethod
+    def create(cls, width: int, height: int) -> Self:
+        return cls(width, height)
+
+    def destroy(self) -> None:
+        pass
+
+    def get_width(self) -> int:
+        return self._width
+
+    def get_height(self) -> int:
+        return self._height
+
+    def get_size(self) -> int:
+        return len(self._pixels)
+
+    def get_row_bytes(self) -> int:
+        return self._width * 4
+
+    def lock_pixels(self) -> Buffer:
+        return self._pixels
+
+    def unlock_pixels(self) -> None:
+        pass
+
+    def resize(self, width: int, height: int) -> None:
+        self._width = width
+        self._height = height
+        self._pixels = bytearray(width * height * 4)
+
+
+def _measure(func: Callable[[], object]) -> float:
+    """Returns the best-of-``_REPEAT`` per-call time, in nanoseconds."""
+    return min(timeit.repeat(func, number=_NUMBER, repeat=_REPEAT)) / _NUMBER * 1e9
+
+
+def _run_backend(backend: ultra.Backend) -> None:
+    lib = ultra.load(_SDK_PATH / 'bin', backend=backend)
+    lib.ulPlatformSetSurfaceDefinition(_Surface.get_definition()[0])
+    config = ultra.ulCreateConfig()
+    renderer = ultra.ulCreateRenderer(config)
+    ultra.ulDestroyConfig(config)
+    view_config = ultra.ulCreateViewConfig()
+    view = ultra.ulCreateView(renderer, 64, 64, view_config, ultra.NULL)
+    ultra.ulDestroyViewConfig(view_config)
+    surface = lib.ulViewGetSurface(view)
+    callbacks = 'extern "Python"' if _base.uses_api_callbacks() else 'ffi.callback'
+
+    call_ns = _measure(lambda: lib.ulVersionMajor())
+    callback_ns = _measure(lambda: lib.ulSurfaceGetWidth(surface))
+    print(
+        f'{backend:<4} call: {call_ns:7.1f} ns   '
+        f'callback: {callback_ns:7.1f} ns ({callbacks})'
+    )
+
+    ultra.ulDestroyView(view)
+    ultra.ulDestroyRenderer(renderer)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--backend', choices=_BACKENDS)
+    args = parser.parse_args()
+    if args.backend is not None:
+        _run_backend(args.backend)
+    else:
+        if ultra.get_api_bindings() is None:
+            sys.exit('API-mode bindings not built; run `scripts/_build.py --api`')
+        for backend in _BACKENDS:
+            subprocess.run(
+                [sys.executable, __file__, '--backend', backend],
+                check=True,
+            )
+
+
+if __name__ == '__main__':
+    main()
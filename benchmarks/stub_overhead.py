@@ -0,0 +1,77 @@
+""":mod:`ultralight_cffi` benchmark: Per-call overhead of the annotated ``_stubs``
+wrappers.
+
+Compares three ways of calling the same Ultralight functions:
+
+* ``raw``: calling the CFFI ``Lib`` attribute directly (``lib.ulVersionMajor()``).
+* ``stub``: calling the generated, annotated wrapper (``ultra.ulVersionMajor()``),
+  which goes through ``_base.get_lib()`` plus an attribute lookup on every call.
+* ``rebound``: calling the package-level function after ``ultra.load(...,
+  direct_bind=True)`` has replaced the wrappers with the raw CFFI function objects.
+
+Configure the ``ULTRALIGHT_SDK_PATH`` environment variable so that the shared libraries
+show up in ``$ULTRALIGHT_SDK_PATH/bin``, or set ``ULTRALIGHT_BACKEND=fake`` to measure
+the wrapper overhead against the pure-Python fake library, without the SDK.
+"""
+
+import os
+import pathlib
+import timeit
+import ultralight_cffi as ultra
+from collections.abc import Callable
+from typing import cast
+
+_SDK_PATH = pathlib.Path(os.environ.get('ULTRALIGHT_SDK_PATH', 'ultralight-sdk'))
+_BACKEND = cast(ultra.Backend, os.environ.get('ULTRALIGHT_BACKEND', 'auto'))
+_NUMBER = 200_000
+_REPEAT = 5
+
+
+def _measure(func: Callable[[], object]) -> float:
+    """Returns the best-of-``_REPEAT`` per-call time, in nanoseconds."""
+    return min(timeit.repeat(func, number=_NUMBER, repeat=_REPEAT)) / _NUMBER * 1e9
+
+
+def _report(label: str, raw_ns: float, stub_ns: float, rebound_ns: float) -> None:
+    print(
+        f'{label:<24} raw: {raw_ns:7.1f} ns   stub: {stub_ns:7.1f} ns   '
+        f'rebound: {rebound_ns:7.1f} ns   (stub overhead: {stub_ns - raw_ns:+.1f} ns)'
+    )
+
+
+def main() -> None:
+    lib = ultra.load(_SDK_PATH / 'bin', backend=_BACKEND)
+    bitmap = lib.ulCreateBitmap(16, 16, lib.kBitmapFormat_BGRA8_UNORM_SRGB)
+    try:
+        stub_version = ultra.ulVersionMajor
+        stub_width = ultra.ulBitmapGetWidth
+        raw_results = (
+            _measure(lambda: lib.ulVersionMajor()),
+            _measure(lambda: lib.ulBitmapGetWidth(bitmap)),
+        )
+        stub_results = (
+            _measure(lambda: stub_version()),
+            _measure(lambda: stub_width(bitmap)),
+        )
+
+        lib = ultra.load(_SDK_PATH / 'bin', backend=_BACKEND, direct_bind=True)
+        rebound_version = ultra.ulVersionMajor
+        rebound_width = ultra.ulBitmapGetWidth
+        rebound_results = (
+            _measure(lambda: rebound_version()),
+            _measure(lambda: rebound_width(bitmap)),
+        )
+
+        _report('ulVersionMajor()', raw_results[0], stub_results[0], rebound_results[0])
+        _report(
+            'ulBitmapGetWidth(bitmap)',
+            raw_results[1],
+            stub_results[1],
+            rebound_results[1],
+        )
+    finally:
+        lib.ulDestroyBitmap(bitmap)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+""":mod:`ultralight_cffi` benchmark: :class:`CustomSurface` getter callback throughput.
+
+Compares, in callbacks per second, the ``ULSurfaceDefinition`` getters (``get_width``,
+``get_height``, ``get_row_bytes`` and ``get_size``) of:
+
+* ``dispatch``: a surface with the default ``cache_metrics = False``, whose callbacks
+  call into the subclass' getters every time.
+* ``cached``: a surface with ``cache_metrics = True``, whose callbacks
+  return the metrics cached by :meth:`CustomSurface.update_metrics` - from Python in
+  ABI mode, or from plain C with the compiled API-mode bindings.
+
+The callbacks are called through their C function pointers, as Ultralight would, so
+neither the SDK nor a renderer is needed.
+"""
+
+import timeit
+import ultralight_cffi as ultra
+from collections.abc import Callable
+from typing import Any
+from typing import Self
+from typing_extensions import Buffer
+from ultralight_cffi import _base
+
+_NUMBER = 200_000
+_REPEAT = 5
+_GETTERS = ['get_width', 'get_height', 'get_row_bytes', 'get_size']
+
+
+class _Surface(ultra.CustomSurface):
+    def __init__(self, width: int, height: int) -> None:
+        super().__init__()
+        self._width = width
+        self._height = height
+        self._pixels = bytearray(width * height * 4)
+
+    @classmethod
+    def create(cls, width: int, height: int) -> Self:
+        return cls(width, height)
+
+    def destroy(self) -> None:
+        pass
+
+    def get_width(self) -> int:
+        return self._width
+
+    def get_height(self) -> int:
+        return self._height
+
+    def get_row_bytes(self) -> int:
+        return self._width * 4
+
+    def get_size(self) -> int:
+        return self._width * self._height * 4
+
+    def lock_pixels(self) -> Buffer:
+        return self._pixels
+
+    def unlock_pixels(self) -> None:
+        pass
+
+    def resize(self, width: int, height: int) -> None:
+        self._width = width
+        self._height = height
+        self._pixels = bytearray(width * height * 4)
+
+
+class _CachedSurface(_Surface):
+    cache_metrics = True
+
+
+def _measure(func: Callable[[], object]) -> float:
+    """Returns the best-of-``_REPEAT`` calls per second."""
+    return _NUMBER / min(timeit.repeat(func, number=_NUMBER, repeat=_REPEAT))
+
+
+def _run(label: str, surface_cls: type[_Surface]) -> list[float]:
+    defn: Any = surface_cls.get_definition()
+    user_data = defn.create(64, 64)
+    results = []
+    for getter in _GETTERS:
+        callback = getattr(defn, getter)
+        results.append(_measure(lambda: callback(user_data)))
+    defn.destroy(user_data)
+    print(
+        f'{label:<10}'
+        + '   '.join(
+            f'{getter}: {rate / 1e6:5.2f} M/s'
+            for getter, rate in zip(_GETTERS, results)
+        )
+    )
+    return results
+
+
+def main() -> None:
+    mode = 'API' if _base.uses_api_callbacks() else 'ABI'
+    print(f'{mode}-mode callbacks')
+    before = _run('dispatch', _Surface)
+    after = _run('cached', _CachedSurface)
+    speedup = sum(after) / sum(before)
+    print(f'speedup: {speedup:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
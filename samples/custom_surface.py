@@ -71,16 +71,7 @@ class MemorySurface(ultralight_cffi.CustomSurface):
             pixels = self.lock_pixels()
 
             # Convert BGRA to RGBA (swap red and blue channels)
-            rgba_pixels = bytearray(width * height * 4)
-            for y in range(height):
-                for x in range(width):
-                    i = (y * row_bytes) + (x * 4)
-                    rgba_pixels[i : i + 4] = [
-                        pixels[i + 2],  # R
-                        pixels[i + 1],  # G
-                        pixels[i + 0],  # B
-                        pixels[i + 3],  # A
-                    ]
+            rgba_pixels = ultralight_cffi.bgra_to_rgba(pixels, width, height, row_bytes)
 
             # Create an Image object and save as PNG
             img = PIL.Image.frombytes('RGBA', (width, height), bytes(rgba_pixels))
@@ -1,7 +1,11 @@
+import argparse
 import cffi
 import cffi.model
+import dataclasses
 import logging
 import pathlib
+import platform
+import pprint
 from textwrap import dedent
 from typing import Any
 from typing import TypeAlias
@@ -17,6 +21,80 @@ _SKIP_DECL_NAMES = {
     'typedef __timer_t',
 }
 
+_API_MODULE_NAME = 'ultralight_cffi._bindings_api'
+
+_API_CDEF_START = 'typedef const struct OpaqueJSContextGroup* JSContextGroupRef;'
+"""The first Ultralight declaration in ``_bindings.h``.
+
+Everything before it is libc boilerplate pulled in by the preprocessor, which CFFI
+already knows about natively in API mode - and which would conflict with the real
+system headers when compiled.
+"""
+
+_API_SKIP_DECLS = [
+    # Data symbols can't be bound lazily (see `create_api_ffibuilder`), and this one is
+    # only a convenience constant anyway.
+    'extern const JSClassDefinition kJSClassDefinitionEmpty;',
+]
+
+_API_SURFACE_DATA_DECL = dedent(
+    '''\
+    typedef struct {
+      void* handle;
+      unsigned int width;
+      unsigned int height;
+      unsigned int row_bytes;
+      size_t size;
+    } _ULPySurfaceData;
+    '''
+)
+"""The ``user_data`` of :class:`ultralight_cffi.CustomSurface` instances in API mode:
+the Python handle, plus the cached metrics that the compiled getters return."""
+
+_API_EXTERN_PYTHON_CDEF = dedent(
+    '''\
+    extern "Python" void _cb__surface_destroy(_ULPySurfaceData*);
+    extern "Python" unsigned int _cb__surface_get_width(_ULPySurfaceData*);
+    extern "Python" unsigned int _cb__surface_get_height(_ULPySurfaceData*);
+    extern "Python" unsigned int _cb__surface_get_row_bytes(_ULPySurfaceData*);
+    extern "Python" size_t _cb__surface_get_size(_ULPySurfaceData*);
+    extern "Python" void* _cb__surface_lock_pixels(_ULPySurfaceData*);
+    extern "Python" void _cb__surface_unlock_pixels(_ULPySurfaceData*);
+    extern "Python" void _cb__surface_resize(_ULPySurfaceData*, unsigned int, unsigned int);
+    '''
+)
+"""Statically compiled callbacks for :class:`ultralight_cffi.CustomSurface`, which avoid
+the libffi closure trampolines of ``ffi.callback`` in API mode."""
+
+_API_SURFACE_GETTERS_CDEF = dedent(
+    '''\
+    unsigned int _surface_get_width(void*);
+    unsigned int _surface_get_height(void*);
+    unsigned int _surface_get_row_bytes(void*);
+    size_t _surface_get_size(void*);
+    '''
+)
+
+_API_SURFACE_GETTERS_SOURCE = dedent(
+    '''\
+    static unsigned int _surface_get_width(void* user_data) {
+      return ((_ULPySurfaceData*)user_data)->width;
+    }
+    static unsigned int _surface_get_height(void* user_data) {
+      return ((_ULPySurfaceData*)user_data)->height;
+    }
+    static unsigned int _surface_get_row_bytes(void* user_data) {
+      return ((_ULPySurfaceData*)user_data)->row_bytes;
+    }
+    static size_t _surface_get_size(void* user_data) {
+      return ((_ULPySurfaceData*)user_data)->size;
+    }
+    '''
+)
+"""Plain C ``ULSurfaceDefinition`` getters for the metrics cached in
+``_ULPySurfaceData``, which WebCore calls repeatedly while painting - without entering
+Python at all."""
+
 _TypeID: TypeAlias = int
 
 _TypedefMap: TypeAlias = dict[_TypeID, tuple[cffi.model.BaseTypeByIdentity, set[str]]]
@@ -24,6 +102,22 @@ _TypedefMap: TypeAlias = dict[_TypeID, tuple[cffi.model.BaseTypeByIdentity, set[
 _logger = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass
+class _LazyTables:
+    """Compact descriptions of the runtime symbols, from which the lazy ``_stubs.py``
+    materializes each symbol on first access (see ``ultralight_cffi/_lazy.py``).
+
+    The fully annotated declarations go into ``_stubs.pyi`` instead, which is only
+    consulted by static type checkers.
+    """
+
+    functions: list[str] = dataclasses.field(default_factory=list)
+    enums: dict[str, dict[str, int]] = dataclasses.field(default_factory=dict)
+    enum_members: dict[str, str] = dataclasses.field(default_factory=dict)
+    classes: dict[str, dict[str, str]] = dataclasses.field(default_factory=dict)
+    type_aliases: dict[str, str] = dataclasses.field(default_factory=dict)
+
+
 def _get_typedef_map(
     declarations: dict[str, tuple[cffi.model.BaseTypeByIdentity, Any]],
 ) -> _TypedefMap:
@@ -178,16 +272,19 @@ def _transform_struct_field(
 
 def _transform_struct_typedef(
     typedef_map: _TypedefMap,
+    tables: _LazyTables,
     type_name: str,
     type_obj: cffi.model.StructType,
 ) -> str:
     assert type_name.startswith('typedef ')
     name = type_name.removeprefix('typedef ')
 
+    fields = tables.classes.setdefault(name, {})
     result = f'class {name}:\n'
     if type_obj.fldnames and type_obj.fldtypes:
         for field_name, field_type in zip(type_obj.fldnames, type_obj.fldtypes):
             field_def = _transform_struct_field(typedef_map, field_name, field_type)
+            fields[field_name] = _transform_field_typename(typedef_map, field_type)
             result += f'    {field_def}\n'
     else:
         result += '    ...\n'
@@ -196,6 +293,7 @@ def _transform_struct_typedef(
 
 def _transform_enum_typedef(
     typedef_map: _TypedefMap,
+    tables: _LazyTables,
     type_name: str,
     type_obj: cffi.model.EnumType,
 ) -> str:
@@ -207,10 +305,12 @@ def _transform_enum_typedef(
     for member_name, member_value in zip(type_obj.enumerators, type_obj.enumvalues):
         result += f'    {member_name} = {member_value}\n'
     result += '\n\n'
+    tables.enums[name] = dict(zip(type_obj.enumerators, type_obj.enumvalues))
 
     # Also add top-level aliases:
     for member_name, member_value in zip(type_obj.enumerators, type_obj.enumvalues):
         result += f'{member_name} = {name}.{member_name}\n'
+        tables.enum_members[member_name] = name
 
     result += '\n'
     return result
@@ -218,21 +318,19 @@ def _transform_enum_typedef(
 
 def _transform_function_type(
     typedef_map: _TypedefMap,
+    tables: _LazyTables,
     type_name: str,
     type_obj: cffi.model.FunctionPtrType,
 ) -> str:
     assert type_name.startswith('function ')
     func_name = type_name.removeprefix('function ')
 
-    arg_values: list[str] = []
     arg_annotations: list[str] = []
     for arg_index, arg_type_obj in enumerate(type_obj.args):
         # Ideally the argument names would match the argument names in the C headers,
         # but the CFFI parser doesn't provide such information, so the arg names have to
         # just be `arg0`, `arg1`, etc.
         arg_name = f'arg{arg_index}'
-        arg_value = arg_name  # TBD: arg value expressions could be modified here
-        arg_values.append(arg_value)
         arg_typename = _transform_field_typename(typedef_map, arg_type_obj)
         arg_annotations.append(f'{arg_name}: {arg_typename}')
 
@@ -242,39 +340,30 @@ def _transform_function_type(
         # passed positionally - but only if there's at least one arg.
         arg_annotations_text += ', /,'
 
-    arg_values_text = ', '.join(arg_values)
-    if arg_values:
-        arg_values_text += ','
-
     return_typename = _transform_field_typename(typedef_map, type_obj.result)
-    ignore_return_type = (
-        '# type: ignore[no-any-return]' if return_typename != 'Any' else ''
-    )
 
-    result = f'def {func_name}({arg_annotations_text}) -> {return_typename}:\n'
-    result += (
-        f'    return ({ignore_return_type}\n'
-        f'        _base.get_lib().{func_name}(  # type: ignore[attr-defined]\n'
-        f'            {arg_values_text}\n'
-        '        )'
-        '    )'
-    )
-    return result
+    # The runtime wrapper is materialized lazily (see `_lazy.LazySymbols`), so only the
+    # annotated signature is emitted here, for the `.pyi`.
+    tables.functions.append(func_name)
+    return f'def {func_name}({arg_annotations_text}) -> {return_typename}: ...\n'
 
 
 def _transform_function_ptr_typedef(
     typedef_map: _TypedefMap,
+    tables: _LazyTables,
     type_name: str,
     type_obj: cffi.model.FunctionPtrType,
 ) -> str:
     assert type_name.startswith('typedef ')
     name = type_name.removeprefix('typedef ')
     callable_text = _transform_function_ptr(typedef_map, type_obj)
+    tables.type_aliases[name] = callable_text
     return f'{name}: TypeAlias = {callable_text}\n'
 
 
 def _transform_declaration(
     typedef_map: _TypedefMap,
+    tables: _LazyTables,
     type_name: str,
     type_obj: cffi.model.BaseTypeByIdentity,
 ) -> str:
@@ -289,7 +378,7 @@ def _transform_declaration(
             # Example: `typedef struct { float value[4]; } ULvec4;` - where `ULvec4`
             # becomes `class ULvec4: ...` with actual field definitions.
             #
-            result = _transform_struct_typedef(typedef_map, type_name, type_obj)
+            result = _transform_struct_typedef(typedef_map, tables, type_name, type_obj)
 
         elif type_name.startswith('anonymous '):
             #
@@ -307,6 +396,7 @@ def _transform_declaration(
             # so that the typedef for `ULString` can become `Pointer[C_String]`.
             #
             name = type_name.removeprefix('struct ')
+            tables.classes[name] = {}
             result = f'class {name}: ...\n'
 
         elif type_name.startswith('constant '):
@@ -319,9 +409,11 @@ def _transform_declaration(
 
     elif isinstance(type_obj, cffi.model.FunctionPtrType):
         if type_name.startswith('function '):
-            result = _transform_function_type(typedef_map, type_name, type_obj)
+            result = _transform_function_type(typedef_map, tables, type_name, type_obj)
         elif type_name.startswith('typedef '):
-            result = _transform_function_ptr_typedef(typedef_map, type_name, type_obj)
+            result = _transform_function_ptr_typedef(
+                typedef_map, tables, type_name, type_obj
+            )
         else:
             raise NotImplementedError(
                 f'Unsupported function pointer: {type_name} {type(type_obj)} {type_obj}'
@@ -337,6 +429,7 @@ def _transform_declaration(
         if type_name.startswith('typedef '):
             name = type_name.removeprefix('typedef ')
             to_typename = _transform_field_typename(typedef_map, type_obj.totype)
+            tables.type_aliases[name] = f'Pointer[{to_typename}]'
             result = f'{name}: TypeAlias = Pointer[{to_typename}]'
         else:
             raise NotImplementedError(
@@ -345,7 +438,7 @@ def _transform_declaration(
 
     elif isinstance(type_obj, cffi.model.EnumType):
         if type_name.startswith('typedef '):
-            result = _transform_enum_typedef(typedef_map, type_name, type_obj)
+            result = _transform_enum_typedef(typedef_map, tables, type_name, type_obj)
         elif type_name.startswith('anonymous '):
             alias = _find_typedef_alias(typedef_map, type_obj)
             result = ''  # f'# anonymous enum: {type_name}; alias: {alias}\n'
@@ -367,8 +460,11 @@ def _transform_declaration(
 
 
 def _transform_declarations(
-    declarations: dict[str, tuple[cffi.model.BaseTypeByIdentity, Any]]
+    declarations: dict[str, tuple[cffi.model.BaseTypeByIdentity, Any]],
+    tables: _LazyTables,
 ) -> str:
+    """Generates the annotated ``_stubs.pyi`` text, while filling in ``tables`` for
+    the lazy runtime module (see :func:`_render_lazy_module`)."""
     typedef_map = _get_typedef_map(declarations)
 
     result = dedent(
@@ -383,16 +479,65 @@ def _transform_declarations(
         from typing import Any
         from typing import TypeAlias
         from ._base import Pointer
-        from . import _base
+        from . import _lazy
+
+        _symbols: _lazy.LazySymbols
+
         '''
     )
     for type_name, (type_obj, _) in declarations.items():
         if type_name not in _SKIP_DECL_NAMES:
-            result += _transform_declaration(typedef_map, type_name, type_obj)
+            result += _transform_declaration(typedef_map, tables, type_name, type_obj)
             result += '\n'
     return result
 
 
+def _render_lazy_module(tables: _LazyTables) -> str:
+    """Generates the runtime ``_stubs.py`` text, which materializes each symbol on
+    first access via a PEP 562 module ``__getattr__``."""
+
+    def render_table(value: object) -> str:
+        # (Black takes care of the line wrapping afterwards.)
+        return pprint.pformat(value, sort_dicts=False, width=10_000)
+
+    return (
+        dedent(
+            '''\
+        """
+        WARNING: This file is generated automatically by ``scripts/_build.py``.
+        Do not edit this file by hand!
+
+        The symbols are materialized lazily on first access; see ``_lazy.LazySymbols``.
+        The annotated declarations live in ``_stubs.pyi``.
+        """
+
+        from typing import Any
+        from . import _lazy
+
+        '''
+        )
+        + (
+            f'_FUNCTIONS = frozenset({render_table(tables.functions)})\n\n'
+            f'_ENUMS = {render_table(tables.enums)}\n\n'
+            f'_ENUM_MEMBERS = {render_table(tables.enum_members)}\n\n'
+            f'_CLASSES = {render_table(tables.classes)}\n\n'
+            f'_TYPE_ALIASES = {render_table(tables.type_aliases)}\n\n'
+            '_symbols = _lazy.LazySymbols(\n'
+            '    globals(),\n'
+            '    functions=_FUNCTIONS,\n'
+            '    enums=_ENUMS,\n'
+            '    enum_members=_ENUM_MEMBERS,\n'
+            '    classes=_CLASSES,\n'
+            '    type_aliases=_TYPE_ALIASES,\n'
+            ')\n\n\n'
+            'def __getattr__(name: str) -> Any:\n'
+            '    return _symbols.resolve(name)\n\n\n'
+            'def __dir__() -> list[str]:\n'
+            '    return sorted({*globals(), *_symbols.names()})\n'
+        )
+    )
+
+
 def create_ffibuilder() -> cffi.FFI:
     # _logger.setLevel(logging.DEBUG)
     # logging.basicConfig(level=logging.DEBUG)
@@ -402,10 +547,88 @@ def create_ffibuilder() -> cffi.FFI:
     ffibuilder.set_source('ultralight_cffi._bindings', None)  # type: ignore[arg-type]
 
     parser: cffi.cparser.Parser = ffibuilder._parser  # type: ignore[attr-defined,name-defined]
-    text = _transform_declarations(parser._declarations)
-    pathlib.Path('ultralight_cffi').joinpath('_stubs.py').write_text(text)
+    tables = _LazyTables()
+    pyi_text = _transform_declarations(parser._declarations, tables)
+    pathlib.Path('ultralight_cffi').joinpath('_stubs.pyi').write_text(pyi_text)
+    py_text = _render_lazy_module(tables)
+    pathlib.Path('ultralight_cffi').joinpath('_stubs.py').write_text(py_text)
     return ffibuilder
 
 
-if __name__ == '__main__':
+def _get_api_cdef() -> str:
+    """Returns the Ultralight portion of ``_bindings.h``, suitable for both the API-mode
+    ``cdef`` and the C source of the compiled extension."""
+    text = _SRC_DIR.joinpath('_bindings.h').read_text()
+    _, sep, text = text.partition(_API_CDEF_START)
+    assert sep, f'Unable to find start of Ultralight declarations: {_API_CDEF_START}'
+    text = sep + text
+    for decl in _API_SKIP_DECLS:
+        assert decl in text, f'Unable to find declaration to skip: {decl}'
+        text = text.replace(decl, '')
+    return text
+
+
+def _get_api_link_args() -> list[str]:
+    """Determines the linker arguments for leaving the Ultralight symbols unresolved
+    until runtime, based on the platform."""
+    sys = platform.system()
+    match sys:
+        case 'Darwin':
+            args = ['-undefined', 'dynamic_lookup']
+        case 'Linux':
+            args = []  # (undefined symbols are permitted in shared objects by default)
+        case _:
+            raise RuntimeError(f'API-mode bindings are not supported on: {sys}')
+    return args
+
+
+def create_api_ffibuilder() -> cffi.FFI:
+    """Creates the FFI builder for the optional, compiled (API-mode) extension.
+
+    Unlike the ABI-mode ``_bindings.py``, this requires a C compiler, so it's strictly
+    opt-in; :func:`ultralight_cffi.load` falls back to the ABI-mode bindings whenever
+    the extension isn't available.
+
+    The extension is deliberately *not* linked against the Ultralight shared libraries:
+    the Ultralight symbols are left undefined and get resolved lazily, once
+    :func:`ultralight_cffi.load` has loaded the libraries into the global symbol
+    namespace.  This keeps the build independent of the SDK location (and of the SDK
+    being present at all), and lets the package be imported before the libraries are
+    loaded, as usual.
+    """
+    api_cdef = _get_api_cdef()
+
+    ffibuilder = cffi.FFI()
+    ffibuilder.cdef(
+        api_cdef
+        + _API_SURFACE_DATA_DECL
+        + _API_EXTERN_PYTHON_CDEF
+        + _API_SURFACE_GETTERS_CDEF
+    )
+    ffibuilder.set_source(
+        _API_MODULE_NAME,
+        '#include <stddef.h>\n#include <stdint.h>\n\n'
+        + api_cdef
+        + _API_SURFACE_DATA_DECL
+        + _API_SURFACE_GETTERS_SOURCE,
+        extra_link_args=_get_api_link_args(),
+    )
+    return ffibuilder
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(description='Runs the CFFI builder(s).')
+    parser.add_argument(
+        '--api',
+        action='store_true',
+        help='Also compile the optional API-mode `_bindings_api` extension.',
+    )
+    args = parser.parse_args()
+
     create_ffibuilder().compile(verbose=True)
+    if args.api:
+        create_api_ffibuilder().compile(tmpdir=str(_ROOT_DIR), verbose=True)
+
+
+if __name__ == '__main__':
+    _main()
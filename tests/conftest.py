@@ -1,6 +1,8 @@
 import pytest
 import ultralight_cffi
 from . import SDK_PATH
+from ultralight_cffi import _base
+from ultralight_cffi import _fake
 
 
 @pytest.fixture()
@@ -16,3 +18,23 @@ def sdk_init(lib):
     lib.ulEnablePlatformFileSystem(sdk_path_str)
     lib.ulDestroyString(sdk_path_str)
     lib.ulEnablePlatformFontLoader()
+
+
+@pytest.fixture()
+def fake_lib(monkeypatch):
+    """Loads a fresh instance of the pure-Python fake library (see
+    :mod:`ultralight_cffi._fake`), and restores the previously loaded library
+    afterwards."""
+    monkeypatch.setattr(_base, '_lib', _base._lib)
+    monkeypatch.setattr(_fake, '_instance', None)
+    return ultralight_cffi.load(backend='fake')
+
+
+@pytest.fixture()
+def renderer(fake_lib):
+    """Creates a renderer with the fake library."""
+    config = ultralight_cffi.ulCreateConfig()
+    renderer = ultralight_cffi.ulCreateRenderer(config)
+    ultralight_cffi.ulDestroyConfig(config)
+    yield renderer
+    ultralight_cffi.ulDestroyRenderer(renderer)
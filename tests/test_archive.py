@@ -0,0 +1,90 @@
+import io
+import pytest
+import tarfile
+import ultralight_cffi
+import zipfile
+from ultralight_cffi import _archive
+
+_FILES = {
+    'index.html': b'<title>Theme</title>',
+    'css/style.css': b'h1 { color: red; }' * 100,
+    'img/logo.png': b'\x89PNG' + bytes(range(256)),
+}
+
+
+@pytest.fixture()
+def zip_path(tmp_path):
+    path = tmp_path / 'theme.zip'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('index.html', _FILES['index.html'], zipfile.ZIP_STORED)
+        archive.writestr('css/', b'')
+        archive.writestr('css/style.css', _FILES['css/style.css'], zipfile.ZIP_DEFLATED)
+        archive.writestr('img/logo.png', _FILES['img/logo.png'], zipfile.ZIP_DEFLATED)
+    return path
+
+
+def test_archive_file_system__zip(zip_path):
+    with ultralight_cffi.ArchiveFileSystem(zip_path, cache_size=2000) as file_system:
+        assert sorted(file_system.index) == sorted(_FILES)
+        assert file_system.index['css/style.css'].compression == zipfile.ZIP_DEFLATED
+        assert file_system.file_exists('/css/style.css')
+        assert not file_system.file_exists('css')
+
+        for path, data in _FILES.items():
+            assert bytes(file_system.open_file(path)) == data
+        assert isinstance(file_system.open_file('index.html'), memoryview)
+        assert file_system.open_file('missing.html') is None
+
+        # (The stylesheet doesn't fit alongside the logo, so it was evicted.)
+        assert list(file_system._cache) == ['img/logo.png']
+        assert file_system.open_file('img/logo.png') is file_system.open_file(
+            'img/logo.png'
+        )
+
+
+def test_archive_file_system__tar(tmp_path):
+    path = tmp_path / 'theme.tar'
+    with tarfile.open(path, 'w') as archive:
+        for name, data in _FILES.items():
+            info = tarfile.TarInfo(f'./{name}')
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+    with ultralight_cffi.ArchiveFileSystem(path) as file_system:
+        assert sorted(file_system.index) == sorted(_FILES)
+        for name, data in _FILES.items():
+            assert bytes(file_system.open_file(name)) == data
+
+
+def test_archive_file_system__persist_index(zip_path, mocker):
+    with ultralight_cffi.ArchiveFileSystem(zip_path, persist_index=True) as file_system:
+        index = file_system.index
+    assert file_system.index_path.exists()
+
+    build_index = mocker.spy(_archive.ArchiveFileSystem, '_build_index')
+    with ultralight_cffi.ArchiveFileSystem(zip_path, persist_index=True) as file_system:
+        assert file_system.index == index
+    build_index.assert_not_called()
+
+    # (Stale indexes are rebuilt.)
+    with zipfile.ZipFile(zip_path, 'a') as archive:
+        archive.writestr('new.js', b'')
+    with ultralight_cffi.ArchiveFileSystem(zip_path, persist_index=True) as file_system:
+        assert 'new.js' in file_system.index
+    build_index.assert_called_once()
+
+
+def test_archive_file_system__persist_index__read_only(zip_path, mocker, caplog):
+    mocker.patch('os.replace', side_effect=PermissionError('read-only'))
+    with ultralight_cffi.ArchiveFileSystem(zip_path, persist_index=True) as file_system:
+        assert bytes(file_system.open_file('index.html')) == _FILES['index.html']
+    assert not file_system.index_path.exists()
+    assert list(zip_path.parent.glob('*.tmp')) == []
+    assert 'Failed to save index' in caplog.text
+
+
+def test_archive_file_system__invalid(tmp_path):
+    path = tmp_path / 'theme.zip'
+    path.write_bytes(b'not an archive')
+    with pytest.raises(ValueError):
+        ultralight_cffi.ArchiveFileSystem(path)
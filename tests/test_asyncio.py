@@ -0,0 +1,83 @@
+import asyncio
+import gc
+import pytest
+import ultralight_cffi
+import weakref
+
+
+async def test_load_html(renderer):
+    async with ultralight_cffi.RendererDriver(renderer) as driver:
+        view = driver.create_view(8, 4, transparent=True)
+        try:
+            await asyncio.wait_for(view.load_html('<h1>Hi</h1>'), 1)
+            assert not ultralight_cffi.ulViewIsLoading(view.view)
+            assert ultralight_cffi.ulViewIsTransparent(view.view)
+        finally:
+            view.destroy()
+
+
+async def test_load_url__error(renderer, tmp_path):
+    async with ultralight_cffi.RendererDriver(renderer) as driver:
+        view = driver.create_view(8, 4)
+        try:
+            url = (tmp_path / 'missing.html').as_uri()
+            with pytest.raises(ultralight_cffi.LoadError) as exc_info:
+                await asyncio.wait_for(view.load_url(url), 1)
+            assert exc_info.value.url == url
+            assert exc_info.value.error_code != 0
+
+            (tmp_path / 'index.html').write_text('<h1>Hi</h1>')
+            await asyncio.wait_for(view.load_url((tmp_path / 'index.html').as_uri()), 1)
+        finally:
+            view.destroy()
+
+
+async def test_load__superseded(renderer):
+    async with ultralight_cffi.RendererDriver(renderer) as driver:
+        view = driver.create_view(8, 4)
+        try:
+            first = asyncio.ensure_future(view.load_html('first'))
+            second = asyncio.ensure_future(view.load_html('second'))
+            await asyncio.wait_for(second, 1)
+            with pytest.raises(asyncio.CancelledError):
+                await first
+        finally:
+            view.destroy()
+
+
+async def test_driver__pacing(renderer):
+    """Tests that the driver backs off while idle, and wakes immediately for loads."""
+    driver = ultralight_cffi.RendererDriver(
+        renderer, min_interval=0.001, max_interval=0.05
+    )
+    async with driver:
+        await asyncio.sleep(0.2)
+        idle_count = driver.update_count
+        assert idle_count < 20  # (vs. ~200 without backoff)
+
+        view = driver.create_view(8, 4)
+        try:
+            await asyncio.wait_for(view.load_html('<h1>Hi</h1>'), 0.02)
+        finally:
+            view.destroy()
+    assert driver.update_count > idle_count
+
+
+async def test_async_view__garbage_collected(fake_lib, renderer):
+    async with ultralight_cffi.RendererDriver(renderer) as driver:
+        view_config = fake_lib.ulCreateViewConfig()
+        view = fake_lib.ulCreateView(renderer, 8, 4, view_config, ultralight_cffi.NULL)
+        fake_lib.ulDestroyViewConfig(view_config)
+        try:
+            async_view = ultralight_cffi.AsyncView(driver, view)
+            handle = weakref.ref(async_view._handle)
+            del async_view
+            gc.collect()
+            # (The view only has the handle's address, which must stay valid.)
+            assert handle() is not None
+            # (The callbacks ignore loads for views that no longer exist.)
+            with ultralight_cffi.temp_string('<h1>Hi</h1>') as html:
+                fake_lib.ulViewLoadHTML(view, html)
+            fake_lib.ulUpdate(renderer)
+        finally:
+            fake_lib.ulDestroyView(view)
@@ -1,7 +1,11 @@
 import mock
+import os
 import pathlib
+import pytest
+import ultralight_cffi
 from . import BIN_PATH
 from ultralight_cffi import _base
+from ultralight_cffi import _stubs
 
 
 def test_load__patched(mocker):
@@ -13,6 +17,7 @@ def test_load__patched(mocker):
             side_effect=lambda name: mock.Mock(_name=name),
         ),
     )
+    mocker.patch.object(_base, '_api_bindings', None)
     lib = _base.load()
 
     # Scenario - library_path default:
@@ -45,3 +50,65 @@ def test_load__patched(mocker):
 def test_load():
     lib = _base.load(BIN_PATH)
     assert isinstance(lib, _base.Lib)
+
+
+def test_load__direct_bind(mocker):
+    """Tests that :meth:`ultralight.load` with ``direct_bind`` rebinds the annotated
+    wrappers to the raw FFI functions, and that a subsequent plain ``load`` restores
+    them."""
+    mocker.patch.object(
+        _base,
+        'ffi',
+        dlopen=mock.Mock(
+            side_effect=lambda name: mock.Mock(_name=name),
+        ),
+    )
+    mocker.patch.object(_base, '_api_bindings', None)
+    wrapper = _stubs.ulUpdate
+    assert ultralight_cffi.ulUpdate is wrapper
+
+    try:
+        lib = _base.load(direct_bind=True)
+        assert _stubs.ulUpdate is lib.ulUpdate
+        assert ultralight_cffi.ulUpdate is lib.ulUpdate
+        assert ultralight_cffi.ulCreateStringUTF8 is lib.ulCreateStringUTF8
+    finally:
+        _base.load()
+
+    assert _stubs.ulUpdate is wrapper
+    assert ultralight_cffi.ulUpdate is wrapper
+
+
+def test_load__api_unavailable(mocker):
+    mocker.patch.object(_base, '_api_bindings', None)
+    with pytest.raises(RuntimeError, match='API-mode bindings are not available'):
+        _base.load(backend='api')
+
+
+def test_load__api(mocker):
+    """Tests that :meth:`ultralight.load` switches to the API-mode bindings if all the
+    symbols are present, and falls back to ABI mode otherwise."""
+    mocker.patch.object(
+        _base,
+        'ffi',
+        dlopen=mock.Mock(
+            side_effect=lambda name, flags=None: mock.Mock(_name=name),
+        ),
+    )
+    api_bindings = mock.Mock()
+    mocker.patch.object(_base, '_api_bindings', api_bindings)
+
+    # Scenario - all symbols present:
+    assert _base.load() is api_bindings.lib
+    assert _base.ffi.dlopen.call_args.args[1] == os.RTLD_NOW | os.RTLD_GLOBAL
+    assert _base.load(backend='api') is api_bindings.lib
+
+    # Scenario - ABI mode requested explicitly:
+    assert _base.load(backend='abi') is not api_bindings.lib
+    assert len(_base.ffi.dlopen.call_args.args) == 1
+
+    # Scenario - missing symbols:
+    mocker.patch.object(_base, '_get_missing_symbols', return_value=['ulUpdate'])
+    assert _base.load() is not api_bindings.lib
+    with pytest.raises(RuntimeError, match='missing symbols: ulUpdate'):
+        _base.load(backend='api')
@@ -0,0 +1,56 @@
+import pytest
+import ultralight_cffi
+from ultralight_cffi import _bitmap
+from ultralight_cffi import _fake
+
+
+def _get_lock_count(lib, bitmap):
+    return lib._get(bitmap, _fake._Bitmap).lock_count
+
+
+def test_bitmap_pixels(fake_lib):
+    bitmap = fake_lib.ulCreateBitmap(3, 2, fake_lib.kBitmapFormat_BGRA8_UNORM_SRGB)
+    try:
+        with ultralight_cffi.bitmap_pixels(bitmap) as pixels:
+            assert _get_lock_count(fake_lib, bitmap) == 1
+            assert pixels.shape == (2, 3, 4)
+            assert pixels.dtype == 'uint8'
+            pixels[1, 2] = [1, 2, 3, 4]
+        assert _get_lock_count(fake_lib, bitmap) == 0
+        with pytest.raises(ValueError, match='read-only'):
+            pixels[0, 0] = 0
+
+        raw = ultralight_cffi.ffi.buffer(fake_lib.ulBitmapRawPixels(bitmap), 24)
+        assert raw[20:24] == b'\x01\x02\x03\x04'
+    finally:
+        fake_lib.ulDestroyBitmap(bitmap)
+
+
+def test_bitmap_pixels__stride(fake_lib):
+    """Tests that row padding (``row_bytes > width * bpp``) is skipped."""
+    data = bytes(range(2 * 16))
+    bitmap = fake_lib.ulCreateBitmapFromPixels(
+        3, 2, fake_lib.kBitmapFormat_BGRA8_UNORM_SRGB, 16, data, len(data), True
+    )
+    try:
+        with ultralight_cffi.bitmap_pixels(bitmap) as pixels:
+            assert pixels.shape == (2, 3, 4)
+            assert pixels[1, 0].tolist() == [16, 17, 18, 19]
+            assert pixels[1].tobytes() == data[16:28]
+    finally:
+        fake_lib.ulDestroyBitmap(bitmap)
+
+
+def test_bitmap_pixels__no_numpy(fake_lib, mocker):
+    mocker.patch.object(_bitmap, 'get_numpy', return_value=None)
+    bitmap = fake_lib.ulCreateBitmap(3, 2, fake_lib.kBitmapFormat_BGRA8_UNORM_SRGB)
+    try:
+        with ultralight_cffi.bitmap_pixels(bitmap) as pixels:
+            assert isinstance(pixels, memoryview)
+            assert pixels.shape == (2, 12)
+            pixels[1, 11] = 0xFF
+        assert _get_lock_count(fake_lib, bitmap) == 0
+        with pytest.raises(ValueError, match='released'):
+            pixels[0, 0]
+    finally:
+        fake_lib.ulDestroyBitmap(bitmap)
@@ -0,0 +1,63 @@
+import asyncio
+import gc
+import ultralight_cffi
+import weakref
+from ultralight_cffi import _console
+from ultralight_cffi import _fake
+from ultralight_cffi import ffi
+
+_HTML = (
+    '<script>\n'
+    "console.log('Hello');\n"
+    '  console.debug("Details");\n'
+    "console.error('Oops ☃');\n"
+    "console.warn('Hmm');\n"
+    '</script>'
+)
+
+
+async def test_console_collector(renderer, mocker):
+    get_string_bytes = mocker.spy(_console, 'get_string_bytes')
+    async with ultralight_cffi.RendererDriver(renderer) as driver:
+        view = driver.create_view(8, 4)
+        try:
+            with ultralight_cffi.ConsoleCollector(
+                view.view, capacity=2, min_level=ultralight_cffi.kMessageLevel_Log
+            ) as console:
+                await asyncio.wait_for(view.load_html(_HTML), 1)
+            await asyncio.wait_for(view.load_html(_HTML), 1)  # (Detached.)
+        finally:
+            view.destroy()
+
+    assert (console.num_received, console.num_filtered) == (4, 1)
+    # (Only the unfiltered messages' strings are copied.)
+    assert get_string_bytes.call_count == 3 * 2
+    error, warning = console  # (The oldest message is evicted.)
+    assert error.source == ultralight_cffi.kMessageSource_ConsoleAPI
+    assert error.level == ultralight_cffi.kMessageLevel_Error
+    assert error.message_bytes == 'Oops ☃'.encode()
+    assert error.message == 'Oops ☃'
+    assert (error.line, error.column, error.source_id) == (4, 1, '')
+    assert warning.message == 'Hmm'
+    assert console.drain() == [error, warning]
+    assert len(console) == 0
+
+
+async def test_console_collector__garbage_collected(fake_lib, renderer):
+    async with ultralight_cffi.RendererDriver(renderer) as driver:
+        view = driver.create_view(8, 4)
+        try:
+            console = ultralight_cffi.ConsoleCollector(view.view)
+            handle = weakref.ref(console._handle)
+            del console
+            gc.collect()
+            # (The view only has the handle's address, which must stay valid.)
+            assert handle() is not None
+            _, user_data = fake_lib._get(view.view, _fake._View).callbacks[
+                'AddConsoleMessage'
+            ]
+            assert ffi.from_handle(user_data)() is None
+            # (The callback ignores messages for collectors that no longer exist.)
+            await asyncio.wait_for(view.load_html(_HTML), 1)
+        finally:
+            view.destroy()
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+from ultralight_cffi import _convert
+
+_WIDTH = 3
+_HEIGHT = 2
+_ROW_BYTES = 16  # (4 bytes of padding per row)
+
+
+@pytest.fixture(params=['numpy', 'python'], autouse=True)
+def backend(request, mocker):
+    if request.param == 'python':
+        mocker.patch.object(_convert, 'get_numpy', return_value=None)
+    return request.param
+
+
+@pytest.fixture()
+def pixels():
+    """Padded BGRA pixels, with all-distinct values (padding = 0xEE)."""
+    data = bytearray(b'\xee' * (_ROW_BYTES * _HEIGHT))
+    for y in range(_HEIGHT):
+        for x in range(_WIDTH):
+            i = y * _ROW_BYTES + x * 4
+            base = (y * _WIDTH + x) * 4
+            data[i : i + 4] = bytes([base + 1, base + 2, base + 3, 0x80 + base])
+    return data
+
+
+def _unpad(data, row_bytes, width_bytes):
+    return b''.join(
+        bytes(data[y * row_bytes : y * row_bytes + width_bytes]) for y in range(_HEIGHT)
+    )
+
+
+def test_bgra_to_rgba(pixels):
+    result = _convert.bgra_to_rgba(bytes(pixels), _WIDTH, _HEIGHT, _ROW_BYTES)
+    expected = _unpad(pixels, _ROW_BYTES, _WIDTH * 4)
+    assert isinstance(result, bytearray)
+    assert bytes(result[0:4]) == bytes([3, 2, 1, 0x80])
+    assert bytes(_convert.rgba_to_bgra(result, _WIDTH, _HEIGHT)) == expected
+
+
+def test_bgra_to_rgba__in_place(pixels):
+    original = bytes(pixels)
+    result = _convert.bgra_to_rgba(pixels, _WIDTH, _HEIGHT, _ROW_BYTES, out=pixels)
+    assert result is pixels
+    assert pixels[0:4] == bytes([3, 2, 1, 0x80])
+    assert pixels[12:16] == b'\xee' * 4, 'padding should be untouched'
+    _convert.bgra_to_rgba(pixels, _WIDTH, _HEIGHT, _ROW_BYTES, out=pixels)
+    assert pixels == original
+
+
+def test_bgra_to_rgba__errors(pixels):
+    with pytest.raises(ValueError, match='read-only'):
+        _convert.bgra_to_rgba(pixels, _WIDTH, _HEIGHT, out=bytes(24))
+    with pytest.raises(ValueError, match='Input buffer too small'):
+        _convert.bgra_to_rgba(pixels[:20], _WIDTH, _HEIGHT, _ROW_BYTES)
+    with pytest.raises(ValueError, match='Output buffer too small'):
+        _convert.bgra_to_rgba(pixels, _WIDTH, _HEIGHT, _ROW_BYTES, out=bytearray(20))
+
+
+def test_copy_pixels(pixels):
+    result = _convert.copy_pixels(pixels, _WIDTH, _HEIGHT, _ROW_BYTES)
+    assert bytes(result) == _unpad(pixels, _ROW_BYTES, _WIDTH * 4)
+
+    # Into the bottom-right corner of a larger image:
+    out = bytearray(b'\x00' * 4 * 4 * 3)
+    view = memoryview(out)[4 * 4 + 4 :]
+    _convert.copy_pixels(
+        pixels, _WIDTH, _HEIGHT, _ROW_BYTES, out=view, out_row_bytes=16
+    )
+    assert out[:20] == b'\x00' * 20
+    assert out[20:32] == pixels[:12]
+    assert out[36:48] == pixels[16:28]
+
+
+def test_drop_alpha(pixels):
+    bgr = _convert.drop_alpha(pixels, _WIDTH, _HEIGHT, _ROW_BYTES)
+    rgb = _convert.bgra_to_rgb(pixels, _WIDTH, _HEIGHT, _ROW_BYTES)
+    assert len(bgr) == len(rgb) == _WIDTH * _HEIGHT * 3
+    assert bytes(bgr[0:6]) == bytes([1, 2, 3, 5, 6, 7])
+    assert bytes(rgb[0:6]) == bytes([3, 2, 1, 7, 6, 5])
+    with pytest.raises(ValueError, match='in place'):
+        _convert.drop_alpha(pixels, _WIDTH, _HEIGHT, _ROW_BYTES, out=pixels)
+
+
+def test_premultiply_alpha(pixels, backend):
+    array = np.frombuffer(pixels, np.uint8).reshape(_HEIGHT, _ROW_BYTES // 4, 4)
+    array = array[:, :_WIDTH].astype(np.uint32)
+    expected = (array[..., :3] * array[..., 3:] + 127) // 255
+
+    result = _convert.premultiply_alpha(pixels, _WIDTH, _HEIGHT, _ROW_BYTES)
+    result_array = np.frombuffer(result, np.uint8).reshape(_HEIGHT, _WIDTH, 4)
+    assert (result_array[..., :3] == expected).all()
+    assert (result_array[..., 3] == array[..., 3]).all()
+
+    # Round trip (lossy, but only by rounding):
+    straight = _convert.unpremultiply_alpha(result, _WIDTH, _HEIGHT)
+    straight_array = np.frombuffer(straight, np.uint8).reshape(_HEIGHT, _WIDTH, 4)
+    assert np.abs(straight_array.astype(int) - array).max() <= 1
+
+
+def test_premultiply_alpha__opaque_and_transparent():
+    pixels = bytearray(b'\x10\x20\x30\xff' * 4 + b'\x10\x20\x30\x00' * 4)
+    result = _convert.premultiply_alpha(pixels, 4, 2, out=pixels)
+    assert result[:16] == b'\x10\x20\x30\xff' * 4
+    assert result[16:] == b'\x00\x00\x00\x00' * 4
+    assert _convert.unpremultiply_alpha(result, 4, 2)[16:] == bytes(16)
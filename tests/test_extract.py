@@ -0,0 +1,114 @@
+import pytest
+import ultralight_cffi
+from ultralight_cffi import DirtyRect
+from ultralight_cffi import ffi
+
+
+@pytest.fixture()
+def view(fake_lib, renderer):
+    fake_lib.ulPlatformSetSurfaceDefinition(
+        ultralight_cffi.MemorySurface.get_definition()[0]
+    )
+    view_config = fake_lib.ulCreateViewConfig()
+    view = fake_lib.ulCreateView(renderer, 3, 2, view_config, ultralight_cffi.NULL)
+    fake_lib.ulDestroyViewConfig(view_config)
+    yield view
+    fake_lib.ulDestroyView(view)
+
+
+def _set_pixel(fake_lib, surface, x, y, bgra):
+    row_bytes = fake_lib.ulSurfaceGetRowBytes(surface)
+    pixels = ffi.buffer(fake_lib.ulSurfaceLockPixels(surface), row_bytes * 2)
+    pixels[y * row_bytes + x * 4 : y * row_bytes + x * 4 + 4] = bgra
+    fake_lib.ulSurfaceUnlockPixels(surface)
+
+
+def test_frame_extractor(fake_lib, renderer, view):
+    surface = fake_lib.ulViewGetSurface(view)
+    extractor = ultralight_cffi.FrameExtractor('rgba')
+    fake_lib.ulRender(renderer)
+    assert extractor.extract(surface) == DirtyRect(0, 0, 3, 2)
+    assert extractor.image == b'\xff' * 24
+    assert extractor.row_bytes == 12
+    assert fake_lib.ulSurfaceGetDirtyBounds(surface).right == 0
+
+    # Nothing changed:
+    rect = extractor.extract(surface)
+    assert rect.is_empty()
+    assert extractor.num_pixels_copied == 6
+
+    # Only the dirty rectangle is copied:
+    _set_pixel(fake_lib, surface, 1, 1, b'\x01\x02\x03\x04')
+    _set_pixel(fake_lib, surface, 0, 0, b'\x05\x06\x07\x08')
+    bounds = ffi.new('ULIntRect*', (1, 1, 2, 5))[0]
+    fake_lib.ulSurfaceSetDirtyBounds(surface, bounds)
+    assert extractor.extract(surface) == DirtyRect(1, 1, 2, 2)
+    assert extractor.image[16:20] == b'\x03\x02\x01\x04'
+    assert extractor.image[:4] == b'\xff' * 4
+    assert extractor.num_pixels_copied == 7
+
+    # Resizing copies everything:
+    fake_lib.ulViewResize(view, 4, 2)
+    assert extractor.extract(surface) == DirtyRect(0, 0, 4, 2)
+    assert len(extractor.image) == 32
+
+
+@pytest.mark.parametrize(
+    ('mode', 'expected'),
+    [
+        ('bgra', b'\x01\x02\x03\x04'),
+        ('rgba', b'\x03\x02\x01\x04'),
+        ('bgr', b'\x01\x02\x03'),
+        ('rgb', b'\x03\x02\x01'),
+    ],
+)
+def test_frame_extractor__modes(fake_lib, renderer, view, mode, expected):
+    surface = fake_lib.ulViewGetSurface(view)
+    extractor = ultralight_cffi.FrameExtractor(mode)
+    fake_lib.ulRender(renderer)
+    _set_pixel(fake_lib, surface, 2, 1, b'\x01\x02\x03\x04')
+    extractor.extract(surface)
+    assert extractor.channels == len(expected)
+    assert extractor.image[-len(expected) :] == expected
+    assert extractor.image[: -len(expected)] == b'\xff' * 5 * len(expected)
+
+
+def test_frame_extractor__errors():
+    with pytest.raises(ValueError, match='Unsupported pixel mode'):
+        ultralight_cffi.FrameExtractor('argb')
+
+
+def test_frame_extractor__ring_buffer_surface(fake_lib, renderer):
+    fake_lib.ulPlatformSetSurfaceDefinition(
+        ultralight_cffi.RingBufferSurface.get_definition()[0]
+    )
+    view_config = fake_lib.ulCreateViewConfig()
+    view = fake_lib.ulCreateView(renderer, 3, 2, view_config, ultralight_cffi.NULL)
+    fake_lib.ulDestroyViewConfig(view_config)
+    surface = fake_lib.ulViewGetSurface(view)
+    ring_buffer_surface = ultralight_cffi.RingBufferSurface.from_ffi(fake_lib, surface)
+    extractor = ultralight_cffi.FrameExtractor('bgra')
+    fake_lib.ulRender(renderer)
+    assert extractor.extract(surface) == DirtyRect(0, 0, 3, 2)
+    assert extractor.image == b'\xff' * 24
+
+    _set_pixel(fake_lib, surface, 1, 1, b'\x01\x02\x03\x04')
+    bounds = ffi.new('ULIntRect*', (1, 1, 2, 2))[0]
+    fake_lib.ulSurfaceSetDirtyBounds(surface, bounds)
+    assert extractor.extract(surface) == DirtyRect(1, 1, 2, 2)
+    assert extractor.image[16:20] == b'\x01\x02\x03\x04'
+    # (Only the renderer's paints are published, not the extractions.)
+    assert ring_buffer_surface.generation == 2
+
+    # Nothing's copied until the resized surface is painted, and then all of it is:
+    fake_lib.ulSurfaceResize(surface, 4, 2)
+    assert extractor.extract(surface).is_empty()
+    assert extractor.num_pixels_copied == 7
+    assert extractor.extract(surface).is_empty()
+    _set_pixel(fake_lib, surface, 3, 1, b'\x01\x02\x03\x04')
+    bounds = ffi.new('ULIntRect*', (3, 1, 4, 2))[0]
+    fake_lib.ulSurfaceSetDirtyBounds(surface, bounds)
+    assert extractor.extract(surface) == DirtyRect(0, 0, 4, 2)
+    assert extractor.num_pixels_copied == 15
+    assert extractor.image[-4:] == b'\x01\x02\x03\x04'
+    fake_lib.ulDestroyView(view)
@@ -0,0 +1,267 @@
+import pytest
+import ultralight_cffi
+from .test__integration import MemorySurface
+from ultralight_cffi import _base
+from ultralight_cffi import _fake
+from ultralight_cffi import _surface
+from ultralight_cffi import ffi
+
+
+def test_load(fake_lib):
+    assert isinstance(fake_lib, _fake.FakeLib)
+    assert _base.get_lib() is fake_lib
+    assert ultralight_cffi.ulVersionMajor() == fake_lib.ulVersionMajor()
+    assert ffi.string(ultralight_cffi.ulVersionString()).endswith(b'(fake)')
+
+
+def test_string(fake_lib):
+    text = 'héllo'.encode()
+    string = ultralight_cffi.ulCreateStringUTF8(text, len(text))
+    assert ffi.typeof(string) is ffi.typeof('ULString')
+    assert ultralight_cffi.ulStringGetLength(string) == len(text)
+    data = ultralight_cffi.ulStringGetData(string)
+    assert ffi.unpack(data, len(text)) == text
+
+    copy = ultralight_cffi.ulCreateStringFromCopy(string)
+    ultralight_cffi.ulStringAssignCString(string, b'')
+    assert ultralight_cffi.ulStringIsEmpty(string)
+    assert not ultralight_cffi.ulStringIsEmpty(copy)
+
+    ultralight_cffi.ulDestroyString(copy)
+    ultralight_cffi.ulDestroyString(string)
+    assert not fake_lib.get_live_objects()
+    with pytest.raises(ValueError, match='destroyed ULString'):
+        ultralight_cffi.ulStringGetLength(string)
+    with pytest.raises(ValueError, match='destroyed ULBitmap'):
+        ultralight_cffi.ulBitmapGetWidth(ultralight_cffi.NULL)
+
+
+def test_buffer(fake_lib, mocker):
+    data = ffi.new('char[]', b'abc')
+    on_destroy = mocker.Mock(return_value=None)
+    callback = ffi.callback('void(void*, void*)', on_destroy)
+    buffer = fake_lib.ulCreateBuffer(data, 3, ultralight_cffi.NULL, callback)
+    assert ffi.buffer(fake_lib.ulBufferGetData(buffer), 3)[:] == b'abc'
+    assert not fake_lib.ulBufferOwnsData(buffer)
+    fake_lib.ulDestroyBuffer(buffer)
+    assert on_destroy.call_count == 1
+
+    buffer = fake_lib.ulCreateBufferFromCopy(b'xyz', 3)
+    assert fake_lib.ulBufferOwnsData(buffer)
+    assert ffi.buffer(fake_lib.ulBufferGetData(buffer), 3)[:] == b'xyz'
+    fake_lib.ulDestroyBuffer(buffer)
+
+
+def test_bitmap(fake_lib, tmp_path):
+    bitmap = fake_lib.ulCreateBitmap(3, 2, fake_lib.kBitmapFormat_BGRA8_UNORM_SRGB)
+    assert fake_lib.ulBitmapGetRowBytes(bitmap) == 12
+    assert fake_lib.ulBitmapGetSize(bitmap) == 24
+
+    pixels = ffi.buffer(fake_lib.ulBitmapLockPixels(bitmap), 24)
+    pixels[0:4] = b'\x01\x02\x03\x04'
+    fake_lib.ulBitmapUnlockPixels(bitmap)
+    with pytest.raises(RuntimeError, match='not locked'):
+        fake_lib.ulBitmapUnlockPixels(bitmap)
+
+    fake_lib.ulBitmapSwapRedBlueChannels(bitmap)
+    assert pixels[0:4] == b'\x03\x02\x01\x04'
+
+    copy = fake_lib.ulCreateBitmapFromCopy(bitmap)
+    fake_lib.ulBitmapErase(bitmap)
+    assert pixels[:] == bytes(24)
+    assert ffi.buffer(fake_lib.ulBitmapRawPixels(copy), 4)[:] == b'\x03\x02\x01\x04'
+
+    path = tmp_path / 'out.png'
+    assert fake_lib.ulBitmapWritePNG(copy, str(path).encode())
+    assert path.read_bytes().startswith(b'\x89PNG')
+
+    fake_lib.ulDestroyBitmap(copy)
+    fake_lib.ulDestroyBitmap(bitmap)
+    assert not fake_lib.get_live_objects()
+
+
+def test_view(fake_lib, mocker):
+    on_finish_loading = mocker.Mock()
+    on_change_title = mocker.Mock()
+
+    @ultralight_cffi.callback(
+        'void(void*, ULView, unsigned long long, _Bool, ULString)'
+    )
+    def finish_loading_callback(user_data, caller, frame_id, is_main_frame, url):
+        on_finish_loading(caller, is_main_frame)
+
+    @ultralight_cffi.callback('void(void*, ULView, ULString)')
+    def change_title_callback(user_data, caller, title):
+        data = fake_lib.ulStringGetData(title)
+        on_change_title(ffi.unpack(data, fake_lib.ulStringGetLength(title)))
+
+    config = fake_lib.ulCreateConfig()
+    renderer = fake_lib.ulCreateRenderer(config)
+    fake_lib.ulDestroyConfig(config)
+    view_config = fake_lib.ulCreateViewConfig()
+    fake_lib.ulViewConfigSetIsTransparent(view_config, True)
+    view = fake_lib.ulCreateView(renderer, 8, 4, view_config, ultralight_cffi.NULL)
+    fake_lib.ulDestroyViewConfig(view_config)
+    fake_lib.ulViewSetFinishLoadingCallback(
+        view, finish_loading_callback, ultralight_cffi.NULL
+    )
+    fake_lib.ulViewSetChangeTitleCallback(
+        view, change_title_callback, ultralight_cffi.NULL
+    )
+    assert fake_lib.ulViewIsTransparent(view)
+
+    html = b'<html><head><title>Test</title></head></html>'
+    html_str = fake_lib.ulCreateStringUTF8(html, len(html))
+    fake_lib.ulViewLoadHTML(view, html_str)
+    fake_lib.ulDestroyString(html_str)
+    assert fake_lib.ulViewIsLoading(view)
+    assert on_finish_loading.call_count == 0
+
+    fake_lib.ulUpdate(renderer)
+    assert not fake_lib.ulViewIsLoading(view)
+    on_finish_loading.assert_called_once_with(view, True)
+    on_change_title.assert_called_once_with(b'Test')
+
+    fake_lib.ulRender(renderer)
+    surface = fake_lib.ulViewGetSurface(view)
+    bitmap = fake_lib.ulBitmapSurfaceGetBitmap(surface)
+    assert fake_lib.ulBitmapGetWidth(bitmap) == 8
+    bounds = fake_lib.ulSurfaceGetDirtyBounds(surface)
+    assert (bounds.left, bounds.top, bounds.right, bounds.bottom) == (0, 0, 8, 4)
+    fake_lib.ulSurfaceClearDirtyBounds(surface)
+    assert fake_lib.ulSurfaceGetDirtyBounds(surface).right == 0
+
+    fake_lib.ulDestroyView(view)
+    fake_lib.ulDestroyRenderer(renderer)
+    assert not fake_lib.get_live_objects()
+
+
+def test_custom_surface(fake_lib):
+    fake_lib.ulPlatformSetSurfaceDefinition(MemorySurface.get_definition()[0])
+    config = fake_lib.ulCreateConfig()
+    renderer = fake_lib.ulCreateRenderer(config)
+    fake_lib.ulDestroyConfig(config)
+    view_config = fake_lib.ulCreateViewConfig()
+    view = fake_lib.ulCreateView(renderer, 4, 2, view_config, ultralight_cffi.NULL)
+    fake_lib.ulDestroyViewConfig(view_config)
+
+    fake_lib.ulRender(renderer)
+    surface = MemorySurface.from_ffi(fake_lib, fake_lib.ulViewGetSurface(view))
+    assert (surface.width, surface.height) == (4, 2)
+    assert not surface.locked
+    assert surface.pixels == b'\xff' * 32
+
+    fake_lib.ulDestroyView(view)
+    fake_lib.ulDestroyRenderer(renderer)
+
+
+class ResizableSurface(MemorySurface):
+    def resize(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(width * height * 4)
+
+
+class CachedSurface(ResizableSurface):
+    cache_metrics = True
+
+
+def _get_metrics(fake_lib, surface):
+    return (
+        fake_lib.ulSurfaceGetWidth(surface),
+        fake_lib.ulSurfaceGetHeight(surface),
+        fake_lib.ulSurfaceGetRowBytes(surface),
+        fake_lib.ulSurfaceGetSize(surface),
+    )
+
+
+@pytest.mark.parametrize('surface_cls', [ResizableSurface, CachedSurface])
+def test_custom_surface__metrics(fake_lib, surface_cls):
+    fake_lib.ulPlatformSetSurfaceDefinition(surface_cls.get_definition()[0])
+    config = fake_lib.ulCreateConfig()
+    renderer = fake_lib.ulCreateRenderer(config)
+    fake_lib.ulDestroyConfig(config)
+    view_config = fake_lib.ulCreateViewConfig()
+    view = fake_lib.ulCreateView(renderer, 4, 2, view_config, ultralight_cffi.NULL)
+    fake_lib.ulDestroyViewConfig(view_config)
+    ul_surface = fake_lib.ulViewGetSurface(view)
+    surface = surface_cls.from_ffi(fake_lib, ul_surface)
+    assert _get_metrics(fake_lib, ul_surface) == (4, 2, 16, 32)
+
+    fake_lib.ulSurfaceResize(ul_surface, 3, 5)
+    assert (surface.width, surface.height) == (3, 5)
+    assert _get_metrics(fake_lib, ul_surface) == (3, 5, 12, 60)
+
+    # Changes other than by resizing need `update_metrics` when cached:
+    surface.resize(1, 1)
+    expected = (3, 5, 12, 60) if surface_cls.cache_metrics else (1, 1, 4, 4)
+    assert _get_metrics(fake_lib, ul_surface) == expected
+    surface.update_metrics()
+    assert _get_metrics(fake_lib, ul_surface) == (1, 1, 4, 4)
+
+    fake_lib.ulDestroyView(view)
+    fake_lib.ulDestroyRenderer(renderer)
+    assert not fake_lib.get_live_objects()
+
+
+def test_custom_surface__abi_callbacks(fake_lib, monkeypatch):
+    """Tests that the callbacks follow the selected backend, rather than whether the
+    API-mode bindings are available."""
+    monkeypatch.setattr(_base, '_api_callbacks', False)
+    monkeypatch.setattr(_surface, '_use_surface_data', _surface._use_surface_data)
+    fake_lib.ulPlatformSetSurfaceDefinition(CachedSurface.get_definition()[0])
+    assert not _surface._use_surface_data
+    config = fake_lib.ulCreateConfig()
+    renderer = fake_lib.ulCreateRenderer(config)
+    fake_lib.ulDestroyConfig(config)
+    view_config = fake_lib.ulCreateViewConfig()
+    view = fake_lib.ulCreateView(renderer, 4, 2, view_config, ultralight_cffi.NULL)
+    fake_lib.ulDestroyViewConfig(view_config)
+    ul_surface = fake_lib.ulViewGetSurface(view)
+    surface = CachedSurface.from_ffi(fake_lib, ul_surface)
+    assert surface._surface_data is None
+    fake_lib.ulSurfaceResize(ul_surface, 3, 5)
+    assert _get_metrics(fake_lib, ul_surface) == (3, 5, 12, 60)
+
+    fake_lib.ulDestroyView(view)
+    fake_lib.ulDestroyRenderer(renderer)
+
+
+def test_custom_surface__lock_pixels(fake_lib):
+    fake_lib.ulPlatformSetSurfaceDefinition(ResizableSurface.get_definition()[0])
+    config = fake_lib.ulCreateConfig()
+    renderer = fake_lib.ulCreateRenderer(config)
+    fake_lib.ulDestroyConfig(config)
+    view_config = fake_lib.ulCreateViewConfig()
+    view = fake_lib.ulCreateView(renderer, 4, 2, view_config, ultralight_cffi.NULL)
+    fake_lib.ulDestroyViewConfig(view_config)
+    ul_surface = fake_lib.ulViewGetSurface(view)
+    surface = ResizableSurface.from_ffi(fake_lib, ul_surface)
+
+    def lock_pixels():
+        pixels = fake_lib.ulSurfaceLockPixels(ul_surface)
+        fake_lib.ulSurfaceUnlockPixels(ul_surface)
+        return pixels
+
+    # The pointer is cached for as long as the buffer stays the same:
+    pixels = lock_pixels()
+    cached = surface._locked_pixels
+    assert lock_pixels() == pixels
+    assert surface._locked_pixels is cached
+    ffi.buffer(pixels, 4)[:] = b'\x01\x02\x03\x04'
+    assert surface.pixels[:4] == b'\x01\x02\x03\x04'
+
+    fake_lib.ulSurfaceResize(ul_surface, 8, 8)
+    pixels = lock_pixels()
+    assert ffi.buffer(pixels, 4)[:] == b'\x00' * 4
+    assert surface._locked_pixels is not cached
+
+    surface.pixels = bytearray(b'\xff' * 256)
+    assert ffi.buffer(lock_pixels(), 4)[:] == b'\xff' * 4
+    cached = surface._locked_pixels
+    surface.invalidate_buffer()
+    lock_pixels()
+    assert surface._locked_pixels is not cached
+
+    fake_lib.ulDestroyView(view)
+    fake_lib.ulDestroyRenderer(renderer)
@@ -0,0 +1,83 @@
+import os
+import pytest
+import signal
+import ultralight_cffi
+from ultralight_cffi import _farm
+
+
+@pytest.fixture()
+def farm():
+    with ultralight_cffi.RenderFarm(
+        max_workers=1, jobs_per_worker=2, backend='fake'
+    ) as farm:
+        yield farm
+
+
+def test_render_job():
+    with pytest.raises(ValueError):
+        ultralight_cffi.RenderJob(8, 4)
+    with pytest.raises(ValueError):
+        ultralight_cffi.RenderJob(8, 4, html='<p>Hi</p>', url='about:blank')
+
+
+def test_render_farm(farm):
+    jobs = [ultralight_cffi.RenderJob(8, 4, html='<p>Hi</p>') for _ in range(3)]
+    results = list(farm.map(jobs))
+
+    for result in results:
+        assert (result.width, result.height) == (8, 4)
+        assert result.read_pixels() == b'\xff' * result.size
+    # (Workers are replaced after `jobs_per_worker` jobs.)
+    assert results[0].worker_pid == results[1].worker_pid != results[2].worker_pid
+
+    (health,) = farm.check_health()
+    assert health.pid == results[2].worker_pid
+    assert health.jobs_done == 1
+    assert health.pooled_views == 1
+    assert health.warm_up is None
+    assert health.max_rss > 0
+
+
+def test_render_farm__check_health():
+    with ultralight_cffi.RenderFarm(max_workers=2, backend='fake') as farm:
+        healths = farm.check_health()
+        pids = {health.pid for health in healths}
+        assert len(healths) == len(pids) == 2
+        assert {health.pid for health in farm.check_health()} == pids
+        assert farm.restart_count == 0
+
+        # (A missing worker restarts the pool.)
+        os.kill(healths[0].pid, signal.SIGTERM)
+        farm.check_health(timeout=1)
+        assert farm.restart_count == 1
+        assert len(farm.check_health()) == 2
+
+
+def test_get_max_rss(mocker):
+    mocker.patch('sys.platform', 'win32')
+    assert _farm._get_max_rss() is None
+
+
+def test_render_farm__warm_up():
+    with ultralight_cffi.RenderFarm(
+        max_workers=1,
+        backend='fake',
+        warm_up=ultralight_cffi.WarmUpProfile(width=8, height=4),
+    ) as farm:
+        (health,) = farm.check_health()
+    assert health.warm_up.total_time > 0
+    assert health.pooled_views == 0
+
+
+def test_render_farm__shared_memory():
+    with ultralight_cffi.RenderFarm(
+        max_workers=1, backend='fake', transport='shared_memory'
+    ) as farm:
+        result = farm.render(ultralight_cffi.RenderJob(8, 4, html='', transparent=True))
+    assert result.transport == 'shared_memory'
+    assert result.read_pixels() == b'\x00' * result.size
+
+
+def test_render_farm__load_error(farm, tmp_path):
+    with pytest.raises(ultralight_cffi.LoadError):
+        farm.render(ultralight_cffi.RenderJob(8, 4, url=(tmp_path / 'x.html').as_uri()))
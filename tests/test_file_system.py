@@ -0,0 +1,175 @@
+import asyncio
+import mmap
+import pytest
+import ultralight_cffi
+from ultralight_cffi import _file_system
+
+
+@pytest.fixture()
+def asset_file_system(monkeypatch):
+    monkeypatch.setattr(_file_system, '_active', None)
+    return ultralight_cffi.AssetFileSystem(
+        {'/app/index.html': b'<title>Hello</title><h1>Hi</h1>'}
+    )
+
+
+def test_asset_file_system(asset_file_system, tmp_path):
+    assert asset_file_system.file_exists('app/index.html')
+    assert not asset_file_system.file_exists('app/missing.html')
+    assert asset_file_system.get_file_mime_type('app/index.html') == 'text/html'
+    assert asset_file_system.get_file_mime_type('app/x.unknown') == (
+        'application/octet-stream'
+    )
+
+    (tmp_path / 'css').mkdir()
+    (tmp_path / 'css' / 'style.css').write_bytes(b'h1 {}')
+    file_system = ultralight_cffi.AssetFileSystem.from_directory(tmp_path)
+    assert file_system.assets == {'css/style.css': b'h1 {}'}
+
+
+def test_asset_file_system__load(fake_lib, asset_file_system):
+    asset_file_system.install()
+    assert ultralight_cffi.get_active_file_system() is asset_file_system
+
+    config = ultralight_cffi.ulCreateConfig()
+    renderer = ultralight_cffi.ulCreateRenderer(config)
+    ultralight_cffi.ulDestroyConfig(config)
+
+    async def load():
+        async with ultralight_cffi.RendererDriver(renderer) as driver:
+            view = driver.create_view(8, 4)
+            try:
+                await view.load_url('file:///app/index.html')
+                title = ultralight_cffi.get_string(
+                    ultralight_cffi.ulViewGetTitle(view.view)
+                )
+                with pytest.raises(ultralight_cffi.LoadError):
+                    await view.load_url('file:///app/missing.html')
+            finally:
+                view.destroy()
+        return title
+
+    try:
+        assert asyncio.run(load()) == 'Hello'
+    finally:
+        ultralight_cffi.ulDestroyRenderer(renderer)
+    # (The zero-copy buffers are released once Ultralight destroys them.)
+    assert not _file_system._open_buffers
+    assert fake_lib.get_live_objects() == {}
+
+
+def test_mapped_file_system(fake_lib, monkeypatch, tmp_path):
+    monkeypatch.setattr(_file_system, '_active', None)
+    (tmp_path / 'root').mkdir()
+    (tmp_path / 'root' / 'index.html').write_bytes(b'<title>Mapped</title>')
+    (tmp_path / 'root' / 'empty.js').write_bytes(b'')
+    (tmp_path / 'secret.txt').write_bytes(b'secret')
+    file_system = ultralight_cffi.MappedFileSystem(tmp_path / 'root', mmap_threshold=0)
+
+    assert file_system.file_exists('index.html')
+    assert not file_system.file_exists('../secret.txt')
+    assert file_system.open_file('../secret.txt') is None
+    assert file_system.open_file('empty.js') == b''
+
+    file_system.install()
+    with ultralight_cffi.temp_string('index.html') as path:
+        buffer = _file_system._cb__open_file(path)
+    try:
+        assert (
+            ultralight_cffi.ffi.unpack(
+                ultralight_cffi.ffi.cast('char*', fake_lib.ulBufferGetData(buffer)),
+                fake_lib.ulBufferGetSize(buffer),
+            )
+            == b'<title>Mapped</title>'
+        )
+        ((_, mapping),) = _file_system._open_buffers.values()
+        assert isinstance(mapping, mmap.mmap)
+    finally:
+        fake_lib.ulDestroyBuffer(buffer)
+    assert not _file_system._open_buffers
+    assert mapping.closed
+
+
+def test_caching_file_system(mocker):
+    assets = ultralight_cffi.AssetFileSystem(
+        {'a.css': b'a' * 40, 'b.css': b'b' * 40, 'big.js': b'x' * 200}
+    )
+    open_file = mocker.spy(assets, 'open_file')
+    file_exists = mocker.spy(assets, 'file_exists')
+    file_system = ultralight_cffi.CachingFileSystem(assets, max_bytes=100)
+
+    assert bytes(file_system.open_file('a.css')) == b'a' * 40
+    assert bytes(file_system.open_file('/a.css')) == b'a' * 40
+    assert open_file.call_count == 1
+    assert file_system.file_exists('a.css')
+    file_exists.assert_not_called()
+
+    # (Too big to cache:)
+    assert file_system.open_file('big.js') == b'x' * 200
+    assert file_system.open_file('big.js') == b'x' * 200
+    assert file_system.num_bytes == 40
+
+    file_system.open_file('b.css')
+    file_system.open_file('a.css')  # (Makes `b.css` the least recently used.)
+    file_system.open_file('c.css')
+    assets.add('c.css', b'c' * 40)
+    assert not file_system.file_exists('c.css')  # (Negatively cached.)
+    file_system.open_file('missing.css')
+    assert file_system.stats == ultralight_cffi.FileSystemCacheStats(
+        hits=2, misses=6, evictions=0, negative_hits=1
+    )
+
+    file_system.clear()
+    assert file_system.file_exists('c.css')
+    file_system.open_file('c.css')
+    file_system.open_file('b.css')
+    file_system.open_file('a.css')
+    assert file_system.stats.evictions == 1
+    assert file_system.num_bytes == 80
+
+    assert file_system.get_file_mime_type('a.css') == 'text/css'
+    assert file_system.get_file_charset('a.css') == 'utf-8'
+
+
+def test_instrumented_file_system(mocker):
+    assets = ultralight_cffi.AssetFileSystem({'a.css': b'a' * 40, 'b.js': b'b' * 100})
+    file_system = ultralight_cffi.InstrumentedFileSystem(assets, capacity=8)
+
+    assert file_system.file_exists('/a.css')
+    assert file_system.get_file_mime_type('a.css') == 'text/css'
+    assert file_system.open_file('a.css') == b'a' * 40
+    assert file_system.open_file('a.css') == b'a' * 40
+    assert file_system.open_file('b.js') == b'b' * 100
+    assert file_system.open_file('missing.js') is None
+    assert [(event.path, event.op, event.size) for event in file_system.events] == [
+        ('a.css', 'file_exists', 0),
+        ('a.css', 'get_file_mime_type', 0),
+        ('a.css', 'open_file', 40),
+        ('a.css', 'open_file', 40),
+        ('b.js', 'open_file', 100),
+        ('missing.js', 'open_file', 0),
+    ]
+
+    report = file_system.report(top_n=2)
+    assert report.num_events == 6
+    assert len(report.slowest) == 2
+    assert [summary.path for summary in report.largest] == ['b.js', 'a.css']
+    (repeated,) = report.repeated
+    assert (repeated.path, repeated.calls, repeated.opens, repeated.total_bytes) == (
+        'a.css',
+        4,
+        2,
+        80,
+    )
+    assert 'a.css: 2 opens, 4 calls, 80 bytes' in report.format()
+
+    for _ in range(10):
+        file_system.file_exists('b.js')
+    assert len(file_system.events) == 8  # (The oldest events are dropped.)
+
+    file_system.events.clear()
+    file_system.sample_rate = 0.5
+    mocker.patch('random.random', side_effect=[0.7, 0.2])
+    file_system.open_file('a.css')
+    file_system.open_file('b.js')
+    assert [event.path for event in file_system.events] == ['b.js']
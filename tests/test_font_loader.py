@@ -0,0 +1,183 @@
+import pytest
+import struct
+import ultralight_cffi
+from ultralight_cffi import _font_loader
+
+
+def make_cmap(ranges, subtable_format=12):
+    if subtable_format == 4:
+        # (A range may have a third item: the glyph IDs of a sparse segment, which are
+        # mapped through the glyph ID array.)
+        ranges = [*ranges, (0xFFFF, 0xFFFF)]
+        seg_count = len(ranges)
+        id_range_offsets = []
+        glyph_ids = []
+        for i, (_, _, *sparse) in enumerate(ranges):
+            if sparse:
+                id_range_offsets.append((seg_count - i + len(glyph_ids)) * 2)
+                glyph_ids.extend(sparse[0])
+            else:
+                id_range_offsets.append(0)
+        subtable = struct.pack(
+            f'>HHHH6x{seg_count}H2x{seg_count}H{seg_count * 2}x{seg_count}H'
+            f'{len(glyph_ids)}H',
+            4,
+            16 + seg_count * 8 + len(glyph_ids) * 2,
+            0,
+            seg_count * 2,
+            *(end for _, end, *_ in ranges),
+            *(start for start, *_ in ranges),
+            *id_range_offsets,
+            *glyph_ids,
+        )
+        encoding = (3, 1)
+    else:
+        subtable = struct.pack(
+            '>HxxIII', 12, 16 + len(ranges) * 12, 0, len(ranges)
+        ) + b''.join(struct.pack('>III', start, end, 1) for start, end in ranges)
+        encoding = (3, 10)
+    return struct.pack('>HHHHI', 0, 1, *encoding, 12) + subtable
+
+
+def make_font(
+    family, weight=400, italic=False, ranges=((0x20, 0x7E),), offset=0, **kwargs
+):
+    """Builds a minimal sfnt font file, with just the tables that are indexed (at the
+    given offset within the file)."""
+    family_name = family.encode('utf-16-be')
+    name = (
+        struct.pack('>HHH', 0, 1, 6 + 12)
+        + struct.pack('>HHHHHH', 3, 1, 0x409, 1, len(family_name), 0)
+        + family_name
+    )
+    os2 = struct.pack('>4xH', weight).ljust(62, b'\0') + struct.pack(
+        '>H', 0x1 if italic else 0x40
+    )
+    tables = {b'OS/2': os2, b'cmap': make_cmap(ranges, **kwargs), b'name': name}
+    records = b''
+    body = b''
+    for tag, data in sorted(tables.items()):
+        records += struct.pack(
+            '>4s4xII', tag, offset + 12 + 16 * len(tables) + len(body), len(data)
+        )
+        body += data
+    return struct.pack('>4sH6x', b'\0\1\0\0', len(tables)) + records + body
+
+
+@pytest.fixture()
+def font_dir(tmp_path):
+    (tmp_path / 'sans').mkdir()
+    for file_name, family, weight, italic in [
+        ('sans/Sans-Light.ttf', 'Sans', 300, False),
+        ('sans/Sans-Regular.ttf', 'Sans', 400, False),
+        ('sans/Sans-Bold.ttf', 'Sans', 700, False),
+        ('sans/Sans-Italic.otf', 'Sans', 400, True),
+        ('Serif.ttf', 'Serif', 400, False),
+    ]:
+        (tmp_path / file_name).write_bytes(make_font(family, weight, italic))
+    (tmp_path / 'CJK.ttc').write_bytes(
+        b'ttcf\0\1\0\0\0\0\0\1\0\0\0\x10'
+        + make_font(
+            'CJK',
+            ranges=[(0x20, 0x7E), (0x4E00, 0x9FFF)],
+            offset=16,
+            subtable_format=4,
+        )
+    )
+    (tmp_path / 'Broken.ttf').write_bytes(b'not a font')
+    (tmp_path / 'README.txt').write_bytes(b'')
+    return tmp_path
+
+
+def test_font_index(font_dir):
+    index = ultralight_cffi.FontIndex.build(font_dir)
+    assert index.families == ['CJK', 'Sans', 'Serif']
+    assert len(index.faces) == 6
+
+    def match(family, weight, italic=False):
+        face = index.match(family, weight, italic)
+        return None if face is None else face.path
+
+    assert match('sans', 400) == 'sans/Sans-Regular.ttf'
+    assert match('Sans', 500) == 'sans/Sans-Regular.ttf'
+    assert match('Sans', 600) == 'sans/Sans-Bold.ttf'
+    assert match('Sans', 900) == 'sans/Sans-Bold.ttf'
+    assert match('Sans', 350) == 'sans/Sans-Light.ttf'
+    assert match('Sans', 100) == 'sans/Sans-Light.ttf'
+    assert match('Sans', 700, italic=True) == 'sans/Sans-Italic.otf'
+    assert match('Serif', 700, italic=True) == 'Serif.ttf'
+    assert match('Mono', 400) is None
+
+    index.save(font_dir / 'index.json')
+    loaded = ultralight_cffi.FontIndex.load(font_dir / 'index.json')
+    assert loaded.root == font_dir
+    assert loaded.faces == index.faces
+    assert loaded.coverage == index.coverage
+    assert loaded.get_covering_families(ord('a')) == ['CJK', 'Sans', 'Serif']
+    assert loaded.get_covering_families(ord('字')) == ['CJK']
+    assert loaded.get_covering_families(0x1F600) == []
+
+
+def test_read_font_coverage__sparse_segment():
+    """Tests that codepoints that a format 4 segment maps to the missing glyph (0)
+    through the glyph ID array aren't covered."""
+    cmap = make_cmap([(0x20, 0x30), (0x41, 0x45, [5, 0, 7, 8, 0])], subtable_format=4)
+    coverage = _font_loader._read_font_coverage({b'cmap': cmap})
+    assert coverage.to_list() == [0x20, 0x30, 0x41, 0x41, 0x43, 0x44]
+
+
+def test_font_coverage():
+    coverage = ultralight_cffi.FontCoverage(
+        [(10, 20), (0, 3), (15, 30), (4, 5), (40, 40)]
+    )
+    assert coverage.to_list() == [0, 5, 10, 30, 40, 40]
+    assert len(coverage) == 6 + 21 + 1
+    assert [i for i in range(50) if i in coverage] == [
+        *range(6),
+        *range(10, 31),
+        40,
+    ]
+    assert ultralight_cffi.FontCoverage.from_list(coverage.to_list()) == coverage
+
+
+def test_indexed_font_loader(fake_lib, font_dir, mocker):
+    index = ultralight_cffi.FontIndex.build(font_dir)
+    with pytest.raises(ValueError, match='Mono'):
+        ultralight_cffi.IndexedFontLoader(index, fallback_family='Mono')
+    loader = ultralight_cffi.IndexedFontLoader(index, fallback_family='serif')
+    mocker.patch.object(_font_loader, '_active', None)
+    loader.install()
+    assert ultralight_cffi.get_active_font_loader() is loader
+
+    fallback = _font_loader._cb__get_fallback_font()
+    assert ultralight_cffi.get_string(fallback) == 'Serif'
+    ultralight_cffi.ulDestroyString(fallback)
+
+    get_covering_families = mocker.spy(index, 'get_covering_families')
+    for characters, family in [
+        ('abc', 'Serif'),
+        ('漢字 abc', 'CJK'),
+        ('字', 'CJK'),
+        ('\U0001F600', 'Serif'),
+        (' ', 'Serif'),
+    ]:
+        with ultralight_cffi.temp_string(characters) as string:
+            result = _font_loader._cb__get_fallback_font_for_characters(
+                string, 400, False
+            )
+        assert ultralight_cffi.get_string(result) == family
+        ultralight_cffi.ulDestroyString(result)
+    # (Memoized by codepoint.)
+    assert get_covering_families.call_count == len(set('abc漢字\U0001F600'))
+
+    read_bytes = mocker.spy(type(font_dir), 'read_bytes')
+    for _ in range(2):
+        with ultralight_cffi.temp_string('Sans') as family:
+            font_file = _font_loader._cb__load(family, 700, False)
+        assert fake_lib.get_font_file_data(font_file) == make_font('Sans', 700)
+        ultralight_cffi.ulDestroyFontFile(font_file)
+    assert read_bytes.call_count == 1
+
+    with ultralight_cffi.temp_string('Mono') as family:
+        assert _font_loader._cb__load(family, 400, False) == ultralight_cffi.NULL
+    assert fake_lib.get_live_objects() == {}
@@ -0,0 +1,113 @@
+import logging
+import pytest
+import threading
+import ultralight_cffi
+from ultralight_cffi import _log_bridge
+
+
+@pytest.fixture()
+def log_message(fake_lib, monkeypatch):
+    monkeypatch.setattr(_log_bridge, '_active', None)
+
+    def log_message(level, message):
+        with ultralight_cffi.temp_string(message) as string:
+            _log_bridge._cb__log_message(level, string)
+
+    return log_message
+
+
+def test_logger_bridge(log_message, renderer, caplog):
+    caplog.set_level(logging.INFO, 'ultralight')
+    with ultralight_cffi.LoggerBridge() as bridge:
+        bridge.install()
+        assert ultralight_cffi.get_active_logger_bridge() is bridge
+        log_message(ultralight_cffi.kLogLevel_Error, 'Oops')
+        log_message(ultralight_cffi.kLogLevel_Warning, 'Hmm')
+        ultralight_cffi.ulLogMemoryUsage(renderer)
+    assert ultralight_cffi.get_active_logger_bridge() is None
+    log_message(ultralight_cffi.kLogLevel_Error, 'Dropped')
+
+    assert [(record.levelno, record.getMessage()) for record in caplog.records] == [
+        (logging.ERROR, 'Oops'),
+        (logging.WARNING, 'Hmm'),
+        (logging.INFO, "Live objects: {'ULRenderer': 1, 'ULSession': 1}"),
+    ]
+    assert {record.threadName for record in caplog.records} == {'ultralight-logger'}
+
+
+def test_logger_bridge__throttling(log_message, caplog, mocker):
+    caplog.set_level(logging.INFO, 'ultralight')
+    monotonic = mocker.patch('time.monotonic', return_value=100.0)
+    bridge = ultralight_cffi.LoggerBridge(dedup_interval=1.0, max_rate=2)
+    # (Holds off the background thread until the messages are queued.)
+    ready = threading.Event()
+    run = bridge._run
+
+    def run_when_ready():
+        ready.wait()
+        run()
+
+    mocker.patch.object(bridge, '_run', run_when_ready)
+    bridge.install()
+
+    for _ in range(3):
+        log_message(ultralight_cffi.kLogLevel_Warning, 'Again')
+    log_message(ultralight_cffi.kLogLevel_Warning, 'A')
+    log_message(ultralight_cffi.kLogLevel_Warning, 'B')  # (Over the rate limit.)
+    monotonic.return_value = 101.5
+    log_message(ultralight_cffi.kLogLevel_Warning, 'Again')
+    ready.set()
+    bridge.close()
+
+    assert [record.getMessage() for record in caplog.records] == [
+        'Again',
+        'A',
+        'Dropped 1 Ultralight log messages (rate limit)',
+        'Again (2 duplicates suppressed)',
+    ]
+    assert (bridge.num_suppressed, bridge.num_rate_limited, bridge.num_dropped) == (
+        2,
+        1,
+        0,
+    )
+
+
+def test_logger_bridge__suppressed(log_message, caplog, mocker):
+    caplog.set_level(logging.INFO, 'ultralight')
+    mocker.patch.object(_log_bridge, '_MAX_TRACKED_MESSAGES', 2)
+    monotonic = mocker.patch('time.monotonic', return_value=0.0)
+    bridge = ultralight_cffi.LoggerBridge(dedup_interval=1.0)
+    bridge._emit(0.0, logging.WARNING, 'A')
+    bridge._emit(0.5, logging.WARNING, 'A')
+    bridge._emit(2.0, logging.WARNING, 'B')
+    bridge._emit(2.0, logging.WARNING, 'C')  # (Forgets 'A'.)
+    assert list(bridge._last_seen) == [(logging.WARNING, 'B'), (logging.WARNING, 'C')]
+    assert not bridge._suppressed
+
+    # The counts left over when the bridge is closed are reported too:
+    monotonic.return_value = 2.5
+    bridge.install()
+    log_message(ultralight_cffi.kLogLevel_Warning, 'B')
+    monotonic.return_value = 5.0
+    log_message(ultralight_cffi.kLogLevel_Warning, 'D')  # (Forgets 'B' and 'C'.)
+    log_message(ultralight_cffi.kLogLevel_Warning, 'D')
+    bridge.close()
+
+    assert [record.getMessage() for record in caplog.records] == [
+        'A',
+        'B',
+        'Suppressed 1 duplicates of Ultralight log message: A',
+        'C',
+        'Suppressed 1 duplicates of Ultralight log message: B',
+        'D',
+        'Suppressed 1 duplicates of Ultralight log message: D',
+    ]
+    assert bridge.num_suppressed == 3
+
+
+def test_logger_bridge__max_pending(log_message):
+    bridge = ultralight_cffi.LoggerBridge(max_pending=0)
+    bridge.install()
+    log_message(ultralight_cffi.kLogLevel_Info, 'Hi')
+    bridge.close()
+    assert bridge.num_dropped == 1
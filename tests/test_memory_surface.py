@@ -0,0 +1,216 @@
+import concurrent.futures
+import contextlib
+import pytest
+import ultralight_cffi
+from ultralight_cffi import _memory_surface
+
+
+def test_get_row_bytes():
+    assert _memory_surface.get_row_bytes(3) == 16
+    assert _memory_surface.get_row_bytes(4) == 16
+    assert _memory_surface.get_row_bytes(5) == 32
+    assert _memory_surface.get_row_bytes(3, 0) == 12
+    assert _memory_surface.get_row_bytes(3, 64) == 64
+
+
+def test_pixel_storage(mocker):
+    monotonic = mocker.patch('time.monotonic', return_value=0.0)
+    storage = ultralight_cffi.PixelStorage(growth_factor=2.0, shrink_delay=5.0)
+    assert len(storage.reserve(100)) == 100
+    assert (storage.capacity, storage.num_allocations) == (200, 1)
+
+    # Sizes that fit reuse the storage:
+    view = storage.reserve(150)
+    view[:3] = b'abc'
+    assert storage.reserve(200)[:3] == b'abc'
+    assert storage.num_allocations == 1
+
+    storage.reserve(201)
+    assert (storage.capacity, storage.num_allocations) == (402, 2)
+
+    # Shrinking waits until the storage has been oversized for the delay:
+    storage.reserve(50)
+    monotonic.return_value = 4.0
+    storage.reserve(10)
+    assert storage.num_allocations == 2
+    monotonic.return_value = 5.0
+    storage.reserve(10)
+    assert (storage.capacity, storage.num_allocations) == (20, 3)
+
+    # ... and restarts when it no longer is, in between:
+    storage.reserve(1)
+    monotonic.return_value = 9.0
+    storage.reserve(20)
+    monotonic.return_value = 12.0
+    storage.reserve(1)
+    assert storage.num_allocations == 3
+
+    # Shrinking without reserving keeps the contents:
+    view = storage.reserve(3)
+    view[:] = b'xyz'
+    assert storage.shrink(3) is None
+    monotonic.return_value = 17.0
+    view = storage.shrink(3)
+    assert view == b'xyz'
+    assert (storage.capacity, storage.num_allocations) == (6, 4)
+    assert storage.shrink(3) is None
+
+    storage.clear()
+    assert storage.capacity == 0
+
+    with pytest.raises(ValueError, match='growth_factor'):
+        ultralight_cffi.PixelStorage(growth_factor=0.5)
+
+
+def test_memory_surface(fake_lib, renderer, mocker):
+    fake_lib.ulPlatformSetSurfaceDefinition(
+        ultralight_cffi.MemorySurface.get_definition()[0]
+    )
+    view_config = fake_lib.ulCreateViewConfig()
+    view = fake_lib.ulCreateView(renderer, 3, 2, view_config, ultralight_cffi.NULL)
+    fake_lib.ulDestroyViewConfig(view_config)
+    ul_surface = fake_lib.ulViewGetSurface(view)
+    surface = ultralight_cffi.MemorySurface.from_ffi(fake_lib, ul_surface)
+    assert fake_lib.ulSurfaceGetRowBytes(ul_surface) == 16
+    assert fake_lib.ulSurfaceGetSize(ul_surface) == 32
+
+    fake_lib.ulRender(renderer)
+    assert surface.pixels == b'\xff' * 32
+
+    fake_lib.ulViewResize(view, 2, 2)
+    fake_lib.ulViewResize(view, 4, 2)
+    assert fake_lib.ulSurfaceGetRowBytes(ul_surface) == 16
+    assert surface.storage.num_allocations == 1
+    fake_lib.ulViewResize(view, 8, 2)
+    assert fake_lib.ulSurfaceGetSize(ul_surface) == 64
+    assert surface.storage.num_allocations == 2
+
+    # The storage is shrunk on unlocking too, if the view isn't resized again:
+    monotonic = mocker.patch('time.monotonic', return_value=0.0)
+    fake_lib.ulViewResize(view, 1, 1)
+    monotonic.return_value = 10.0
+    fake_lib.ulRender(renderer)
+    assert surface.storage.capacity == 24
+    assert surface.pixels == b'\xff' * 16
+
+    fake_lib.ulDestroyView(view)
+    assert surface.storage.capacity == 0
+
+
+def _get_metrics(fake_lib, surface):
+    return (
+        fake_lib.ulSurfaceGetWidth(surface),
+        fake_lib.ulSurfaceGetHeight(surface),
+        fake_lib.ulSurfaceGetRowBytes(surface),
+        fake_lib.ulSurfaceGetSize(surface),
+    )
+
+
+@pytest.mark.parametrize(
+    'surface_cls', [ultralight_cffi.MemorySurface, ultralight_cffi.RingBufferSurface]
+)
+def test_memory_surface__direct_resize(fake_lib, renderer, surface_cls):
+    """Tests that Ultralight sees the new metrics when the surface is resized directly
+    (rather than by Ultralight)."""
+    fake_lib.ulPlatformSetSurfaceDefinition(surface_cls.get_definition()[0])
+    view_config = fake_lib.ulCreateViewConfig()
+    view = fake_lib.ulCreateView(renderer, 8, 8, view_config, ultralight_cffi.NULL)
+    fake_lib.ulDestroyViewConfig(view_config)
+    ul_surface = fake_lib.ulViewGetSurface(view)
+    surface = surface_cls.from_ffi(fake_lib, ul_surface)
+    assert _get_metrics(fake_lib, ul_surface) == (8, 8, 32, 256)
+    surface.resize(2, 3)
+    assert _get_metrics(fake_lib, ul_surface) == (2, 3, 16, 48)
+    fake_lib.ulDestroyView(view)
+
+
+def _paint(surface, value):
+    pixels = surface.lock_pixels()
+    pixels[:4] = bytes([value]) * 4
+    surface.unlock_pixels()
+
+
+def test_ring_buffer_surface():
+    surface = ultralight_cffi.RingBufferSurface(2, 2)
+    with surface.latest_frame() as frame:
+        assert frame is None
+
+    _paint(surface, 1)
+    with surface.latest_frame() as frame:
+        assert frame.generation == surface.generation == 1
+        assert (frame.width, frame.height, frame.row_bytes) == (2, 2, 16)
+        assert frame.pixels.readonly
+        assert frame.pixels[:4] == b'\x01' * 4
+
+        # The renderer keeps painting into other buffers meanwhile:
+        for value in range(2, 5):
+            _paint(surface, value)
+        assert frame.pixels[:4] == b'\x01' * 4
+
+        # ... and the back buffers start from the latest frame's pixels:
+        assert surface.lock_pixels()[:5] == b'\x04' * 4 + b'\x00'
+        surface.unlock_pixels()
+
+    with surface.latest_frame() as frame:
+        assert frame.generation == 5
+        assert frame.pixels[:4] == b'\x04' * 4
+    assert surface.stats == ultralight_cffi.RingBufferStats(
+        published=5, read=2, dropped=3, copies=4
+    )
+    assert len(surface._buffers) == 3
+
+
+def test_ring_buffer_surface__readers():
+    surface = ultralight_cffi.RingBufferSurface(2, 2)
+    _paint(surface, 1)
+    with contextlib.ExitStack() as stack:
+        # Readers holding on to more frames than there are spare buffers:
+        for value in range(2, 5):
+            stack.enter_context(surface.latest_frame())
+            _paint(surface, value)
+        assert len(surface._buffers) == 4
+    with surface.latest_frame() as frame:
+        assert frame.pixels[:4] == b'\x04' * 4
+
+    # Resizing discards the contents, until the next paint:
+    surface.resize(5, 1)
+    with surface.latest_frame() as frame:
+        assert (frame.width, frame.row_bytes) == (2, 16)
+    assert surface.lock_pixels().nbytes == 32
+    surface.unlock_pixels()
+    with surface.latest_frame() as frame:
+        assert (frame.width, frame.height, frame.row_bytes) == (5, 1, 32)
+
+
+def test_ring_buffer_surface__threads(fake_lib, renderer):
+    fake_lib.ulPlatformSetSurfaceDefinition(
+        ultralight_cffi.RingBufferSurface.get_definition()[0]
+    )
+    view_config = fake_lib.ulCreateViewConfig()
+    view = fake_lib.ulCreateView(renderer, 3, 2, view_config, ultralight_cffi.NULL)
+    fake_lib.ulDestroyViewConfig(view_config)
+    surface = ultralight_cffi.RingBufferSurface.from_ffi(
+        fake_lib, fake_lib.ulViewGetSurface(view)
+    )
+
+    def read_frames():
+        generations = []
+        while surface.wait_for_frame(max(generations, default=0), timeout=5.0):
+            with surface.latest_frame() as frame:
+                assert frame.pixels[: frame.width * 4] == b'\xff' * frame.width * 4
+                generations.append(frame.generation)
+            if frame.generation == 20:
+                break
+        return generations
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        future = executor.submit(read_frames)
+        for _ in range(20):
+            fake_lib.ulViewResize(view, 3, 2)  # (Forces a repaint.)
+            fake_lib.ulRender(renderer)
+        generations = future.result()
+
+    assert generations == sorted(set(generations))
+    assert generations[-1] == 20
+    assert surface.stats.read + surface.stats.dropped == 20
+    fake_lib.ulDestroyView(view)
@@ -0,0 +1,79 @@
+import asyncio
+import pytest
+import ultralight_cffi
+from ultralight_cffi import _pool
+from unittest import mock
+
+
+def test_view_pool(fake_lib, renderer):
+    on_finish_loading = mock.Mock(return_value=None)
+    finish_loading_callback = ultralight_cffi.callback(
+        'void(void*, ULView, unsigned long long, _Bool, ULString)'
+    )(on_finish_loading)
+
+    pool = ultralight_cffi.ViewPool(renderer, max_size=2)
+    with pool.view(8, 4) as view:
+        ultralight_cffi.ulViewSetFinishLoadingCallback(
+            view, finish_loading_callback, ultralight_cffi.NULL
+        )
+    assert len(pool) == 1
+    on_finish_loading.assert_not_called()
+
+    with pool.view(8, 4) as view2:
+        assert view2 == view
+    with pool.view(8, 4, transparent=True) as view3:
+        assert view3 != view
+        assert ultralight_cffi.ulViewIsTransparent(view3)
+    assert pool.stats == ultralight_cffi.ViewPoolStats(hits=1, misses=2)
+    assert pool.stats.hit_rate == pytest.approx(1 / 3)
+
+    pool.clear()
+    assert len(pool) == 0
+    assert fake_lib.get_live_objects()['ULView'] == 0
+
+
+def test_view_pool__eviction(fake_lib, renderer):
+    pool = ultralight_cffi.ViewPool(renderer, max_size=2)
+    views = [pool.acquire(8, 4, device_scale=scale) for scale in (1.0, 2.0, 3.0)]
+    for view in views:
+        pool.release(view)
+    assert len(pool) == 2
+    assert pool.stats.evictions == 1
+    assert fake_lib.get_live_objects()['ULView'] == 2
+
+    # (The first-released view was evicted.)
+    assert pool.acquire(8, 4, device_scale=1.0) not in views
+    assert pool.acquire(8, 4, device_scale=3.0) == views[2]
+    assert pool.stats.hits == 1
+
+    with pytest.raises(ValueError):
+        pool.release(views[0])
+
+
+async def test_view_pool__reuse_async_view(fake_lib, renderer):
+    """Tests that a released view's about:blank load can't resolve the next user's
+    load."""
+    pool = ultralight_cffi.ViewPool(renderer)
+    pool.release(pool.acquire(8, 4))
+    view = pool.acquire(8, 4)
+    assert not ultralight_cffi.ulViewIsLoading(view)
+    url = ultralight_cffi.ulViewGetURL(view)
+    assert ultralight_cffi.get_string(url) == 'about:blank'
+
+    async with ultralight_cffi.RendererDriver(renderer) as driver:
+        async_view = ultralight_cffi.AsyncView(driver, view)
+        await asyncio.wait_for(async_view.load_html('<title>Hi</title>'), 1)
+        title = ultralight_cffi.ulViewGetTitle(view)
+        assert ultralight_cffi.get_string(title) == 'Hi'
+        async_view.destroy()
+    pool.release(view)
+    assert pool.stats.hits == 1
+
+
+def test_view_pool__reset_timeout(fake_lib, renderer, monkeypatch):
+    monkeypatch.setattr(_pool, '_MAX_RESET_UPDATES', 0)
+    pool = ultralight_cffi.ViewPool(renderer)
+    pool.release(pool.acquire(8, 4))
+    assert len(pool) == 0
+    assert fake_lib.get_live_objects()['ULView'] == 0
+    assert not _pool._resetting
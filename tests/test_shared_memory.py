@@ -0,0 +1,91 @@
+import concurrent.futures
+import gc
+import multiprocessing
+import pytest
+import ultralight_cffi
+
+
+def _read_frame(frame):
+    with ultralight_cffi.shared_frame_pixels(frame) as pixels:
+        return bytes(pixels[0, 0])
+
+
+def _get_metrics(fake_lib, surface):
+    return (
+        fake_lib.ulSurfaceGetWidth(surface),
+        fake_lib.ulSurfaceGetHeight(surface),
+        fake_lib.ulSurfaceGetRowBytes(surface),
+        fake_lib.ulSurfaceGetSize(surface),
+    )
+
+
+@pytest.fixture()
+def view(fake_lib, renderer):
+    fake_lib.ulPlatformSetSurfaceDefinition(
+        ultralight_cffi.SharedMemorySurface.get_definition()[0]
+    )
+    view_config = fake_lib.ulCreateViewConfig()
+    view = fake_lib.ulCreateView(renderer, 3, 2, view_config, ultralight_cffi.NULL)
+    fake_lib.ulDestroyViewConfig(view_config)
+    yield view
+    fake_lib.ulDestroyView(view)
+
+
+def test_shared_memory_surface(fake_lib, renderer, view):
+    surface = ultralight_cffi.SharedMemorySurface.from_ffi(
+        fake_lib, fake_lib.ulViewGetSurface(view)
+    )
+    frame = surface.get_frame()
+    assert (frame.width, frame.height, frame.row_bytes) == (3, 2, 12)
+
+    fake_lib.ulRender(renderer)
+    new_frame = surface.get_frame()
+    assert new_frame.name == frame.name
+    assert new_frame.generation > frame.generation
+
+    with ultralight_cffi.shared_frame_pixels(new_frame) as pixels:
+        assert pixels.shape == (2, 3, 4)
+        assert pixels.tobytes() == b'\xff' * 24
+
+    # (Across processes:)
+    with concurrent.futures.ProcessPoolExecutor(
+        1, mp_context=multiprocessing.get_context('spawn')
+    ) as executor:
+        assert executor.submit(_read_frame, new_frame).result() == b'\xff' * 4
+
+
+def test_shared_memory_surface__resize(fake_lib, renderer, view):
+    surface = ultralight_cffi.SharedMemorySurface.from_ffi(
+        fake_lib, fake_lib.ulViewGetSurface(view)
+    )
+    frame = surface.get_frame()
+    fake_lib.ulViewResize(view, 5, 4)
+    new_frame = surface.get_frame()
+    assert new_frame.name != frame.name
+    assert (new_frame.width, new_frame.height, new_frame.row_bytes) == (5, 4, 20)
+    with pytest.raises(FileNotFoundError):
+        with ultralight_cffi.shared_frame_pixels(frame):
+            pass
+
+
+def test_shared_memory_surface__lifetime(fake_lib, view):
+    """Tests that the surfaces that Ultralight creates aren't garbage collected while
+    it's still using them."""
+    gc.collect()
+    surface = ultralight_cffi.SharedMemorySurface.from_ffi(
+        fake_lib, fake_lib.ulViewGetSurface(view)
+    )
+    assert surface.get_frame().width == 3
+
+
+def test_shared_memory_surface__lock_then_resize(fake_lib, view):
+    """Tests that the surface can be resized directly (rather than by Ultralight) after
+    being locked, while its pixel pointer is cached."""
+    ul_surface = fake_lib.ulViewGetSurface(view)
+    surface = ultralight_cffi.SharedMemorySurface.from_ffi(fake_lib, ul_surface)
+    fake_lib.ulSurfaceLockPixels(ul_surface)
+    fake_lib.ulSurfaceUnlockPixels(ul_surface)
+    surface.resize(5, 4)
+    assert surface.get_frame().width == 5
+    # (Ultralight must see the new metrics too.)
+    assert _get_metrics(fake_lib, ul_surface) == (5, 4, 20, 80)
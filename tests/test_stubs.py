@@ -0,0 +1,110 @@
+import enum
+import mock
+import os
+import pytest
+import re
+import subprocess
+import sys
+import ultralight_cffi
+from ultralight_cffi import _base
+from ultralight_cffi import _stubs
+
+_IMPORT_TIME_BUDGET_US = 120_000
+"""Budget for the cumulative time of ``import ultralight_cffi``, in microseconds.
+
+The package takes ~50 ms to import (on a typical dev machine, with warm bytecode
+caches) - most of it in CFFI and parsing the bindings - whereas importing all the
+feature modules and their dependencies eagerly took ~150-250 ms; the budget is generous
+to avoid flakiness on slow CI runners."""
+
+
+def _run_python(code: str, *args: str) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # (measure with warm bytecode caches)
+    return subprocess.run(
+        [sys.executable, *args, '-c', code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+
+
+def _get_import_time_us(module_name: str) -> int:
+    """Measures the cumulative time of importing a module (including the modules it
+    imports) via ``python -X importtime``."""
+    proc = _run_python(f'import {module_name}', '-X', 'importtime')
+    pattern = re.compile(
+        rf'^import time:\s*\d+ \|\s*(\d+) \|\s*{re.escape(module_name)}$'
+    )
+    matches = [
+        match
+        for line in proc.stderr.splitlines()
+        if (match := pattern.match(line)) is not None
+    ]
+    assert len(matches) == 1, proc.stderr
+    return int(matches[0].group(1))
+
+
+def test_import__lazy():
+    proc = _run_python(
+        'import ultralight_cffi\n'
+        'from ultralight_cffi import _stubs\n'
+        'names = {"ulUpdate", "JSType", "kJSTypeNull", "ULIntRect", "ULString"}\n'
+        'print(sorted(names & vars(_stubs).keys()))\n'
+        'print(sorted(names & vars(ultralight_cffi).keys()))\n'
+        'import sys\n'
+        'modules = {"asyncio", "multiprocessing", "numpy", "ultralight_cffi._farm"}\n'
+        'print(sorted(modules & sys.modules.keys()))\n'
+    )
+    assert proc.stdout.splitlines() == ['[]', '[]', '[]']
+
+
+def test_import_time():
+    # (The first run may include bytecode compilation, so take the best of a few.)
+    import_time_us = min(_get_import_time_us('ultralight_cffi') for _ in range(3))
+    assert import_time_us < _IMPORT_TIME_BUDGET_US
+
+
+def test_getattr__enum():
+    assert issubclass(ultralight_cffi.ULBitmapFormat, enum.IntEnum)
+    assert ultralight_cffi.ULBitmapFormat.__module__ == _stubs.__name__
+    assert ultralight_cffi.kBitmapFormat_BGRA8_UNORM_SRGB == 1
+    assert (
+        ultralight_cffi.kBitmapFormat_BGRA8_UNORM_SRGB
+        is ultralight_cffi.ULBitmapFormat.kBitmapFormat_BGRA8_UNORM_SRGB
+    )
+
+
+def test_getattr__class():
+    assert ultralight_cffi.ULIntRect.__annotations__ == {
+        'left': 'int',
+        'top': 'int',
+        'right': 'int',
+        'bottom': 'int',
+    }
+    assert ultralight_cffi.ULIntRect is _stubs.ULIntRect
+
+
+def test_getattr__type_alias():
+    assert ultralight_cffi.ULString == _base.Pointer[_stubs.C_String]
+
+
+def test_getattr__function(mocker):
+    lib = mock.Mock()
+    mocker.patch.object(_base, '_lib', lib)
+    assert ultralight_cffi.ulVersionMajor.__name__ == 'ulVersionMajor'
+    assert ultralight_cffi.ulVersionMajor() is lib.ulVersionMajor.return_value
+    assert ultralight_cffi.ulBitmapGetWidth(123) is lib.ulBitmapGetWidth.return_value
+    lib.ulBitmapGetWidth.assert_called_once_with(123)
+
+
+def test_getattr__unknown():
+    with pytest.raises(AttributeError, match="has no attribute 'ulNope'"):
+        ultralight_cffi.ulNope  # pylint: disable=pointless-statement
+    with pytest.raises(AttributeError, match="has no attribute 'ulNope'"):
+        _stubs.ulNope  # pylint: disable=pointless-statement
+
+
+def test_dir():
+    assert {'ulUpdate', 'JSType', 'kJSTypeNull', 'load'} <= set(dir(ultralight_cffi))
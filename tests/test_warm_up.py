@@ -0,0 +1,28 @@
+import ultralight_cffi
+
+
+def test_warm_up_profile():
+    profile = ultralight_cffi.WarmUpProfile(
+        font_families=('"Noto Sans"',), weights=(300, 700), italic=False, text='a<b'
+    )
+    document = profile.get_html()
+    assert document.count('<p ') == 2
+    assert 'font-family: &quot;Noto Sans&quot;; font-weight: 300' in document
+    assert 'a&lt;b' in document
+    assert 'italic' not in document
+    assert ultralight_cffi.WarmUpProfile(html='<p>Hi</p>').get_html() == '<p>Hi</p>'
+    assert ultralight_cffi.WarmUpProfile().get_html().count('<p ') == 12
+
+
+def test_warm_up(fake_lib, renderer, mocker):
+    load_html = mocker.spy(fake_lib, 'ulViewLoadHTML')
+    render = mocker.spy(fake_lib, 'ulRender')
+    profile = ultralight_cffi.WarmUpProfile(width=16, height=8, html='<p>Hi</p>')
+
+    report = ultralight_cffi.warm_up(renderer, profile)
+
+    assert report.total_time >= report.load_time + report.render_time > 0
+    load_html.assert_called_once()
+    render.assert_called_once_with(renderer)
+    # (The temporary view is destroyed.)
+    assert fake_lib.get_live_objects() == {'ULRenderer': 1, 'ULSession': 1}
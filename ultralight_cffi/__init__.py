@@ -1,20 +1,234 @@
+import importlib
+from . import _stubs
 from ._base import NULL
+from ._base import Backend
 from ._base import CData
 from ._base import Lib
 from ._base import callback
+from ._base import ffi
+from ._base import get_api_bindings
 from ._base import load
 from ._base import logger
-from ._bindings import ffi
-from ._stubs import *
+from ._string import create_string
+from ._string import get_string
+from ._string import get_string_bytes
+from ._string import temp_string
 from ._surface import CustomSurface
+from typing import TYPE_CHECKING
+from typing import Any
+
+_LAZY_ATTRIBUTES = {
+    'ArchiveEntry': '._archive',
+    'ArchiveFileSystem': '._archive',
+    'AsyncView': '._asyncio',
+    'LoadError': '._asyncio',
+    'RendererDriver': '._asyncio',
+    'bitmap_pixels': '._bitmap',
+    'ConsoleCollector': '._console',
+    'ConsoleMessage': '._console',
+    'bgra_to_rgb': '._convert',
+    'bgra_to_rgba': '._convert',
+    'copy_pixels': '._convert',
+    'drop_alpha': '._convert',
+    'premultiply_alpha': '._convert',
+    'rgba_to_bgra': '._convert',
+    'unpremultiply_alpha': '._convert',
+    'DirtyRect': '._extract',
+    'FrameExtractor': '._extract',
+    'PixelMode': '._extract',
+    'RenderFarm': '._farm',
+    'RenderJob': '._farm',
+    'RenderResult': '._farm',
+    'Transport': '._farm',
+    'WorkerHealth': '._farm',
+    'AssetFileSystem': '._file_system',
+    'CachingFileSystem': '._file_system',
+    'CustomFileSystem': '._file_system',
+    'FileSystemCacheStats': '._file_system',
+    'MappedFileSystem': '._file_system',
+    'get_active_file_system': '._file_system',
+    'FileSystemEvent': '._file_trace',
+    'FileSystemOp': '._file_trace',
+    'FileSystemReport': '._file_trace',
+    'InstrumentedFileSystem': '._file_trace',
+    'PathSummary': '._file_trace',
+    'CustomFontLoader': '._font_loader',
+    'FontCoverage': '._font_loader',
+    'FontFace': '._font_loader',
+    'FontIndex': '._font_loader',
+    'IndexedFontLoader': '._font_loader',
+    'get_active_font_loader': '._font_loader',
+    'LoggerBridge': '._log_bridge',
+    'get_active_logger_bridge': '._log_bridge',
+    'MemorySurface': '._memory_surface',
+    'PixelStorage': '._memory_surface',
+    'RingBufferStats': '._memory_surface',
+    'RingBufferSurface': '._memory_surface',
+    'SurfaceFrame': '._memory_surface',
+    'ViewKey': '._pool',
+    'ViewPool': '._pool',
+    'ViewPoolStats': '._pool',
+    'SharedFrame': '._shared_memory',
+    'SharedMemorySurface': '._shared_memory',
+    'shared_frame_pixels': '._shared_memory',
+    'WarmUpProfile': '._warm_up',
+    'WarmUpReport': '._warm_up',
+    'warm_up': '._warm_up',
+    'warm_up_async': '._warm_up',
+}
+"""The submodule that defines each of the attributes that are only imported on first
+access, since most programs only use a few of the features, and some of their
+dependencies (e.g. :mod:`asyncio` and :mod:`multiprocessing`) are slow to import."""
+
+if TYPE_CHECKING:
+    from ._archive import ArchiveEntry
+    from ._archive import ArchiveFileSystem
+    from ._asyncio import AsyncView
+    from ._asyncio import LoadError
+    from ._asyncio import RendererDriver
+    from ._bitmap import bitmap_pixels
+    from ._console import ConsoleCollector
+    from ._console import ConsoleMessage
+    from ._convert import bgra_to_rgb
+    from ._convert import bgra_to_rgba
+    from ._convert import copy_pixels
+    from ._convert import drop_alpha
+    from ._convert import premultiply_alpha
+    from ._convert import rgba_to_bgra
+    from ._convert import unpremultiply_alpha
+    from ._extract import DirtyRect
+    from ._extract import FrameExtractor
+    from ._extract import PixelMode
+    from ._farm import RenderFarm
+    from ._farm import RenderJob
+    from ._farm import RenderResult
+    from ._farm import Transport
+    from ._farm import WorkerHealth
+    from ._file_system import AssetFileSystem
+    from ._file_system import CachingFileSystem
+    from ._file_system import CustomFileSystem
+    from ._file_system import FileSystemCacheStats
+    from ._file_system import MappedFileSystem
+    from ._file_system import get_active_file_system
+    from ._file_trace import FileSystemEvent
+    from ._file_trace import FileSystemOp
+    from ._file_trace import FileSystemReport
+    from ._file_trace import InstrumentedFileSystem
+    from ._file_trace import PathSummary
+    from ._font_loader import CustomFontLoader
+    from ._font_loader import FontCoverage
+    from ._font_loader import FontFace
+    from ._font_loader import FontIndex
+    from ._font_loader import IndexedFontLoader
+    from ._font_loader import get_active_font_loader
+    from ._log_bridge import LoggerBridge
+    from ._log_bridge import get_active_logger_bridge
+    from ._memory_surface import MemorySurface
+    from ._memory_surface import PixelStorage
+    from ._memory_surface import RingBufferStats
+    from ._memory_surface import RingBufferSurface
+    from ._memory_surface import SurfaceFrame
+    from ._pool import ViewKey
+    from ._pool import ViewPool
+    from ._pool import ViewPoolStats
+    from ._shared_memory import SharedFrame
+    from ._shared_memory import SharedMemorySurface
+    from ._shared_memory import shared_frame_pixels
+    from ._stubs import *
+    from ._warm_up import WarmUpProfile
+    from ._warm_up import WarmUpReport
+    from ._warm_up import warm_up
+    from ._warm_up import warm_up_async
+else:
+
+    def __getattr__(name: str) -> Any:
+        """Lazily imports the :data:`_LAZY_ATTRIBUTES` and resolves the generated
+        ``_stubs`` symbols (PEP 562), caching each one in the package namespace on
+        first access."""
+        if name in _LAZY_ATTRIBUTES:
+            module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+            value = getattr(module, name)
+        elif name in _stubs._symbols:  # pylint: disable=protected-access
+            value = getattr(_stubs, name)
+        else:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+        globals()[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*globals(), *_LAZY_ATTRIBUTES, *dir(_stubs)})
+
 
 __all__ = [  # TODO: include `_stubs.*` as well?
+    'ArchiveEntry',
+    'ArchiveFileSystem',
+    'AssetFileSystem',
+    'AsyncView',
+    'Backend',
+    'bgra_to_rgb',
+    'bgra_to_rgba',
+    'bitmap_pixels',
+    'CachingFileSystem',
     'callback',
+    'create_string',
     'CData',
+    'ConsoleCollector',
+    'ConsoleMessage',
+    'copy_pixels',
+    'CustomFileSystem',
+    'CustomFontLoader',
     'CustomSurface',
+    'DirtyRect',
+    'drop_alpha',
     'ffi',
+    'FileSystemCacheStats',
+    'FileSystemEvent',
+    'FileSystemOp',
+    'FileSystemReport',
+    'FontCoverage',
+    'FontFace',
+    'FontIndex',
+    'FrameExtractor',
+    'get_active_file_system',
+    'get_active_font_loader',
+    'get_active_logger_bridge',
+    'get_api_bindings',
+    'get_string',
+    'get_string_bytes',
+    'IndexedFontLoader',
+    'InstrumentedFileSystem',
     'Lib',
+    'LoadError',
     'load',
     'logger',
+    'LoggerBridge',
+    'MappedFileSystem',
+    'MemorySurface',
     'NULL',
+    'PathSummary',
+    'PixelMode',
+    'PixelStorage',
+    'premultiply_alpha',
+    'RenderFarm',
+    'RendererDriver',
+    'RenderJob',
+    'RenderResult',
+    'rgba_to_bgra',
+    'RingBufferStats',
+    'RingBufferSurface',
+    'SharedFrame',
+    'shared_frame_pixels',
+    'SharedMemorySurface',
+    'SurfaceFrame',
+    'temp_string',
+    'Transport',
+    'unpremultiply_alpha',
+    'ViewKey',
+    'ViewPool',
+    'ViewPoolStats',
+    'warm_up',
+    'warm_up_async',
+    'WarmUpProfile',
+    'WarmUpReport',
+    'WorkerHealth',
 ]
@@ -0,0 +1,244 @@
+"""A ``ULFileSystem`` that serves files straight out of a zip or tar archive, without
+extracting it."""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import json
+import mmap
+import os
+import pathlib
+import struct
+import tarfile
+import zipfile
+import zlib
+from ._base import logger
+from ._file_system import CustomFileSystem
+from ._file_system import normalize_path
+from types import TracebackType
+from typing import Any
+from typing import NamedTuple
+from typing import Self
+from typing_extensions import Buffer
+
+_INDEX_VERSION = 1
+
+_ZIP_LOCAL_HEADER = struct.Struct('<4sHHHHHIIIHH')
+_ZIP_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+
+
+class ArchiveEntry(NamedTuple):
+    """The location of a file's data within an archive."""
+
+    offset: int
+    size: int
+    """The uncompressed size."""
+    compressed_size: int
+    compression: int
+    """:data:`zipfile.ZIP_STORED` or :data:`zipfile.ZIP_DEFLATED`."""
+
+
+def _get_zip_data_offset(mapping: mmap.mmap, info: zipfile.ZipInfo) -> int:
+    """Returns the offset of a zip member's data, which follows its local header (whose
+    extra field may differ from the central directory's)."""
+    fields = _ZIP_LOCAL_HEADER.unpack_from(mapping, info.header_offset)
+    if fields[0] != _ZIP_LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f'Bad local header for {info.filename!r}')
+    name_length: int = fields[-2]
+    extra_length: int = fields[-1]
+    return info.header_offset + _ZIP_LOCAL_HEADER.size + name_length + extra_length
+
+
+def _index_zip(path: pathlib.Path, mapping: mmap.mmap) -> dict[str, ArchiveEntry]:
+    index = {}
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            if info.flag_bits & 0x1:
+                raise ValueError(
+                    f'Encrypted zip entries are unsupported: {info.filename}'
+                )
+            if info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                raise ValueError(
+                    f'Unsupported compression for {info.filename!r}: '
+                    f'{info.compress_type} (only stored and deflated are supported)'
+                )
+            index[normalize_path(info.filename)] = ArchiveEntry(
+                _get_zip_data_offset(mapping, info),
+                info.file_size,
+                info.compress_size,
+                info.compress_type,
+            )
+    return index
+
+
+def _index_tar(path: pathlib.Path) -> dict[str, ArchiveEntry]:
+    index = {}
+    with tarfile.open(path, 'r:') as archive:
+        for member in archive:
+            if member.isreg():
+                index[normalize_path(member.name.removeprefix('./'))] = ArchiveEntry(
+                    member.offset_data,
+                    member.size,
+                    member.size,
+                    zipfile.ZIP_STORED,
+                )
+    return index
+
+
+class ArchiveFileSystem(CustomFileSystem):
+    """A file system that serves the files in a zip archive (stored or deflated) or an
+    uncompressed tar archive.
+
+    The archive is memory-mapped, and indexed once (path to offset, size and
+    compression), so no extraction is needed.  Stored files are served as zero-copy
+    slices of the mapping, and deflated ones are decompressed on demand, with the most
+    recently used ones kept in a cache of at most ``cache_size`` bytes.
+
+    If ``persist_index`` is true, the index is saved next to the archive (as
+    ``<archive>.index.json``), and reused as long as the archive's size and
+    modification time are unchanged, which saves parsing large archives at startup.
+
+    Example::
+
+        with ArchiveFileSystem('theme.zip', persist_index=True) as file_system:
+            file_system.install()
+            ...
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path | str,
+        *,
+        cache_size: int = 32 * 1024 * 1024,
+        persist_index: bool = False,
+        charset: str = 'utf-8',
+    ) -> None:
+        self.path = pathlib.Path(path)
+        self.cache_size = cache_size
+        self.charset = charset
+        self._cache: collections.OrderedDict[str, bytes] = collections.OrderedDict()
+        self._cache_bytes = 0
+        with self.path.open('rb') as file:
+            # (Empty files can't be mapped, but they aren't valid archives anyway.)
+            self._mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.index = self._load_index(persist_index)
+        except BaseException:
+            self._mapping.close()
+            raise
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def index_path(self) -> pathlib.Path:
+        """Where the index is persisted."""
+        return self.path.with_name(self.path.name + '.index.json')
+
+    def close(self) -> None:
+        """Unmaps the archive.
+
+        Files that are still being served keep the mapping alive until Ultralight
+        releases them.
+        """
+        self._cache.clear()
+        self._cache_bytes = 0
+        with contextlib.suppress(BufferError):
+            self._mapping.close()
+
+    def file_exists(self, path: str) -> bool:
+        return normalize_path(path) in self.index
+
+    def get_file_charset(self, path: str) -> str:
+        return self.charset
+
+    def open_file(self, path: str) -> Buffer | None:
+        key = normalize_path(path)
+        entry = self.index.get(key)
+        data: Buffer | None = None
+        if entry is None:
+            pass
+        elif entry.compression == zipfile.ZIP_STORED:
+            data = memoryview(self._mapping)[entry.offset : entry.offset + entry.size]
+        elif key in self._cache:
+            self._cache.move_to_end(key)
+            data = self._cache[key]
+        else:
+            data = self._inflate(entry)
+            self._add_to_cache(key, data)
+        return data
+
+    def _inflate(self, entry: ArchiveEntry) -> bytes:
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)  # (raw deflate)
+        with memoryview(self._mapping) as view:
+            data = decompressor.decompress(
+                view[entry.offset : entry.offset + entry.compressed_size]
+            )
+        return data + decompressor.flush()
+
+    def _add_to_cache(self, key: str, data: bytes) -> None:
+        if len(data) <= self.cache_size:
+            self._cache[key] = data
+            self._cache_bytes += len(data)
+            while self._cache_bytes > self.cache_size:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+
+    def _get_stamp(self) -> dict[str, Any]:
+        stat = os.stat(self.path)
+        return {
+            'version': _INDEX_VERSION,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+
+    def _load_index(self, persist_index: bool) -> dict[str, ArchiveEntry]:
+        stamp = self._get_stamp()
+        index = None
+        if persist_index:
+            with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+                saved = json.loads(self.index_path.read_text(encoding='utf-8'))
+                if saved['stamp'] == stamp:
+                    index = {
+                        path: ArchiveEntry(*entry)
+                        for path, entry in saved['entries'].items()
+                    }
+        if index is None:
+            index = self._build_index()
+            if persist_index:
+                # (Atomically, in case several processes start up at once.)
+                temp_path = self.index_path.with_name(
+                    f'{self.index_path.name}.{os.getpid()}.tmp'
+                )
+                try:
+                    temp_path.write_text(
+                        json.dumps({'stamp': stamp, 'entries': index}),
+                        encoding='utf-8',
+                    )
+                    os.replace(temp_path, self.index_path)
+                except OSError as e:
+                    # (E.g. read-only directories: the index just isn't saved.)
+                    logger.warning('Failed to save index %s: %s', self.index_path, e)
+                    with contextlib.suppress(OSError):
+                        temp_path.unlink()
+        return index
+
+    def _build_index(self) -> dict[str, ArchiveEntry]:
+        if zipfile.is_zipfile(self.path):
+            index = _index_zip(self.path, self._mapping)
+        elif tarfile.is_tarfile(self.path):
+            index = _index_tar(self.path)
+        else:
+            raise ValueError(f'Not a zip or tar archive: {self.path}')
+        return index
@@ -0,0 +1,285 @@
+"""Asyncio integration: drives a renderer from the event loop, and exposes view loads
+as awaitables rather than requiring ``ulUpdate``/``sleep`` polling loops."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import weakref
+from . import _base
+from . import _stubs
+from ._base import NULL
+from ._base import CData
+from ._base import ffi
+from ._string import get_string
+from ._string import temp_string
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+from typing import Self
+from typing import cast
+
+
+@dataclass
+class LoadError(Exception):
+    """Raised when a page fails to load (see :func:`ulViewSetFailLoadingCallback`)."""
+
+    url: str
+    description: str
+    error_domain: str
+    error_code: int
+
+    def __str__(self) -> str:
+        return (
+            f'Failed to load {self.url!r}: {self.description} '
+            f'({self.error_domain} error {self.error_code})'
+        )
+
+
+class RendererDriver:
+    """Pumps :func:`ulUpdate` for a renderer from an asyncio task, with adaptive
+    pacing.
+
+    While any :class:`AsyncView` load is pending, the renderer is updated every
+    ``min_interval`` seconds.  When idle, the interval backs off exponentially up to
+    ``max_interval``, so an idle renderer costs next to nothing.  Starting a load wakes
+    the driver immediately, so there's no polling-interval latency floor.
+
+    All Ultralight calls happen on the event loop's thread, so the callbacks that
+    resolve the loads run there too.
+
+    Example::
+
+        async with RendererDriver(renderer) as driver:
+            view = driver.create_view(800, 600)
+            await view.load_html('<h1>Hello</h1>')
+            driver.render()
+    """
+
+    def __init__(
+        self,
+        renderer: _stubs.ULRenderer,
+        *,
+        min_interval: float = 0.001,
+        max_interval: float = 0.1,
+    ) -> None:
+        self.renderer = renderer
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._wake_event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._num_pending = 0
+        self.update_count = 0
+        """The number of :func:`ulUpdate` calls made so far."""
+
+    async def __aenter__(self) -> Self:
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        """Starts the driver task on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops the driver task, if running."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def wake(self) -> None:
+        """Makes the driver update the renderer as soon as possible."""
+        self._wake_event.set()
+
+    def update(self) -> None:
+        """Updates the renderer immediately (:func:`ulUpdate`)."""
+        _stubs.ulUpdate(self.renderer)
+        self.update_count += 1
+
+    def render(self) -> None:
+        """Renders all the views (:func:`ulRender`)."""
+        _stubs.ulRender(self.renderer)
+
+    def create_view(
+        self,
+        width: int,
+        height: int,
+        *,
+        transparent: bool = False,
+        device_scale: float = 1.0,
+    ) -> AsyncView:
+        """Creates a new view, owned by the returned :class:`AsyncView`."""
+        view_config = _stubs.ulCreateViewConfig()
+        try:
+            _stubs.ulViewConfigSetIsTransparent(view_config, transparent)
+            _stubs.ulViewConfigSetInitialDeviceScale(view_config, device_scale)
+            view = _stubs.ulCreateView(self.renderer, width, height, view_config, NULL)
+        finally:
+            _stubs.ulDestroyViewConfig(view_config)
+        return AsyncView(self, view, owned=True)
+
+    def track(self, future: asyncio.Future[Any]) -> None:
+        """Keeps updating the renderer at the fastest pace until ``future`` is done
+        (e.g. a pending page load), starting right away."""
+        self._num_pending += 1
+        future.add_done_callback(self._on_done)
+        self.wake()
+
+    def _on_done(self, future: asyncio.Future[Any]) -> None:
+        del future
+        self._num_pending -= 1
+
+    async def _run(self) -> None:
+        interval = self.min_interval
+        while True:
+            self._wake_event.clear()
+            self.update()
+            if self._num_pending:
+                interval = self.min_interval
+            else:
+                interval = min(interval * 2, self.max_interval)
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(interval):
+                    await self._wake_event.wait()
+
+
+_handles: dict[int, CData] = {}
+"""The handles of the :class:`AsyncView` objects, by view address, which are kept alive
+until the views are destroyed (or replaced by another one for the same view).
+(Ultralight only keeps the handle's address, so an :class:`AsyncView` that's garbage
+collected without being destroyed would otherwise leave the view's callbacks with a
+dangling handle.)"""
+
+
+@_base.callback('void(void*, ULView, unsigned long long, _Bool, ULString)')
+def _on_finish_loading(
+    user_data: CData,
+    caller: _stubs.ULView,
+    frame_id: int,
+    is_main_frame: bool,
+    url: _stubs.ULString,
+) -> None:
+    view: AsyncView | None = ffi.from_handle(user_data)()
+    if view is not None and is_main_frame:
+        view._resolve(None)  # pylint: disable=protected-access
+
+
+@_base.callback(
+    'void(void*, ULView, unsigned long long, _Bool, ULString, ULString, ULString, int)'
+)
+def _on_fail_loading(  # pylint: disable=too-many-arguments
+    user_data: CData,
+    caller: _stubs.ULView,
+    frame_id: int,
+    is_main_frame: bool,
+    url: _stubs.ULString,
+    description: _stubs.ULString,
+    error_domain: _stubs.ULString,
+    error_code: int,
+) -> None:
+    view: AsyncView | None = ffi.from_handle(user_data)()
+    if view is not None and is_main_frame:
+        view._resolve(  # pylint: disable=protected-access
+            LoadError(
+                get_string(url),
+                get_string(description),
+                get_string(error_domain),
+                error_code,
+            )
+        )
+
+
+class AsyncView:
+    """Wraps a ``ULView`` with awaitable page loads, driven by a
+    :class:`RendererDriver`.
+
+    This takes over the view's ``FinishLoading`` and ``FailLoading`` callbacks.  Only
+    one load can be in flight at a time: starting another load cancels the previous
+    one's awaitable.
+    """
+
+    def __init__(
+        self,
+        driver: RendererDriver,
+        view: _stubs.ULView,
+        *,
+        owned: bool = False,
+    ) -> None:
+        self.driver = driver
+        self.view = view
+        self._owned = owned
+        self._future: asyncio.Future[None] | None = None
+        # (Weak, so that the handle doesn't keep the view alive in a reference cycle.)
+        self._handle = ffi.new_handle(weakref.ref(self))
+        _handles[_base.get_address(view)] = self._handle
+        _stubs.ulViewSetFinishLoadingCallback(view, _on_finish_loading, self._handle)
+        _stubs.ulViewSetFailLoadingCallback(view, _on_fail_loading, self._handle)
+
+    def destroy(self) -> None:
+        """Cancels any pending load, detaches the callbacks, and destroys the view if
+        it's owned by this object."""
+        self._cancel()
+        _stubs.ulViewSetFinishLoadingCallback(self.view, cast(Any, NULL), NULL)
+        _stubs.ulViewSetFailLoadingCallback(self.view, cast(Any, NULL), NULL)
+        key = _base.get_address(self.view)
+        if _handles.get(key) is self._handle:
+            del _handles[key]
+        if self._owned:
+            _stubs.ulDestroyView(self.view)
+            self._owned = False
+
+    async def load_html(self, html: str) -> None:
+        """Loads an HTML string, and waits until it's finished loading.
+
+        Raises:
+            :class:`LoadError`: If the page fails to load.
+        """
+        with temp_string(html) as html_string:
+            future = self._load(_stubs.ulViewLoadHTML, html_string)
+        await future
+
+    async def load_url(self, url: str) -> None:
+        """Loads a URL, and waits until it's finished loading.
+
+        Raises:
+            :class:`LoadError`: If the page fails to load.
+        """
+        with temp_string(url) as url_string:
+            future = self._load(_stubs.ulViewLoadURL, url_string)
+        await future
+
+    def _load(
+        self,
+        load_func: Callable[[_stubs.ULView, _stubs.ULString], None],
+        string: _stubs.ULString,
+    ) -> asyncio.Future[None]:
+        self._cancel()
+        future = asyncio.get_running_loop().create_future()
+        self._future = future
+        self.driver.track(future)
+        load_func(self.view, string)
+        return future
+
+    def _resolve(self, error: LoadError | None) -> None:
+        future, self._future = self._future, None
+        if future is not None and not future.done():
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+    def _cancel(self) -> None:
+        future, self._future = self._future, None
+        if future is not None:
+            future.cancel()
@@ -1,22 +1,59 @@
 from __future__ import annotations
 
 import _cffi_backend
+import functools
+import importlib
 import logging
+import os
 import pathlib
 import platform
-from ._bindings import ffi
+import sys
+import types
+from . import _bindings
 from cffi import FFI
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Generic
+from typing import Literal
 from typing import TypeAlias
 from typing import TypeVar
+from typing import cast
 from typing import overload
 
 _T = TypeVar('_T')
 
 
+def _import_api_bindings() -> types.ModuleType | None:
+    """Imports the optional, compiled API-mode bindings (``_bindings_api``) if they've
+    been built (see ``scripts/_build.py --api``), or returns ``None`` otherwise.
+
+    The extension leaves the Ultralight symbols unresolved, so it's imported with lazy
+    symbol binding; the symbols are then resolved on first call, once :func:`load` has
+    loaded the shared libraries into the global namespace.
+    """
+    module: types.ModuleType | None
+    flags = sys.getdlopenflags() if hasattr(sys, 'getdlopenflags') else None
+    if flags is not None:
+        sys.setdlopenflags((flags & ~os.RTLD_NOW) | os.RTLD_LAZY)
+    try:
+        module = importlib.import_module('._bindings_api', __package__)
+    except ImportError:
+        module = None
+    finally:
+        if flags is not None:
+            sys.setdlopenflags(flags)
+    return module
+
+
+_api_bindings = _import_api_bindings()
+
+# Note: CFFI types from different `FFI` instances are incompatible with each other, so
+# when the API-mode extension is available, its `ffi` is used across the board - even
+# with the ABI-mode backend, since `ffi.dlopen` works the same with either one.
+ffi: _cffi_backend.FFI = _bindings.ffi if _api_bindings is None else _api_bindings.ffi
+
+
 class Pointer(Generic[_T]):
     if TYPE_CHECKING:
 
@@ -96,13 +133,29 @@ Adjust this as desired by setting the log level::
 
 Lib: TypeAlias = _cffi_backend.Lib
 
+Backend: TypeAlias = Literal['auto', 'abi', 'api', 'fake']
+"""Selects how :func:`load` binds the Ultralight functions:
+
+* ``'abi'``: Out-of-line ABI mode, via ``ffi.dlopen`` and libffi (no compiler needed).
+* ``'api'``: The optional, compiled API-mode extension, with direct C calls.
+* ``'auto'``: API mode if the extension is available, or ABI mode otherwise.
+* ``'fake'``: A pure-Python stand-in for the shared libraries, for testing and
+  benchmarking without the SDK; see :class:`ultralight_cffi._fake.FakeLib`.
+"""
+
 _lib: Lib | None = None
 
+_api_callbacks = _api_bindings is not None
+"""Whether the callbacks that have compiled ``extern "Python"`` counterparts (i.e. the
+:class:`CustomSurface` ones) use those, rather than ``ffi.callback`` closures: i.e.
+whether the API-mode backend was loaded (or, before :func:`load` selects a backend,
+whether it's available)."""
+
 
 def _get_library_names() -> list[str]:
     """Determine the shared library names based on the platform."""
-    sys = platform.system()
-    match sys:
+    system = platform.system()
+    match system:
         case 'Darwin':
             names = _DARWIN_LIBRARY_NAMES
         case 'Linux':
@@ -110,23 +163,67 @@ def _get_library_names() -> list[str]:
         case 'Windows':
             names = _WINDOWS_LIBRARY_NAMES
         case _:
-            raise RuntimeError(f'Unsupported platform: {sys}')
+            raise RuntimeError(f'Unsupported platform: {system}')
     return names
 
 
 def _load_lib(
     library_name: str,
     library_path: pathlib.Path | None = None,
+    flags: int | None = None,
 ) -> Lib:
     """Loads a single Ultralight shared library file using FFI's ``dlopen`` wrapper."""
     if library_path is not None:
         library_name = str(library_path / library_name)
     logger.debug('Loading shared library: %s', library_name)
-    return ffi.dlopen(library_name)
+    return (
+        ffi.dlopen(library_name) if flags is None else ffi.dlopen(library_name, flags)
+    )
+
+
+def _get_missing_symbols(lib: Lib) -> list[str]:
+    """Determines which of the declared Ultralight functions can't be found in the
+    loaded libraries.
+
+    The API-mode extension binds its symbols lazily, and a missing symbol would abort
+    the whole process on first call rather than raising an exception, so it's only used
+    if everything checks out up front.
+    """
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from . import _stubs
+
+    return sorted(
+        name
+        for name in _stubs._symbols.functions  # pylint: disable=protected-access
+        if not hasattr(lib, name)
+    )
+
+
+def _bind_stubs(lib: Lib | None) -> None:
+    """Rebinds the generated ``_stubs`` wrapper functions to the raw CFFI function
+    objects of ``lib`` - or restores the original wrappers if ``lib`` is ``None``.
+
+    Each generated wrapper calls :func:`get_lib` and then looks up the function on the
+    CFFI ``Lib`` for every single call.  Replacing the module-level wrappers (in both
+    ``_stubs`` and the package namespace that re-exports them) with the resolved CFFI
+    function objects eliminates that overhead entirely.  The annotated ``_stubs.pyi``
+    remains the source of truth for static type checking.
+
+    Symbols that can't be resolved in ``lib`` (e.g. due to an SDK version mismatch)
+    keep their original wrapper, which raises at call time as usual.
+    """
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from . import _stubs
+
+    package = importlib.import_module(__package__)
+    _stubs._symbols.bind(lib, vars(package))  # pylint: disable=protected-access
 
 
 def load(
     library_path: pathlib.Path | str | None = None,
+    *,
+    backend: Backend = 'auto',
+    direct_bind: bool = False,
 ) -> Lib:
     """Loads the Ultralight shared libraries, and returns a combined FFI interface.
 
@@ -137,25 +234,126 @@ def load(
     symbols into the process namespace, and the FFI interface doesn't care which shared
     library provides which individual symbols.
 
+    ``backend`` selects between the ABI-mode bindings and the optional, compiled
+    API-mode bindings; see :data:`Backend`.  With ``'auto'``, the API-mode bindings are
+    used if they've been built and all the declared symbols are present in the loaded
+    libraries, and otherwise it falls back to ABI mode.
+
+    If ``direct_bind`` is true, the annotated wrapper functions exposed at the package
+    level (e.g. ``ultralight_cffi.ulUpdate``) are replaced with the raw CFFI function
+    objects, which removes the per-call :func:`get_lib` overhead for hot calls.  See
+    :func:`_bind_stubs`.  Calling :func:`load` again without ``direct_bind`` restores
+    the original wrappers.
+
     Warning:
         The libraries are loaded using FFI's ``dlopen`` wrapper but no attempt is made
         to subsequently close the libraries with ``dlclose``. This could be improved
         in the future.
+
+    Warning:
+        Direct binding only affects lookups made *after* :func:`load` returns;
+        references obtained beforehand via ``from ultralight_cffi import ulUpdate``
+        keep pointing at the original wrapper.
+
+    Raises:
+        :class:`RuntimeError`: If ``backend`` is ``'api'`` but the API-mode bindings
+        aren't available or usable.
     """
 
     if isinstance(library_path, str):
         library_path = pathlib.Path(library_path)
 
+    global _lib, _api_callbacks  # FIXME/TMP  # pylint: disable=global-statement
+    if backend == 'fake':
+        _lib = _create_fake_lib()
+        _api_callbacks = _api_bindings is not None
+    else:
+        _lib = _load_libs(library_path, backend)
+        _api_callbacks = _api_bindings is not None and _lib is _api_bindings.lib
+
+    _bind_stubs(_lib if direct_bind else None)
+
+    return _lib
+
+
+def _create_fake_lib() -> Lib:
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from . import _fake
+
+    logger.debug('Using fake Ultralight library')
+    return cast(Lib, _fake.get_instance())
+
+
+def _load_libs(library_path: pathlib.Path | None, backend: Backend) -> Lib:
+    """Loads the actual shared libraries for :func:`load`."""
+    if backend == 'api' and _api_bindings is None:
+        raise RuntimeError(
+            'API-mode bindings are not available; build them with '
+            '`scripts/_build.py --api`.'
+        )
+    use_api = backend != 'abi' and _api_bindings is not None
+
+    # The API-mode extension resolves its symbols from the global namespace:
+    flags = os.RTLD_NOW | os.RTLD_GLOBAL if use_api else None
+
     # Note: Slightly kludgy to retain only the last library object, but this has the
     # benefit of providing a single, consolidated interface, rather than making
     # separate FFI bindings for each shared library.
     library_names = _get_library_names()
-    libs = [_load_lib(library_name, library_path) for library_name in library_names]
-
-    global _lib  # FIXME/TMP  # pylint: disable=global-statement
-    _lib = libs[-1]
-
-    return _lib
+    libs = [
+        _load_lib(library_name, library_path, flags) for library_name in library_names
+    ]
+
+    lib = libs[-1]
+
+    if use_api:
+        assert _api_bindings is not None
+        missing_symbols = _get_missing_symbols(lib)
+        if not missing_symbols:
+            logger.debug('Using API-mode bindings')
+            lib = _api_bindings.lib
+        elif backend == 'api':
+            raise RuntimeError(
+                'Unable to use API-mode bindings; missing symbols: '
+                + ', '.join(missing_symbols)
+            )
+        else:
+            logger.warning(
+                'Falling back to ABI-mode bindings; missing symbols: %s',
+                ', '.join(missing_symbols),
+            )
+
+    return lib
+
+
+def get_api_bindings() -> types.ModuleType | None:
+    """Returns the compiled API-mode bindings module, if available."""
+    return _api_bindings
+
+
+def uses_api_callbacks() -> bool:
+    """Returns whether the :class:`CustomSurface` callbacks are the compiled
+    ``extern "Python"`` functions of the API-mode bindings, which follows the backend
+    selected by :func:`load`."""
+    return _api_callbacks
+
+
+@functools.cache
+def get_numpy() -> types.ModuleType | None:
+    """Imports NumPy on first use (since it's slow to import), or returns ``None`` if
+    it isn't installed (it's optional)."""
+    module: types.ModuleType | None
+    try:
+        module = importlib.import_module('numpy')
+    except ImportError:
+        module = None
+    return module
+
+
+def get_address(ptr: Any) -> int:
+    """Returns the address that a CFFI pointer (e.g. a ``ULView``, or callback user
+    data) points to, for keying registries by the underlying object."""
+    return int(ffi.cast('uintptr_t', ptr))
 
 
 def get_lib() -> Lib:
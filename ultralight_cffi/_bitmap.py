@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import contextlib
+from . import _stubs
+from ._base import ffi
+from ._base import get_numpy
+from collections.abc import Iterator
+from typing import Any
+from typing_extensions import Buffer
+
+
+@contextlib.contextmanager
+def bitmap_pixels(bitmap: _stubs.ULBitmap) -> Iterator[Any]:
+    """Locks a bitmap's pixels, and provides zero-copy access to them for the duration
+    of the ``with`` block.
+
+    If NumPy is installed, this yields a ``(height, width, bpp)`` ``uint8`` array (i.e.
+    ``(height, width, 4)`` for BGRA bitmaps) that wraps the pixel memory directly,
+    using the bitmap's row stride (:func:`ulBitmapGetRowBytes`), so any padding at the
+    end of each row is skipped.  Otherwise it yields a ``(height, row_bytes)``
+    :class:`memoryview`.
+
+    The bitmap is unlocked when the block exits, after which the pixels must no longer
+    be accessed: the memoryview is released (so further access raises
+    :class:`ValueError`), and the NumPy array is made read-only as a best effort,
+    since NumPy doesn't support revoking access to a borrowed buffer.  Copy the array
+    (e.g. ``pixels.copy()``) to keep the data around.
+
+    Example::
+
+        with bitmap_pixels(bitmap) as pixels:
+            top_left_bgra = pixels[0, 0].tobytes()
+    """
+    width = _stubs.ulBitmapGetWidth(bitmap)
+    height = _stubs.ulBitmapGetHeight(bitmap)
+    bpp = _stubs.ulBitmapGetBpp(bitmap)
+    row_bytes = _stubs.ulBitmapGetRowBytes(bitmap)
+    ptr = _stubs.ulBitmapLockPixels(bitmap)
+    try:
+        with wrap_pixels(
+            ffi.buffer(ptr, row_bytes * height), width, height, bpp, row_bytes
+        ) as pixels:
+            yield pixels
+    finally:
+        _stubs.ulBitmapUnlockPixels(bitmap)
+
+
+@contextlib.contextmanager
+def wrap_pixels(
+    buffer: Buffer,
+    width: int,
+    height: int,
+    bpp: int,
+    row_bytes: int,
+) -> Iterator[Any]:
+    """Provides zero-copy access to pixel memory for the duration of the ``with``
+    block, as a ``(height, width, bpp)`` NumPy array or ``(height, row_bytes)``
+    :class:`memoryview`; see :func:`bitmap_pixels`."""
+    view = (
+        memoryview(buffer)
+        .cast('B')[: row_bytes * height]
+        .cast('B', (height, row_bytes))
+    )
+    np = get_numpy()
+    try:
+        if np is None:
+            yield view
+        else:
+            array = np.ndarray(
+                (height, width, bpp),
+                dtype=np.uint8,
+                buffer=view,
+                strides=(row_bytes, bpp, 1),
+            )
+            try:
+                yield array
+            finally:
+                array.flags.writeable = False
+    finally:
+        # (Fails with `BufferError` if the NumPy array is still alive; that's fine.)
+        with contextlib.suppress(BufferError):
+            view.release()
@@ -0,0 +1,170 @@
+"""Per-view capture of console messages (see :func:`ulViewSetAddConsoleMessageCallback`)
+into bounded ring buffers."""
+
+from __future__ import annotations
+
+import collections
+import weakref
+from . import _base
+from . import _stubs
+from ._base import NULL
+from ._base import CData
+from ._base import ffi
+from ._string import get_string_bytes
+from collections.abc import Iterator
+from types import TracebackType
+from typing import Any
+from typing import NamedTuple
+from typing import Self
+from typing import cast
+
+_SEVERITIES = (1, 2, 3, 0, 1)
+"""The relative severity of each ``ULMessageLevel`` (log, warning, error, debug and
+info), for filtering."""
+
+
+def _get_severity(level: int) -> int:
+    return _SEVERITIES[level] if 0 <= level < len(_SEVERITIES) else 1
+
+
+class ConsoleMessage(NamedTuple):
+    """A console message recorded by a :class:`ConsoleCollector`.
+
+    The strings are kept as UTF-8 bytes, and only decoded when :attr:`message` or
+    :attr:`source_id` are read.
+    """
+
+    source: int
+    """A ``ULMessageSource``; e.g. ``kMessageSource_ConsoleAPI``."""
+    level: int
+    """A ``ULMessageLevel``; e.g. ``kMessageLevel_Error``."""
+    message_bytes: bytes
+    line: int
+    column: int
+    source_id_bytes: bytes
+
+    @property
+    def message(self) -> str:
+        return self.message_bytes.decode(errors='replace')
+
+    @property
+    def source_id(self) -> str:
+        """Typically the URL of the script that logged the message."""
+        return self.source_id_bytes.decode(errors='replace')
+
+
+class ConsoleCollector:
+    """Records a view's console messages in a ring buffer of the most recent
+    ``capacity`` messages.
+
+    This takes over the view's ``AddConsoleMessage`` callback, which does as little as
+    possible per message: messages less severe than ``min_level`` (a
+    ``ULMessageLevel``, with debug < log = info < warning < error) are dropped before
+    any Python string is built, and the rest are copied as raw bytes (see
+    :class:`ConsoleMessage`).
+
+    Example::
+
+        min_level = ultralight_cffi.kMessageLevel_Warning
+        with ConsoleCollector(view, min_level=min_level) as console:
+            ...
+            for message in console:
+                print(f'{message.source_id}:{message.line}: {message.message}')
+    """
+
+    def __init__(
+        self,
+        view: _stubs.ULView,
+        *,
+        capacity: int = 1000,
+        min_level: int | None = None,
+    ) -> None:
+        self.view = view
+        self.messages: collections.deque[ConsoleMessage] = collections.deque(
+            maxlen=capacity
+        )
+        self.min_severity = 0 if min_level is None else _get_severity(min_level)
+        self.num_received = 0
+        """The number of messages received, including filtered and evicted ones."""
+        self.num_filtered = 0
+        """The number of messages dropped for being below ``min_level``."""
+        # (Weak, so that the handle doesn't keep the collector alive in a cycle.)
+        self._handle = ffi.new_handle(weakref.ref(self))
+        self._attached = True
+        _handles[_base.get_address(view)] = self._handle
+        _stubs.ulViewSetAddConsoleMessageCallback(
+            view, _on_add_console_message, self._handle
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.detach()
+
+    def __iter__(self) -> Iterator[ConsoleMessage]:
+        return iter(self.messages)
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def detach(self) -> None:
+        """Stops recording (clearing the view's callback); the recorded messages are
+        kept."""
+        if self._attached:
+            _stubs.ulViewSetAddConsoleMessageCallback(self.view, cast(Any, NULL), NULL)
+            key = _base.get_address(self.view)
+            if _handles.get(key) is self._handle:
+                del _handles[key]
+            self._attached = False
+
+    def drain(self) -> list[ConsoleMessage]:
+        """Returns the recorded messages, and clears them."""
+        messages = list(self.messages)
+        self.messages.clear()
+        return messages
+
+
+_handles: dict[int, CData] = {}
+"""The handles of the attached collectors, by view address, which are kept alive until
+the collectors are detached (or replaced by another one for the same view).  (Ultralight
+only keeps the handle's address, so a collector that's garbage collected without being
+detached would otherwise leave the view's callback with a dangling handle.)"""
+
+
+@_base.callback(
+    'void(void*, ULView, ULMessageSource, ULMessageLevel, ULString, unsigned int, '
+    'unsigned int, ULString)'
+)
+def _on_add_console_message(  # pylint: disable=too-many-arguments
+    user_data: CData,
+    caller: _stubs.ULView,
+    source: int,
+    level: int,
+    message: _stubs.ULString,
+    line_number: int,
+    column_number: int,
+    source_id: _stubs.ULString,
+) -> None:
+    collector: ConsoleCollector | None = ffi.from_handle(user_data)()
+    if collector is not None:
+        collector.num_received += 1
+        if _get_severity(level) < collector.min_severity:
+            collector.num_filtered += 1
+        else:
+            # (The strings only live as long as the callback, so copy them now.)
+            collector.messages.append(
+                ConsoleMessage(
+                    source,
+                    level,
+                    get_string_bytes(message),
+                    line_number,
+                    column_number,
+                    get_string_bytes(source_id),
+                )
+            )
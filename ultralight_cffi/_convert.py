@@ -0,0 +1,379 @@
+"""Pixel format conversions for 32-bit BGRA/RGBA pixel data, as produced by bitmaps
+and surfaces.
+
+Each conversion takes any buffer-protocol object (``bytes``, ``bytearray``,
+:class:`memoryview`, NumPy arrays, ``ffi.buffer``, etc.) along with the image
+dimensions and row stride (``row_bytes``), so padded rows are handled correctly.  The
+result is written to ``out`` if given - which may be ``pixels`` itself, to convert in
+place - or to a new, tightly packed :class:`bytearray` otherwise, and returned.
+
+NumPy is used if it's installed; otherwise a pure-Python fallback based on slice
+assignment (and lookup tables, for the alpha conversions) is used, which is slower but
+still far faster than per-pixel loops for typical, mostly opaque content.
+"""
+
+import functools
+import re
+from ._base import get_numpy
+from collections.abc import Callable
+from typing import Any
+from typing import cast
+from typing_extensions import Buffer
+
+_BPP = 4
+_ALPHA = 3
+
+_ALPHA_RUN_PATTERN = re.compile(rb'(.)\1*', re.DOTALL)
+
+
+def _get_out_row_bytes(
+    pixels: Buffer,
+    out: Buffer | None,
+    out_row_bytes: int | None,
+    row_bytes: int,
+    packed_row_bytes: int,
+) -> int:
+    """Determines the output row stride: the same as the input's for in-place
+    conversions, or tightly packed otherwise, unless specified."""
+    if out_row_bytes is None:
+        out_row_bytes = row_bytes if out is pixels else packed_row_bytes
+    return out_row_bytes
+
+
+def _convert(  # pylint: disable=too-many-arguments
+    pixels: Buffer,
+    width: int,
+    height: int,
+    row_bytes: int | None,
+    out: Buffer | None,
+    out_row_bytes: int | None,
+    out_channels: int,
+    numpy_func: Callable[[Any, Any], None],
+    python_func: Callable[[memoryview, memoryview, int], None],
+) -> Buffer:
+    """Runs a conversion row-wise on buffers of the given strides, with either
+    ``numpy_func(src, dst)`` on ``(height, width, channels)`` arrays, or
+    ``python_func(src_row, dst_row, width)`` on each row's memoryview."""
+    if row_bytes is None:
+        row_bytes = width * _BPP
+    out_row_bytes = _get_out_row_bytes(
+        pixels, out, out_row_bytes, row_bytes, width * out_channels
+    )
+    if out is None:
+        out = bytearray(out_row_bytes * height)
+    src = memoryview(pixels).cast('B')
+    dst = memoryview(out).cast('B')
+    if dst.readonly:
+        raise ValueError('Output buffer is read-only')
+    if len(src) < row_bytes * (height - 1) + width * _BPP:
+        raise ValueError(f'Input buffer too small for {width}x{height} pixels')
+    if len(dst) < out_row_bytes * (height - 1) + width * out_channels:
+        raise ValueError(f'Output buffer too small for {width}x{height} pixels')
+
+    np = get_numpy()
+    if height <= 0 or width <= 0:
+        pass
+    elif np is not None:
+        numpy_func(
+            np.ndarray(
+                (height, width, _BPP),
+                dtype=np.uint8,
+                buffer=src,
+                strides=(row_bytes, _BPP, 1),
+            ),
+            np.ndarray(
+                (height, width, out_channels),
+                dtype=np.uint8,
+                buffer=dst,
+                strides=(out_row_bytes, out_channels, 1),
+            ),
+        )
+    elif row_bytes == width * _BPP and out_row_bytes == width * out_channels:
+        # Tightly packed, so the whole image can be processed as a single "row":
+        python_func(
+            src[: row_bytes * height], dst[: out_row_bytes * height], width * height
+        )
+    else:
+        for y in range(height):
+            python_func(
+                src[y * row_bytes : y * row_bytes + width * _BPP],
+                dst[y * out_row_bytes : y * out_row_bytes + width * out_channels],
+                width,
+            )
+    return out
+
+
+def _copy_numpy(src: Any, dst: Any) -> None:
+    dst[...] = src
+
+
+def _copy_python(src: memoryview, dst: memoryview, width: int) -> None:
+    del width
+    dst[:] = src
+
+
+def copy_pixels(
+    pixels: Buffer,
+    width: int,
+    height: int,
+    row_bytes: int | None = None,
+    *,
+    out: Buffer | None = None,
+    out_row_bytes: int | None = None,
+) -> Buffer:
+    """Copies 32-bit pixels as they are, e.g. to repack them with a different row
+    stride, or into part of a larger image.
+
+    ``row_bytes`` defaults to ``width * 4``.  ``out_row_bytes`` defaults to
+    ``width * 4`` too, so by default, the copy is tightly packed.
+    """
+    return _convert(
+        pixels,
+        width,
+        height,
+        row_bytes,
+        out,
+        out_row_bytes,
+        _BPP,
+        _copy_numpy,
+        _copy_python,
+    )
+
+
+def _swap_red_blue_numpy(src: Any, dst: Any) -> None:
+    dst[...] = src[..., [2, 1, 0, 3]]  # (fancy indexing copies, so aliasing is fine)
+
+
+def _swap_red_blue_python(src: memoryview, dst: memoryview, width: int) -> None:
+    del width
+    red, blue = bytes(src[2::4]), bytes(src[0::4])
+    dst[1::4] = src[1::4]
+    dst[3::4] = src[3::4]
+    dst[0::4] = red
+    dst[2::4] = blue
+
+
+def bgra_to_rgba(
+    pixels: Buffer,
+    width: int,
+    height: int,
+    row_bytes: int | None = None,
+    *,
+    out: Buffer | None = None,
+    out_row_bytes: int | None = None,
+) -> Buffer:
+    """Converts BGRA pixels to RGBA (or vice versa) by swapping the red and blue
+    channels.
+
+    ``row_bytes`` defaults to ``width * 4``.  See the module docstring regarding
+    ``out``; ``out_row_bytes`` defaults to ``row_bytes`` for in-place conversions, or
+    to ``width * 4`` otherwise.
+    """
+    return _convert(
+        pixels,
+        width,
+        height,
+        row_bytes,
+        out,
+        out_row_bytes,
+        _BPP,
+        _swap_red_blue_numpy,
+        _swap_red_blue_python,
+    )
+
+
+rgba_to_bgra = bgra_to_rgba
+
+
+def _drop_alpha_numpy(src: Any, dst: Any) -> None:
+    dst[...] = src[..., :3]
+
+
+def _drop_alpha_python(src: memoryview, dst: memoryview, width: int) -> None:
+    del width
+    dst[0::3] = src[0::4]
+    dst[1::3] = src[1::4]
+    dst[2::3] = src[2::4]
+
+
+def _swap_red_blue_drop_alpha_numpy(src: Any, dst: Any) -> None:
+    dst[...] = src[..., [2, 1, 0]]
+
+
+def _swap_red_blue_drop_alpha_python(
+    src: memoryview,
+    dst: memoryview,
+    width: int,
+) -> None:
+    del width
+    dst[0::3] = src[2::4]
+    dst[1::3] = src[1::4]
+    dst[2::3] = src[0::4]
+
+
+def drop_alpha(  # pylint: disable=too-many-arguments
+    pixels: Buffer,
+    width: int,
+    height: int,
+    row_bytes: int | None = None,
+    *,
+    swap_red_blue: bool = False,
+    out: Buffer | None = None,
+    out_row_bytes: int | None = None,
+) -> Buffer:
+    """Converts 4-channel BGRA/RGBA pixels to 3-channel BGR/RGB by dropping the alpha
+    channel, and optionally swapping the red and blue channels too (e.g. BGRA to RGB).
+
+    Unlike the other conversions, this can't be done in place.  ``out_row_bytes``
+    defaults to ``width * 3``.
+    """
+    if out is not None and out is pixels:
+        raise ValueError('Unable to drop alpha channel in place')
+    return _convert(
+        pixels,
+        width,
+        height,
+        row_bytes,
+        out,
+        out_row_bytes,
+        3,
+        _swap_red_blue_drop_alpha_numpy if swap_red_blue else _drop_alpha_numpy,
+        _swap_red_blue_drop_alpha_python if swap_red_blue else _drop_alpha_python,
+    )
+
+
+def bgra_to_rgb(
+    pixels: Buffer,
+    width: int,
+    height: int,
+    row_bytes: int | None = None,
+    *,
+    out: Buffer | None = None,
+    out_row_bytes: int | None = None,
+) -> Buffer:
+    """Converts BGRA pixels to RGB; see :func:`drop_alpha`."""
+    return drop_alpha(
+        pixels,
+        width,
+        height,
+        row_bytes,
+        swap_red_blue=True,
+        out=out,
+        out_row_bytes=out_row_bytes,
+    )
+
+
+@functools.cache
+def _get_premultiply_table(alpha: int) -> bytes:
+    return bytes((value * alpha + 127) // 255 for value in range(256))
+
+
+@functools.cache
+def _get_unpremultiply_table(alpha: int) -> bytes:
+    return bytes(
+        min(255, (value * 255 + alpha // 2) // alpha) if alpha else 0
+        for value in range(256)
+    )
+
+
+def _convert_alpha_python(
+    src: memoryview,
+    dst: memoryview,
+    width: int,
+    get_table: Callable[[int], bytes],
+) -> None:
+    """Maps each color channel through the lookup table for the pixel's alpha value,
+    one run of equal alpha values at a time, so that large uniform regions (e.g.
+    transparent backgrounds) are converted with a handful of C-level ``translate``
+    calls rather than per-pixel."""
+    dst[:] = src
+    alphas = bytes(src[_ALPHA::_BPP])
+    if alphas.count(255) == width:
+        return  # (fully opaque, which is a no-op for both directions)
+    for run in _ALPHA_RUN_PATTERN.finditer(alphas):
+        alpha = alphas[run.start()]
+        if alpha != 255:
+            table = get_table(alpha)
+            start = run.start() * _BPP
+            end = run.end() * _BPP
+            for channel in range(_ALPHA):
+                channel_slice = slice(start + channel, end, _BPP)
+                dst[channel_slice] = bytes(dst[channel_slice]).translate(table)
+
+
+def _premultiply_alpha_numpy(src: Any, dst: Any) -> None:
+    np = cast(Any, get_numpy())
+    alpha = src[..., _ALPHA:].astype(np.uint16)
+    colors = (src[..., :_ALPHA] * alpha + 127) // 255
+    dst[..., _ALPHA:] = src[..., _ALPHA:]
+    dst[..., :_ALPHA] = colors
+
+
+def _premultiply_alpha_python(src: memoryview, dst: memoryview, width: int) -> None:
+    _convert_alpha_python(src, dst, width, _get_premultiply_table)
+
+
+def premultiply_alpha(
+    pixels: Buffer,
+    width: int,
+    height: int,
+    row_bytes: int | None = None,
+    *,
+    out: Buffer | None = None,
+    out_row_bytes: int | None = None,
+) -> Buffer:
+    """Converts straight-alpha BGRA/RGBA pixels to premultiplied alpha.
+
+    See :func:`bgra_to_rgba` regarding the arguments.
+    """
+    return _convert(
+        pixels,
+        width,
+        height,
+        row_bytes,
+        out,
+        out_row_bytes,
+        _BPP,
+        _premultiply_alpha_numpy,
+        _premultiply_alpha_python,
+    )
+
+
+def _unpremultiply_alpha_numpy(src: Any, dst: Any) -> None:
+    np = cast(Any, get_numpy())
+    alpha = src[..., _ALPHA:].astype(np.uint32)
+    colors = (src[..., :_ALPHA] * np.uint32(255) + alpha // 2) // np.maximum(alpha, 1)
+    colors = np.where(alpha == 0, 0, np.minimum(colors, 255))
+    dst[..., _ALPHA:] = src[..., _ALPHA:]
+    dst[..., :_ALPHA] = colors
+
+
+def _unpremultiply_alpha_python(src: memoryview, dst: memoryview, width: int) -> None:
+    _convert_alpha_python(src, dst, width, _get_unpremultiply_table)
+
+
+def unpremultiply_alpha(
+    pixels: Buffer,
+    width: int,
+    height: int,
+    row_bytes: int | None = None,
+    *,
+    out: Buffer | None = None,
+    out_row_bytes: int | None = None,
+) -> Buffer:
+    """Converts premultiplied-alpha BGRA/RGBA pixels (as rendered by Ultralight) to
+    straight alpha.
+
+    See :func:`bgra_to_rgba` regarding the arguments.
+    """
+    return _convert(
+        pixels,
+        width,
+        height,
+        row_bytes,
+        out,
+        out_row_bytes,
+        _BPP,
+        _unpremultiply_alpha_numpy,
+        _unpremultiply_alpha_python,
+    )
@@ -0,0 +1,160 @@
+"""Incremental frame extraction, which copies (and converts) only the parts of a surface
+that were repainted, as reported by :func:`ulSurfaceGetDirtyBounds`."""
+
+from __future__ import annotations
+
+from . import _convert
+from . import _stubs
+from ._base import ffi
+from ._memory_surface import RingBufferSurface
+from collections.abc import Callable
+from typing import Literal
+from typing import NamedTuple
+from typing_extensions import Buffer
+
+_BPP = 4
+
+PixelMode = Literal['bgra', 'rgba', 'bgr', 'rgb']
+
+_CONVERSIONS: dict[str, tuple[int, Callable[..., Buffer]]] = {
+    'bgra': (4, _convert.copy_pixels),
+    'rgba': (4, _convert.bgra_to_rgba),
+    'bgr': (3, _convert.drop_alpha),
+    'rgb': (3, _convert.bgra_to_rgb),
+}
+"""The number of channels and the conversion from BGRA, by :data:`PixelMode`."""
+
+
+class DirtyRect(NamedTuple):
+    """A rectangle of pixels, with exclusive right and bottom edges (like
+    ``ULIntRect``)."""
+
+    left: int
+    top: int
+    right: int
+    bottom: int
+
+    @property
+    def width(self) -> int:
+        return max(self.right - self.left, 0)
+
+    @property
+    def height(self) -> int:
+        return max(self.bottom - self.top, 0)
+
+    def is_empty(self) -> bool:
+        """Returns whether the rectangle contains no pixels."""
+        return not self.width or not self.height
+
+
+class FrameExtractor:
+    """Keeps a persistent, tightly packed destination :attr:`image` (in the pixel
+    ``mode``) up to date with a surface, by copying only its dirty rectangle after each
+    render - so that for mostly static content (e.g. a blinking caret), the per-frame
+    work is proportional to what changed, rather than to the size of the surface.
+
+    :meth:`extract` returns the rectangle it copied, so that downstream encoders can
+    do partial updates too.  The whole surface is copied the first time, and whenever
+    its size changes (for a :class:`RingBufferSurface`, once a frame of the new size
+    has been painted - until then, the rectangle is empty).
+
+    Each surface needs its own extractor, and nothing else may clear the surface's
+    dirty bounds in between (since the changes would be missed).  For a
+    :class:`RingBufferSurface`, the pixels are read from its latest frame rather than
+    by locking the surface, so that extracting doesn't publish a frame itself.
+
+    Example::
+
+        extractor = FrameExtractor('rgba')
+        while True:
+            ulUpdate(renderer)
+            ulRender(renderer)
+            rect = extractor.extract(ulViewGetSurface(view))
+            if not rect.is_empty():
+                send_update(extractor.image, extractor.row_bytes, rect)
+    """
+
+    def __init__(self, mode: PixelMode = 'rgba') -> None:
+        if mode not in _CONVERSIONS:
+            raise ValueError(f'Unsupported pixel mode: {mode!r}')
+        self.mode = mode
+        self.channels, self._conversion = _CONVERSIONS[mode]
+        self.image = bytearray()
+        """The latest frame: ``height`` rows of ``row_bytes`` bytes."""
+        self.width = 0
+        self.height = 0
+        self._copy_all = True
+        self.num_pixels_copied = 0
+        """The total number of pixels copied, across all extractions."""
+
+    @property
+    def row_bytes(self) -> int:
+        """The row stride of :attr:`image`."""
+        return self.width * self.channels
+
+    def extract(self, surface: _stubs.ULSurface) -> DirtyRect:
+        """Copies the surface's dirty rectangle into :attr:`image`, clears the
+        surface's dirty bounds (:func:`ulSurfaceClearDirtyBounds`), and returns the
+        rectangle, clipped to the surface (which is empty if nothing changed)."""
+        width = _stubs.ulSurfaceGetWidth(surface)
+        height = _stubs.ulSurfaceGetHeight(surface)
+        if (width, height) != (self.width, self.height):
+            self.width = width
+            self.height = height
+            self.image = bytearray(self.row_bytes * height)
+            self._copy_all = True
+        if self._copy_all:
+            rect = DirtyRect(0, 0, width, height)
+        else:
+            bounds = _stubs.ulSurfaceGetDirtyBounds(surface)
+            rect = DirtyRect(
+                max(bounds.left, 0),
+                max(bounds.top, 0),
+                min(bounds.right, width),
+                min(bounds.bottom, height),
+            )
+        if rect.is_empty() or not self._copy(surface, rect):
+            rect = DirtyRect(0, 0, 0, 0)
+        else:
+            self._copy_all = False
+        _stubs.ulSurfaceClearDirtyBounds(surface)
+        return rect
+
+    def _copy(self, surface: _stubs.ULSurface, rect: DirtyRect) -> bool:
+        """Returns whether the rectangle was copied."""
+        ring_buffer_surface = RingBufferSurface.find(surface)
+        copied = True
+        if ring_buffer_surface is None:
+            row_bytes = _stubs.ulSurfaceGetRowBytes(surface)
+            ptr = _stubs.ulSurfaceLockPixels(surface)
+            try:
+                self._convert(ffi.buffer(ptr, row_bytes * self.height), row_bytes, rect)
+            finally:
+                _stubs.ulSurfaceUnlockPixels(surface)
+        else:
+            # (Unlocking would publish a spurious frame, so read the latest one instead;
+            # if there isn't one of the current size, nothing's been painted since the
+            # surface was resized, so there's nothing to copy yet.)
+            copied = False
+            with ring_buffer_surface.latest_frame() as frame:
+                if frame is not None and (frame.width, frame.height) == (
+                    self.width,
+                    self.height,
+                ):
+                    self._convert(frame.pixels, frame.row_bytes, rect)
+                    copied = True
+        return copied
+
+    def _convert(self, pixels: Buffer, row_bytes: int, rect: DirtyRect) -> None:
+        src = memoryview(pixels)
+        self._conversion(
+            src[rect.top * row_bytes + rect.left * _BPP :],
+            rect.width,
+            rect.height,
+            row_bytes,
+            out=memoryview(self.image)[
+                rect.top * self.row_bytes + rect.left * self.channels :
+            ],
+            out_row_bytes=self.row_bytes,
+        )
+        self.num_pixels_copied += rect.width * rect.height
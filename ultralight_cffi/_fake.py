@@ -0,0 +1,988 @@
+"""Pure-Python stand-in for the Ultralight shared libraries.
+
+:class:`FakeLib` implements the commonly used subset of the Ultralight C API (strings,
+buffers, font files, bitmaps, surfaces, configs, renderers, views, and view callbacks)
+well enough to exercise the Python-level layers of this package - the annotated
+``_stubs`` wrappers, :class:`~ultralight_cffi.CustomSurface` dispatch, etc. - without
+the SDK, e.g. for testing and benchmarking in CI.  Nothing is actually rendered:
+"painting" a view fills its surface with a solid background color.
+
+Handles are genuine CFFI pointers of the same types that the real library returns
+(``struct C_String *``, etc.), and pixel/string data lives in CFFI-allocated memory, so
+pointer arithmetic, ``ffi.buffer``, ``ffi.string``, and so on behave as usual.  Passing
+a ``NULL``, foreign, or already destroyed handle raises :class:`ValueError` rather than
+crashing the process.
+"""
+
+from __future__ import annotations
+
+import logging
+import pathlib
+import re
+import struct
+import zlib
+from . import _stubs
+from ._base import NULL
+from ._base import ffi
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import ClassVar
+from typing import TypeAlias
+from typing import TypeVar
+from typing import cast
+
+logger = logging.getLogger(__name__)
+
+_CData: TypeAlias = Any
+"""CFFI pointers, structs, etc. (which :class:`ffi.CData` doesn't usefully type)."""
+
+_VERSION = (1, 4, 0)
+_VERSION_STRING = ffi.new('char[]', b'%d.%d.%d (fake)' % _VERSION)
+_WEBKIT_VERSION_STRING = ffi.new('char[]', b'615.1.18.100.1 (fake)')
+
+_BGRA_BPP = 4
+_A8_BPP = 1
+
+_TITLE_PATTERN = re.compile(rb'<title[^>]*>(.*?)</title\s*>', re.IGNORECASE | re.DOTALL)
+
+_CONSOLE_PATTERN = re.compile(
+    rb'console\.(log|info|warn|error|debug)\(\s*([\'"])(.*?)\2\s*\)', re.DOTALL
+)
+_CONSOLE_LEVELS = {
+    b'log': 'kMessageLevel_Log',
+    b'info': 'kMessageLevel_Info',
+    b'warn': 'kMessageLevel_Warning',
+    b'error': 'kMessageLevel_Error',
+    b'debug': 'kMessageLevel_Debug',
+}
+
+_MAIN_FRAME_ID = 1
+
+_O = TypeVar('_O', bound='_Object')
+
+
+class _Object:
+    """Base class for the objects that the fake handles point to."""
+
+    ctype: ClassVar[str]
+    """The CFFI type of handles to this kind of object; e.g. ``'ULString'``."""
+
+
+@dataclass(eq=False)
+class _String(_Object):
+    ctype = 'ULString'
+
+    data: bytes = b''
+    cdata: _CData = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.assign(self.data)
+
+    def assign(self, data: bytes) -> None:
+        self.data = data
+        self.cdata = ffi.new('char[]', data)
+
+
+@dataclass(eq=False)
+class _Buffer(_Object):
+    ctype = 'ULBuffer'
+
+    data: _CData
+    size: int
+    user_data: _CData = NULL
+    destruction_callback: _CData = NULL
+    owns_data: bool = False
+
+
+@dataclass(eq=False)
+class _FontFile(_Object):
+    ctype = 'ULFontFile'
+
+    data: bytes | None = None
+    """The font's contents (copied from the buffer), or ``None`` for a file path."""
+    path: str | None = None
+
+
+@dataclass(eq=False)
+class _Bitmap(_Object):
+    ctype = 'ULBitmap'
+
+    width: int = 0
+    height: int = 0
+    format: int = 0
+    row_bytes: int = 0
+    pixels: _CData = NULL
+    owns_pixels: bool = True
+    lock_count: int = 0
+
+    @property
+    def bpp(self) -> int:
+        return _A8_BPP if self.format == _stubs.kBitmapFormat_A8_UNORM else _BGRA_BPP
+
+    @property
+    def size(self) -> int:
+        return self.row_bytes * self.height
+
+    @classmethod
+    def allocate(cls, width: int, height: int, fmt: int) -> _Bitmap:
+        bitmap = cls(width=width, height=height, format=fmt)
+        bitmap.row_bytes = width * bitmap.bpp
+        bitmap.pixels = ffi.new('unsigned char[]', max(bitmap.size, 1))
+        return bitmap
+
+
+class _Surface(_Object):
+    """The default surface implementation, backed by a bitmap."""
+
+    ctype = 'ULSurface'
+
+    dirty_bounds: tuple[int, int, int, int] = (0, 0, 0, 0)
+
+    def __init__(self, lib: FakeLib, width: int, height: int) -> None:
+        self._lib = lib
+        self.bitmap = lib.ulCreateBitmap(
+            width, height, _stubs.kBitmapFormat_BGRA8_UNORM_SRGB
+        )
+
+    def get_user_data(self) -> _CData:
+        return NULL
+
+    def get_width(self) -> int:
+        return self._lib.ulBitmapGetWidth(self.bitmap)
+
+    def get_height(self) -> int:
+        return self._lib.ulBitmapGetHeight(self.bitmap)
+
+    def get_row_bytes(self) -> int:
+        return self._lib.ulBitmapGetRowBytes(self.bitmap)
+
+    def get_size(self) -> int:
+        return self._lib.ulBitmapGetSize(self.bitmap)
+
+    def lock_pixels(self) -> _CData:
+        return self._lib.ulBitmapLockPixels(self.bitmap)
+
+    def unlock_pixels(self) -> None:
+        self._lib.ulBitmapUnlockPixels(self.bitmap)
+
+    def resize(self, width: int, height: int) -> None:
+        self._lib.ulDestroyBitmap(self.bitmap)
+        self.bitmap = self._lib.ulCreateBitmap(
+            width, height, _stubs.kBitmapFormat_BGRA8_UNORM_SRGB
+        )
+
+    def destroy(self) -> None:
+        self._lib.ulDestroyBitmap(self.bitmap)
+
+
+class _CustomSurface(_Surface):
+    """A surface that delegates to the ``ULSurfaceDefinition`` callbacks."""
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        definition: _CData,
+        width: int,
+        height: int,
+    ) -> None:
+        self._definition = definition
+        self._user_data = definition.create(width, height)
+
+    def get_user_data(self) -> _CData:
+        return self._user_data
+
+    def get_width(self) -> int:
+        return int(self._definition.get_width(self._user_data))
+
+    def get_height(self) -> int:
+        return int(self._definition.get_height(self._user_data))
+
+    def get_row_bytes(self) -> int:
+        return int(self._definition.get_row_bytes(self._user_data))
+
+    def get_size(self) -> int:
+        return int(self._definition.get_size(self._user_data))
+
+    def lock_pixels(self) -> _CData:
+        return self._definition.lock_pixels(self._user_data)
+
+    def unlock_pixels(self) -> None:
+        self._definition.unlock_pixels(self._user_data)
+
+    def resize(self, width: int, height: int) -> None:
+        self._definition.resize(self._user_data, width, height)
+
+    def destroy(self) -> None:
+        self._definition.destroy(self._user_data)
+
+
+@dataclass(eq=False)
+class _Config(_Object):
+    ctype = 'ULConfig'
+
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(eq=False)
+class _ViewConfig(_Object):
+    ctype = 'ULViewConfig'
+
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(eq=False)
+class _Session(_Object):
+    ctype = 'ULSession'
+
+    name: str
+    is_persistent: bool
+    session_id: int
+
+
+@dataclass(eq=False)
+class _Renderer(_Object):
+    ctype = 'ULRenderer'
+
+    options: dict[str, Any]
+    default_session: _CData = NULL
+    views: list[_CData] = field(default_factory=list)
+
+
+@dataclass(eq=False)
+class _View(_Object):
+    ctype = 'ULView'
+
+    renderer: _CData
+    width: int
+    height: int
+    options: dict[str, Any]
+    surface: _CData = NULL
+    url: _CData = NULL
+    title: _CData = NULL
+    pending_load: tuple[str, bytes] | None = None
+    needs_paint: bool = True
+    has_focus: bool = False
+    callbacks: dict[str, tuple[_CData, _CData]] = field(default_factory=dict)
+
+
+def _to_bytes(value: bytes | _CData, length: int | None = None) -> bytes:
+    """Converts a ``const char*`` argument - either Python bytes or a CFFI pointer - to
+    bytes."""
+    data: bytes
+    if isinstance(value, bytes):
+        data = value if length is None else value[:length]
+    elif length is None:
+        data = cast(bytes, ffi.string(ffi.cast('char*', value)))
+    else:
+        data = cast(bytes, ffi.unpack(ffi.cast('char*', value), length))
+    return data
+
+
+def _write_png(path: str, bitmap: _Bitmap) -> None:
+    """Writes a bitmap as an 8-bit RGBA (or grayscale, for A8) PNG file."""
+    pixels = ffi.buffer(bitmap.pixels, bitmap.size)
+    width_bytes = bitmap.width * bitmap.bpp
+    rows = []
+    for y in range(bitmap.height):
+        row = bytearray(
+            pixels[y * bitmap.row_bytes : y * bitmap.row_bytes + width_bytes]
+        )
+        if bitmap.bpp == _BGRA_BPP:
+            row[0::4], row[2::4] = row[2::4], row[0::4]
+        rows.append(b'\x00' + bytes(row))
+    color_type = 6 if bitmap.bpp == _BGRA_BPP else 0
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack('>I', len(data)) + body + struct.pack('>I', zlib.crc32(body))
+
+    header = struct.pack(
+        '>IIBBBBB', bitmap.width, bitmap.height, 8, color_type, 0, 0, 0
+    )
+    pathlib.Path(path).write_bytes(
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', header)
+        + chunk(b'IDAT', zlib.compress(b''.join(rows)))
+        + chunk(b'IEND', b'')
+    )
+
+
+class FakeLib:  # pylint: disable=invalid-name,too-many-public-methods
+    """Fake implementation of the Ultralight ``Lib``; see the module docstring.
+
+    Use ``ultralight_cffi.load(backend='fake')`` to install an instance as the active
+    library.  Unimplemented functions raise :class:`AttributeError` like any missing
+    attribute, so the annotated wrappers fail loudly rather than silently.
+    """
+
+    def __init__(self) -> None:
+        self._objects: dict[int, tuple[_Object, _CData]] = {}
+        self._surface_definition: _CData | None = None
+        self._next_session_id = 1
+        self.platform: dict[str, Any] = {}
+        """Platform handlers installed via ``ulPlatformSet*``/``ulEnablePlatform*``."""
+
+    def __getattr__(self, name: str) -> int:
+        """Provides the enum constants (e.g. ``kBitmapFormat_A8_UNORM``), like the real
+        ``Lib`` does."""
+        if name not in _stubs._symbols.enum_members:
+            raise AttributeError(
+                f'{type(self).__name__!r} object has no attribute {name!r}'
+            )
+        return int(getattr(_stubs, name))
+
+    # Handle bookkeeping:
+
+    def _new(self, obj: _Object) -> _CData:
+        handle = ffi.new_handle(obj)
+        ptr = ffi.cast(obj.ctype, handle)
+        self._objects[int(ffi.cast('uintptr_t', ptr))] = (obj, handle)
+        return ptr
+
+    def _get(self, ptr: _CData, cls: type[_O]) -> _O:
+        entry = self._objects.get(int(ffi.cast('uintptr_t', ptr)))
+        if entry is None or not isinstance(entry[0], cls):
+            raise ValueError(f'Invalid or destroyed {cls.ctype} handle: {ptr}')
+        return entry[0]
+
+    def _free(self, ptr: _CData, cls: type[_O]) -> _O:
+        obj = self._get(ptr, cls)
+        del self._objects[int(ffi.cast('uintptr_t', ptr))]
+        return obj
+
+    def get_live_objects(self) -> Counter[str]:
+        """Counts the objects that have been created but not yet destroyed, by type;
+        e.g. ``{'ULString': 2}``.  Handy for catching leaks in tests."""
+        return Counter(obj.ctype for obj, _ in self._objects.values())
+
+    # Version:
+
+    def ulVersionString(self) -> _CData:
+        return _VERSION_STRING
+
+    def ulVersionMajor(self) -> int:
+        return _VERSION[0]
+
+    def ulVersionMinor(self) -> int:
+        return _VERSION[1]
+
+    def ulVersionPatch(self) -> int:
+        return _VERSION[2]
+
+    def ulWebKitVersionString(self) -> _CData:
+        return _WEBKIT_VERSION_STRING
+
+    # Strings:
+
+    def _create_string(self, data: bytes) -> _CData:
+        return self._new(_String(data))
+
+    def ulCreateString(self, str_: bytes | _CData) -> _CData:
+        return self._create_string(_to_bytes(str_))
+
+    def ulCreateStringUTF8(self, str_: bytes | _CData, len_: int) -> _CData:
+        return self._create_string(_to_bytes(str_, len_))
+
+    def ulCreateStringUTF16(self, str_: _CData, len_: int) -> _CData:
+        text = bytes(ffi.buffer(ffi.cast('ULChar16*', str_), len_ * 2))
+        return self._create_string(text.decode('utf-16-le').encode())
+
+    def ulCreateStringFromCopy(self, str_: _CData) -> _CData:
+        return self._create_string(self._get(str_, _String).data)
+
+    def ulDestroyString(self, str_: _CData) -> None:
+        self._free(str_, _String)
+
+    def ulStringGetData(self, str_: _CData) -> _CData:
+        return self._get(str_, _String).cdata
+
+    def ulStringGetLength(self, str_: _CData) -> int:
+        return len(self._get(str_, _String).data)
+
+    def ulStringIsEmpty(self, str_: _CData) -> bool:
+        return not self._get(str_, _String).data
+
+    def ulStringAssignString(self, str_: _CData, new_str: _CData) -> None:
+        self._get(str_, _String).assign(self._get(new_str, _String).data)
+
+    def ulStringAssignCString(self, str_: _CData, c_str: bytes | _CData) -> None:
+        self._get(str_, _String).assign(_to_bytes(c_str))
+
+    # Buffers:
+
+    def ulCreateBuffer(
+        self,
+        data: _CData,
+        size: int,
+        user_data: _CData,
+        destruction_callback: _CData,
+    ) -> _CData:
+        return self._new(_Buffer(data, size, user_data, destruction_callback))
+
+    def ulCreateBufferFromCopy(self, data: bytes | _CData, size: int) -> _CData:
+        copy = ffi.new('unsigned char[]', max(size, 1))
+        ffi.memmove(copy, data, size)
+        return self._new(_Buffer(copy, size, owns_data=True))
+
+    def ulDestroyBuffer(self, buffer: _CData) -> None:
+        obj = self._free(buffer, _Buffer)
+        if obj.destruction_callback != NULL:
+            obj.destruction_callback(obj.user_data, obj.data)
+
+    def ulBufferGetData(self, buffer: _CData) -> _CData:
+        return ffi.cast('void*', self._get(buffer, _Buffer).data)
+
+    def ulBufferGetSize(self, buffer: _CData) -> int:
+        return self._get(buffer, _Buffer).size
+
+    def ulBufferGetUserData(self, buffer: _CData) -> _CData:
+        return self._get(buffer, _Buffer).user_data
+
+    def ulBufferOwnsData(self, buffer: _CData) -> bool:
+        return self._get(buffer, _Buffer).owns_data
+
+    # Font files:
+
+    def ulFontFileCreateFromFilePath(self, file_path: _CData) -> _CData:
+        return self._new(_FontFile(path=self._get(file_path, _String).data.decode()))
+
+    def ulFontFileCreateFromBuffer(self, buffer: _CData) -> _CData:
+        obj = self._get(buffer, _Buffer)
+        return self._new(_FontFile(data=_to_bytes(obj.data, obj.size)))
+
+    def ulDestroyFontFile(self, font_file: _CData) -> None:
+        self._free(font_file, _FontFile)
+
+    def get_font_file_data(self, font_file: _CData) -> bytes | None:
+        """Returns a font file's contents, if it was created from a buffer (a testing
+        aid, since the real API has no such function)."""
+        return self._get(font_file, _FontFile).data
+
+    # Bitmaps:
+
+    def ulCreateEmptyBitmap(self) -> _CData:
+        return self._new(_Bitmap())
+
+    def ulCreateBitmap(self, width: int, height: int, format_: int) -> _CData:
+        return self._new(_Bitmap.allocate(width, height, format_))
+
+    def ulCreateBitmapFromPixels(  # pylint: disable=too-many-arguments
+        self,
+        width: int,
+        height: int,
+        format_: int,
+        row_bytes: int,
+        pixels: _CData,
+        size: int,
+        should_copy: bool,
+    ) -> _CData:
+        bitmap = _Bitmap(width, height, format_, row_bytes)
+        if should_copy:
+            bitmap.pixels = ffi.new('unsigned char[]', max(size, 1))
+            ffi.memmove(bitmap.pixels, pixels, size)
+        else:
+            bitmap.pixels = ffi.cast('unsigned char*', pixels)
+            bitmap.owns_pixels = False
+        return self._new(bitmap)
+
+    def ulCreateBitmapFromCopy(self, existing_bitmap: _CData) -> _CData:
+        existing = self._get(existing_bitmap, _Bitmap)
+        return self.ulCreateBitmapFromPixels(
+            existing.width,
+            existing.height,
+            existing.format,
+            existing.row_bytes,
+            existing.pixels,
+            existing.size,
+            True,
+        )
+
+    def ulDestroyBitmap(self, bitmap: _CData) -> None:
+        self._free(bitmap, _Bitmap)
+
+    def ulBitmapGetWidth(self, bitmap: _CData) -> int:
+        return self._get(bitmap, _Bitmap).width
+
+    def ulBitmapGetHeight(self, bitmap: _CData) -> int:
+        return self._get(bitmap, _Bitmap).height
+
+    def ulBitmapGetFormat(self, bitmap: _CData) -> int:
+        return self._get(bitmap, _Bitmap).format
+
+    def ulBitmapGetBpp(self, bitmap: _CData) -> int:
+        return self._get(bitmap, _Bitmap).bpp
+
+    def ulBitmapGetRowBytes(self, bitmap: _CData) -> int:
+        return self._get(bitmap, _Bitmap).row_bytes
+
+    def ulBitmapGetSize(self, bitmap: _CData) -> int:
+        return self._get(bitmap, _Bitmap).size
+
+    def ulBitmapOwnsPixels(self, bitmap: _CData) -> bool:
+        return self._get(bitmap, _Bitmap).owns_pixels
+
+    def ulBitmapLockPixels(self, bitmap: _CData) -> _CData:
+        obj = self._get(bitmap, _Bitmap)
+        obj.lock_count += 1
+        return ffi.cast('void*', obj.pixels)
+
+    def ulBitmapUnlockPixels(self, bitmap: _CData) -> None:
+        obj = self._get(bitmap, _Bitmap)
+        if obj.lock_count <= 0:
+            raise RuntimeError(f'Bitmap is not locked: {bitmap}')
+        obj.lock_count -= 1
+
+    def ulBitmapRawPixels(self, bitmap: _CData) -> _CData:
+        return ffi.cast('void*', self._get(bitmap, _Bitmap).pixels)
+
+    def ulBitmapIsEmpty(self, bitmap: _CData) -> bool:
+        obj = self._get(bitmap, _Bitmap)
+        return obj.size == 0 or obj.pixels == NULL
+
+    def ulBitmapErase(self, bitmap: _CData) -> None:
+        obj = self._get(bitmap, _Bitmap)
+        ffi.memmove(obj.pixels, bytes(obj.size), obj.size)
+
+    def ulBitmapWritePNG(self, bitmap: _CData, path: bytes | _CData) -> bool:
+        _write_png(_to_bytes(path).decode(), self._get(bitmap, _Bitmap))
+        return True
+
+    def ulBitmapSwapRedBlueChannels(self, bitmap: _CData) -> None:
+        obj = self._get(bitmap, _Bitmap)
+        if obj.bpp == _BGRA_BPP:
+            pixels = memoryview(ffi.buffer(obj.pixels, obj.size))
+            pixels[0::4], pixels[2::4] = bytes(pixels[2::4]), bytes(pixels[0::4])
+
+    # Surfaces:
+
+    def _create_surface(self, width: int, height: int) -> _CData:
+        surface: _Surface
+        if self._surface_definition is None:
+            surface = _Surface(self, width, height)
+        else:
+            surface = _CustomSurface(self._surface_definition, width, height)
+        return self._new(surface)
+
+    def ulSurfaceGetWidth(self, surface: _CData) -> int:
+        return self._get(surface, _Surface).get_width()
+
+    def ulSurfaceGetHeight(self, surface: _CData) -> int:
+        return self._get(surface, _Surface).get_height()
+
+    def ulSurfaceGetRowBytes(self, surface: _CData) -> int:
+        return self._get(surface, _Surface).get_row_bytes()
+
+    def ulSurfaceGetSize(self, surface: _CData) -> int:
+        return self._get(surface, _Surface).get_size()
+
+    def ulSurfaceLockPixels(self, surface: _CData) -> _CData:
+        return self._get(surface, _Surface).lock_pixels()
+
+    def ulSurfaceUnlockPixels(self, surface: _CData) -> None:
+        self._get(surface, _Surface).unlock_pixels()
+
+    def ulSurfaceResize(self, surface: _CData, width: int, height: int) -> None:
+        self._get(surface, _Surface).resize(width, height)
+
+    def ulSurfaceSetDirtyBounds(self, surface: _CData, bounds: _CData) -> None:
+        self._get(surface, _Surface).dirty_bounds = (
+            bounds.left,
+            bounds.top,
+            bounds.right,
+            bounds.bottom,
+        )
+
+    def ulSurfaceGetDirtyBounds(self, surface: _CData) -> _CData:
+        return ffi.new('ULIntRect*', self._get(surface, _Surface).dirty_bounds)[0]
+
+    def ulSurfaceClearDirtyBounds(self, surface: _CData) -> None:
+        self._get(surface, _Surface).dirty_bounds = (0, 0, 0, 0)
+
+    def ulSurfaceGetUserData(self, surface: _CData) -> _CData:
+        return self._get(surface, _Surface).get_user_data()
+
+    def ulBitmapSurfaceGetBitmap(self, surface: _CData) -> _CData:
+        obj = self._get(surface, _Surface)
+        if isinstance(obj, _CustomSurface):
+            raise ValueError(f'Not a bitmap surface: {surface}')
+        return obj.bitmap
+
+    # Platform:
+
+    def ulPlatformSetLogger(self, logger_: _CData) -> None:
+        self.platform['logger'] = ffi.new('ULLogger*', logger_)
+
+    def ulPlatformSetFileSystem(self, file_system: _CData) -> None:
+        self.platform['file_system'] = ffi.new('ULFileSystem*', file_system)
+
+    def ulPlatformSetFontLoader(self, font_loader: _CData) -> None:
+        self.platform['font_loader'] = ffi.new('ULFontLoader*', font_loader)
+
+    def ulPlatformSetSurfaceDefinition(self, surface_definition: _CData) -> None:
+        self._surface_definition = ffi.new('ULSurfaceDefinition*', surface_definition)
+
+    def ulEnablePlatformFontLoader(self) -> None:
+        self.platform['font_loader'] = 'platform'
+
+    def ulEnablePlatformFileSystem(self, base_dir: _CData) -> None:
+        self.platform['file_system'] = self._get(base_dir, _String).data.decode()
+
+    def ulEnableDefaultLogger(self, log_path: _CData) -> None:
+        self.platform['logger'] = self._get(log_path, _String).data.decode()
+
+    # Configs:
+
+    def ulCreateConfig(self) -> _CData:
+        return self._new(_Config())
+
+    def ulDestroyConfig(self, config: _CData) -> None:
+        self._free(config, _Config)
+
+    def ulCreateViewConfig(self) -> _CData:
+        return self._new(_ViewConfig())
+
+    def ulDestroyViewConfig(self, config: _CData) -> None:
+        self._free(config, _ViewConfig)
+
+    # Renderers & sessions:
+
+    def ulCreateRenderer(self, config: _CData) -> _CData:
+        renderer = self._new(_Renderer(dict(self._get(config, _Config).options)))
+        self._get(renderer, _Renderer).default_session = self._new_session(
+            'default', True
+        )
+        return renderer
+
+    def ulDestroyRenderer(self, renderer: _CData) -> None:
+        obj = self._free(renderer, _Renderer)
+        self._free(obj.default_session, _Session)
+
+    def ulUpdate(self, renderer: _CData) -> None:
+        for view in list(self._get(renderer, _Renderer).views):
+            self._process_load(view)
+
+    def ulRefreshDisplay(self, renderer: _CData, display_id: int) -> None:
+        self._get(renderer, _Renderer)
+
+    def ulRender(self, renderer: _CData) -> None:
+        for view in self._get(renderer, _Renderer).views:
+            obj = self._get(view, _View)
+            if obj.needs_paint:
+                self._paint(obj)
+                obj.needs_paint = False
+
+    def ulPurgeMemory(self, renderer: _CData) -> None:
+        self._get(renderer, _Renderer)
+
+    def ulLogMemoryUsage(self, renderer: _CData) -> None:
+        self._get(renderer, _Renderer)
+        self._log(
+            _stubs.kLogLevel_Info, f'Live objects: {dict(self.get_live_objects())}'
+        )
+
+    def _log(self, level: int, message: str) -> None:
+        """Logs to the installed ``ULLogger``, if any, or else to the Python logger."""
+        ul_logger = self.platform.get('logger')
+        if ul_logger is None or isinstance(ul_logger, str):
+            levels: dict[int, int] = {
+                _stubs.kLogLevel_Error: logging.ERROR,
+                _stubs.kLogLevel_Warning: logging.WARNING,
+            }
+            logger.log(levels.get(level, logging.INFO), '%s', message)
+        else:
+            string = self._create_string(message.encode())
+            try:
+                ul_logger.log_message(level, string)
+            finally:
+                self.ulDestroyString(string)
+
+    def _new_session(self, name: str, is_persistent: bool) -> _CData:
+        session_id = self._next_session_id
+        self._next_session_id += 1
+        return self._new(_Session(name, is_persistent, session_id))
+
+    def ulCreateSession(
+        self, renderer: _CData, is_persistent: bool, name: _CData
+    ) -> _CData:
+        self._get(renderer, _Renderer)
+        return self._new_session(self._get(name, _String).data.decode(), is_persistent)
+
+    def ulDestroySession(self, session: _CData) -> None:
+        self._free(session, _Session)
+
+    def ulDefaultSession(self, renderer: _CData) -> _CData:
+        return self._get(renderer, _Renderer).default_session
+
+    def ulSessionIsPersistent(self, session: _CData) -> bool:
+        return self._get(session, _Session).is_persistent
+
+    def ulSessionGetId(self, session: _CData) -> int:
+        return self._get(session, _Session).session_id
+
+    # Views:
+
+    def ulCreateView(
+        self,
+        renderer: _CData,
+        width: int,
+        height: int,
+        view_config: _CData,
+        session: _CData,
+    ) -> _CData:
+        if session != NULL:
+            self._get(session, _Session)
+        options = dict(self._get(view_config, _ViewConfig).options)
+        obj = _View(renderer, width, height, options)
+        obj.surface = self._create_surface(width, height)
+        obj.url = self._create_string(b'')
+        obj.title = self._create_string(b'')
+        view = self._new(obj)
+        self._get(renderer, _Renderer).views.append(view)
+        return view
+
+    def ulDestroyView(self, view: _CData) -> None:
+        obj = self._free(view, _View)
+        self._get(obj.renderer, _Renderer).views.remove(view)
+        self._free(obj.surface, _Surface).destroy()
+        self._free(obj.url, _String)
+        self._free(obj.title, _String)
+
+    def ulViewGetURL(self, view: _CData) -> _CData:
+        return self._get(view, _View).url
+
+    def ulViewGetTitle(self, view: _CData) -> _CData:
+        return self._get(view, _View).title
+
+    def ulViewGetWidth(self, view: _CData) -> int:
+        return self._get(view, _View).width
+
+    def ulViewGetHeight(self, view: _CData) -> int:
+        return self._get(view, _View).height
+
+    def ulViewGetDeviceScale(self, view: _CData) -> float:
+        return float(self._get(view, _View).options.get('InitialDeviceScale', 1.0))
+
+    def ulViewSetDeviceScale(self, view: _CData, scale: float) -> None:
+        self._get(view, _View).options['InitialDeviceScale'] = scale
+
+    def ulViewIsAccelerated(self, view: _CData) -> bool:
+        return bool(self._get(view, _View).options.get('IsAccelerated', False))
+
+    def ulViewIsTransparent(self, view: _CData) -> bool:
+        return bool(self._get(view, _View).options.get('IsTransparent', False))
+
+    def ulViewIsLoading(self, view: _CData) -> bool:
+        return self._get(view, _View).pending_load is not None
+
+    def ulViewGetSurface(self, view: _CData) -> _CData:
+        return self._get(view, _View).surface
+
+    def ulViewLoadHTML(self, view: _CData, html_string: _CData) -> None:
+        self._get(view, _View).pending_load = (
+            '',
+            self._get(html_string, _String).data,
+        )
+
+    def ulViewLoadURL(self, view: _CData, url_string: _CData) -> None:
+        url = self._get(url_string, _String).data.decode()
+        self._get(view, _View).pending_load = (url, b'')
+
+    def ulViewResize(self, view: _CData, width: int, height: int) -> None:
+        obj = self._get(view, _View)
+        obj.width = width
+        obj.height = height
+        self.ulSurfaceResize(obj.surface, width, height)
+        obj.needs_paint = True
+
+    def ulViewEvaluateScript(
+        self,
+        view: _CData,
+        js_string: _CData,
+        exception: _CData,
+    ) -> _CData:
+        self._get(view, _View)
+        self._get(js_string, _String)
+        return self._create_string(b'undefined')
+
+    def ulViewReload(self, view: _CData) -> None:
+        obj = self._get(view, _View)
+        obj.pending_load = (self._get(obj.url, _String).data.decode(), b'')
+
+    def ulViewStop(self, view: _CData) -> None:
+        self._get(view, _View).pending_load = None
+
+    def ulViewFocus(self, view: _CData) -> None:
+        self._get(view, _View).has_focus = True
+
+    def ulViewUnfocus(self, view: _CData) -> None:
+        self._get(view, _View).has_focus = False
+
+    def ulViewHasFocus(self, view: _CData) -> bool:
+        return self._get(view, _View).has_focus
+
+    def ulViewSetNeedsPaint(self, view: _CData, needs_paint: bool) -> None:
+        self._get(view, _View).needs_paint = needs_paint
+
+    def ulViewGetNeedsPaint(self, view: _CData) -> bool:
+        return self._get(view, _View).needs_paint
+
+    def _fire(self, view: _CData, event: str, *args: Any) -> None:
+        """Invokes the view's callback for ``event`` (e.g. ``'FinishLoading'``), if set,
+        passing temporary strings for any ``str`` arguments, which are destroyed as
+        soon as the callback returns - just like the real library."""
+        callback, user_data = self._get(view, _View).callbacks.get(event, (NULL, NULL))
+        if callback != NULL:
+            strings = [
+                self._create_string(arg.encode()) if isinstance(arg, str) else arg
+                for arg in args
+            ]
+            try:
+                callback(user_data, view, *strings)
+            finally:
+                for string, arg in zip(strings, args):
+                    if isinstance(arg, str):
+                        self.ulDestroyString(string)
+
+    def _process_load(self, view: _CData) -> None:
+        """Simulates a pending page load, firing the usual sequence of callbacks."""
+        obj = self._get(view, _View)
+        if obj.pending_load is not None:
+            url, document = obj.pending_load
+            obj.pending_load = None
+            frame = (_MAIN_FRAME_ID, True, url)
+            self._fire(view, 'BeginLoading', *frame)
+            html = self._read_file(url) if url.startswith('file://') else document
+            if html is None:
+                self._fire(view, 'FailLoading', *frame, 'File not found', 'file', -1100)
+            else:
+                self._get(obj.url, _String).assign(url.encode())
+                self._fire(view, 'ChangeURL', url)
+                match = _TITLE_PATTERN.search(html)
+                if match is not None:
+                    self._get(obj.title, _String).assign(match.group(1).strip())
+                    self._fire(view, 'ChangeTitle', match.group(1).strip().decode())
+                self._fire(view, 'WindowObjectReady', *frame)
+                self._run_console_calls(view, url, html)
+                self._fire(view, 'DOMReady', *frame)
+                self._fire(view, 'FinishLoading', *frame)
+                self._fire(view, 'UpdateHistory')
+                obj.needs_paint = True
+
+    def _run_console_calls(self, view: _CData, url: str, html: bytes) -> None:
+        """Fires ``AddConsoleMessage`` for each ``console.log('...')``-style call with
+        a string literal in the document (the only "JavaScript" this fake runs)."""
+        for match in _CONSOLE_PATTERN.finditer(html):
+            line = html.count(b'\n', 0, match.start()) + 1
+            column = match.start() - (html.rfind(b'\n', 0, match.start()) + 1) + 1
+            self._fire(
+                view,
+                'AddConsoleMessage',
+                _stubs.kMessageSource_ConsoleAPI,
+                getattr(_stubs, _CONSOLE_LEVELS[match.group(1)]),
+                match.group(3).decode(errors='replace'),
+                line,
+                column,
+                url,
+            )
+
+    def _read_file(self, url: str) -> bytes | None:
+        """Reads a ``file://`` URL through the installed ``ULFileSystem``, with the path
+        relative to the file system's root like the real library, or otherwise just
+        checks that the (absolute) path exists.  Returns ``None`` if it doesn't."""
+        file_system = self.platform.get('file_system')
+        data: bytes | None = None
+        if file_system is None or isinstance(file_system, str):
+            if pathlib.Path(url.removeprefix('file://')).exists():
+                data = b''
+        else:
+            path = self._create_string(url.removeprefix('file:///').encode())
+            try:
+                if file_system.file_exists(path):
+                    # (The library takes ownership of the returned strings.)
+                    self.ulDestroyString(file_system.get_file_mime_type(path))
+                    self.ulDestroyString(file_system.get_file_charset(path))
+                    buffer = file_system.open_file(path)
+                    if buffer != NULL:
+                        buffer_obj = self._get(buffer, _Buffer)
+                        data = _to_bytes(buffer_obj.data, buffer_obj.size)
+                        self.ulDestroyBuffer(buffer)
+            finally:
+                self.ulDestroyString(path)
+        return data
+
+    def _paint(self, view: _View) -> None:
+        """Fills the view's surface with its background color, and marks the whole
+        surface as dirty."""
+        surface = self._get(view.surface, _Surface)
+        size = surface.get_size()
+        fill = b'\x00' if view.options.get('IsTransparent', False) else b'\xff'
+        pixels = surface.lock_pixels()
+        try:
+            ffi.memmove(pixels, fill * size, size)
+        finally:
+            surface.unlock_pixels()
+        surface.dirty_bounds = (0, 0, surface.get_width(), surface.get_height())
+
+
+def _make_option_setter(
+    name: str,
+    cls: type[_Config | _ViewConfig],
+) -> Callable[[FakeLib, _CData, Any], None]:
+    option = name.removeprefix('ulViewConfigSet').removeprefix('ulConfigSet')
+
+    def setter(self: FakeLib, config: _CData, value: Any) -> None:
+        config_obj = self._get(config, cls)  # pylint: disable=protected-access
+        config_obj.options[option] = value
+
+    setter.__name__ = setter.__qualname__ = name
+    return setter
+
+
+def _make_callback_setter(
+    name: str,
+) -> Callable[[FakeLib, _CData, _CData, _CData], None]:
+    event = name.removeprefix('ulViewSet').removesuffix('Callback')
+
+    def setter(
+        self: FakeLib, view: _CData, callback: _CData, user_data: _CData
+    ) -> None:
+        view_obj = self._get(view, _View)  # pylint: disable=protected-access
+        # (Like Ultralight, only keep the address, so that the caller has to keep the
+        # user data alive.)
+        view_obj.callbacks[event] = (callback, ffi.cast('void*', user_data))
+
+    setter.__name__ = setter.__qualname__ = name
+    return setter
+
+
+def _install_generic_methods() -> None:
+    """Adds the config option setters (``ulConfigSet*``/``ulViewConfigSet*``), which
+    just record the given values under the option name (e.g. ``'IsTransparent'``),
+    and the view callback setters (``ulViewSet*Callback``)."""
+    for name in _stubs._symbols.functions:  # pylint: disable=protected-access
+        if name.startswith('ulConfigSet'):
+            setattr(FakeLib, name, _make_option_setter(name, _Config))
+        elif name.startswith('ulViewConfigSet'):
+            setattr(FakeLib, name, _make_option_setter(name, _ViewConfig))
+        elif name.startswith('ulViewSet') and name.endswith('Callback'):
+            setattr(FakeLib, name, _make_callback_setter(name))
+
+
+_install_generic_methods()
+
+_instance: FakeLib | None = None
+
+
+def get_instance() -> FakeLib:
+    """Returns the process-wide :class:`FakeLib`, creating it on first use.
+
+    Like ``dlopen``-ing the real libraries repeatedly, calling
+    ``ultralight_cffi.load(backend='fake')`` more than once keeps the existing state
+    (live handles, platform handlers, etc.).
+    """
+    global _instance  # pylint: disable=global-statement
+    if _instance is None:
+        _instance = FakeLib()
+    return _instance
@@ -0,0 +1,460 @@
+"""A multi-process render farm: Ultralight allows only one renderer per process, so
+using all the cores means running a renderer in each of several worker processes."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextlib
+import multiprocessing
+import multiprocessing.queues
+import multiprocessing.synchronize
+import os
+import pathlib
+import queue
+import sys
+import time
+import zlib
+from . import _base
+from . import _stubs
+from ._asyncio import AsyncView
+from ._asyncio import RendererDriver
+from ._base import Backend
+from ._base import ffi
+from ._pool import ViewPool
+from ._string import temp_string
+from ._warm_up import WarmUpProfile
+from ._warm_up import WarmUpReport
+from ._warm_up import warm_up_async
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+from types import TracebackType
+from typing import Literal
+from typing import Self
+from typing import TypeVar
+from typing import cast
+from typing_extensions import Buffer
+
+_T = TypeVar('_T')
+
+Transport = Literal['zlib', 'shared_memory']
+"""How :class:`RenderFarm` workers send the rendered pixels back:
+
+- ``'zlib'``: zlib-compressed, pickled along with the result (the default).
+- ``'shared_memory'``: via a :class:`multiprocessing.shared_memory.SharedMemory`
+  block, which avoids pickling the pixels at all, for large renders.
+"""
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """A page to render with a :class:`RenderFarm`: either ``html`` or ``url``."""
+
+    width: int
+    height: int
+    html: str | None = None
+    url: str | None = None
+    transparent: bool = False
+    device_scale: float = 1.0
+    timeout: float = 30.0
+    """The maximum number of seconds to wait for the page to load."""
+
+    def __post_init__(self) -> None:
+        if (self.html is None) == (self.url is None):
+            raise ValueError('Exactly one of `html` or `url` must be given')
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """The rendered BGRA pixels of a :class:`RenderJob` (with premultiplied alpha, and
+    ``row_bytes`` per row)."""
+
+    width: int
+    height: int
+    row_bytes: int
+    size: int
+    transport: Transport
+    data: bytes | str
+    """The compressed pixels, or the shared memory block's name."""
+    worker_pid: int
+
+    def read_pixels(self) -> bytes:
+        """Returns the pixels.
+
+        With the ``'shared_memory'`` transport, this also frees the shared memory
+        block, so it must be called exactly once per result.
+        """
+        if self.transport == 'zlib':
+            pixels = zlib.decompress(cast(bytes, self.data))
+        else:
+            block = shared_memory.SharedMemory(cast(str, self.data))
+            try:
+                pixels = bytes(cast(memoryview, block.buf)[: self.size])
+            finally:
+                block.close()
+                block.unlink()
+        return pixels
+
+
+@dataclass(frozen=True)
+class WorkerHealth:
+    """A worker's status, as reported by :meth:`RenderFarm.check_health`."""
+
+    pid: int
+    jobs_done: int
+    max_rss: int | None
+    """The peak resident set size, in kilobytes (bytes on macOS), or ``None`` where it
+    isn't available (Windows)."""
+    pooled_views: int
+    """The number of idle views in the worker's :class:`ViewPool`."""
+    warm_up: WarmUpReport | None = None
+    """The worker's warm-up timings, if it was warmed up."""
+
+
+def _get_max_rss() -> int | None:
+    """Returns the process' peak resident set size (see :attr:`WorkerHealth.max_rss`),
+    if the platform reports it."""
+    max_rss = None
+    if sys.platform != 'win32':
+        import resource  # pylint: disable=import-outside-toplevel
+
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss
+
+
+class _Worker:
+    """The per-process state of a :class:`RenderFarm` worker."""
+
+    def __init__(
+        self,
+        sdk_path: pathlib.Path | None,
+        backend: Backend,
+        transport: Transport,
+        pool_size: int,
+        warm_up: WarmUpProfile | None,
+    ) -> None:
+        _base.load(None if sdk_path is None else sdk_path / 'bin', backend=backend)
+        if sdk_path is not None:
+            with temp_string(str(sdk_path)) as sdk_path_string:
+                _stubs.ulEnablePlatformFileSystem(sdk_path_string)
+        _stubs.ulEnablePlatformFontLoader()
+
+        config = _stubs.ulCreateConfig()
+        self.renderer = _stubs.ulCreateRenderer(config)
+        _stubs.ulDestroyConfig(config)
+
+        self.transport = transport
+        self.pool = ViewPool(self.renderer, max_size=pool_size)
+        self.loop = asyncio.new_event_loop()
+        self.driver = RendererDriver(self.renderer)
+        self.jobs_done = 0
+        self.warm_up = (
+            None
+            if warm_up is None
+            else self.loop.run_until_complete(self._warm_up(warm_up))
+        )
+
+    def render(self, job: RenderJob) -> RenderResult:
+        result = self.loop.run_until_complete(self._render(job))
+        self.jobs_done += 1
+        return result
+
+    def get_health(self) -> WorkerHealth:
+        return WorkerHealth(
+            os.getpid(),
+            self.jobs_done,
+            _get_max_rss(),
+            len(self.pool),
+            self.warm_up,
+        )
+
+    async def _warm_up(self, profile: WarmUpProfile) -> WarmUpReport:
+        async with self.driver:
+            return await warm_up_async(self.driver, profile)
+
+    async def _render(self, job: RenderJob) -> RenderResult:
+        async with self.driver:
+            with self.pool.view(
+                job.width,
+                job.height,
+                transparent=job.transparent,
+                device_scale=job.device_scale,
+            ) as ul_view:
+                view = AsyncView(self.driver, ul_view)
+                try:
+                    if job.html is not None:
+                        await asyncio.wait_for(view.load_html(job.html), job.timeout)
+                    else:
+                        await asyncio.wait_for(
+                            view.load_url(cast(str, job.url)), job.timeout
+                        )
+                    self.driver.render()
+                    return self._read_result(ul_view)
+                finally:
+                    view.destroy()
+
+    def _read_result(self, view: _stubs.ULView) -> RenderResult:
+        surface = _stubs.ulViewGetSurface(view)
+        bitmap = _stubs.ulBitmapSurfaceGetBitmap(surface)
+        height = _stubs.ulBitmapGetHeight(bitmap)
+        row_bytes = _stubs.ulBitmapGetRowBytes(bitmap)
+        size = row_bytes * height
+        pixels = ffi.buffer(_stubs.ulBitmapLockPixels(bitmap), size)
+        try:
+            data = (
+                zlib.compress(pixels, 1)
+                if self.transport == 'zlib'
+                else _copy_to_shared_memory(pixels)
+            )
+        finally:
+            _stubs.ulBitmapUnlockPixels(bitmap)
+        return RenderResult(
+            _stubs.ulBitmapGetWidth(bitmap),
+            height,
+            row_bytes,
+            size,
+            self.transport,
+            data,
+            os.getpid(),
+        )
+
+
+def _copy_to_shared_memory(pixels: Buffer) -> str:
+    """Copies the pixels into a new shared memory block, whose ownership passes to the
+    receiving process (see :meth:`RenderResult.read_pixels`)."""
+    view = memoryview(pixels).cast('B')
+    block = shared_memory.SharedMemory(create=True, size=max(len(view), 1))
+    try:
+        cast(memoryview, block.buf)[: len(view)] = view
+    finally:
+        block.close()
+    # (Otherwise the resource tracker would unlink it once this worker exits.)
+    tracked_name = block._name  # type: ignore[attr-defined]  # pylint: disable=protected-access
+    resource_tracker.unregister(tracked_name, 'shared_memory')
+    return block.name
+
+
+@dataclass(frozen=True)
+class _HealthChannel:
+    """The state that a :class:`RenderFarm` shares with its workers (which inherit it)
+    for :meth:`RenderFarm.check_health`."""
+
+    queue: multiprocessing.queues.Queue[WorkerHealth]
+    """Where the workers report their health."""
+    release: multiprocessing.synchronize.Event
+    """Set once the health check is over, until which each worker that reported
+    waits, so that no worker can take two queries."""
+
+
+_worker: _Worker | None = None
+_health_channel: _HealthChannel | None = None
+
+
+def _init_worker(  # pylint: disable=too-many-arguments
+    sdk_path: pathlib.Path | None,
+    backend: Backend,
+    transport: Transport,
+    pool_size: int,
+    warm_up: WarmUpProfile | None,
+    initializer: Callable[[], None] | None,
+    health_channel: _HealthChannel,
+) -> None:
+    global _worker, _health_channel  # pylint: disable=global-statement
+    _worker = _Worker(sdk_path, backend, transport, pool_size, warm_up)
+    _health_channel = health_channel
+    if initializer is not None:
+        initializer()
+
+
+def _get_worker() -> _Worker:
+    if _worker is None:
+        raise RuntimeError('Not running in a render farm worker')
+    return _worker
+
+
+def _render(job: RenderJob) -> RenderResult:
+    return _get_worker().render(job)
+
+
+def _check_health(timeout: float) -> None:
+    health = _get_worker().get_health()
+    channel = cast(_HealthChannel, _health_channel)
+    channel.queue.put(health)
+    channel.release.wait(timeout)
+
+
+class RenderFarm:
+    """Renders pages in a pool of worker processes, each of which initializes the
+    Ultralight libraries and a renderer once, and then renders jobs with pooled views
+    (see :class:`ViewPool`).
+
+    To cap any memory growth, the workers are recycled once they've been given
+    ``jobs_per_worker`` jobs each (on average): a fresh worker pool takes over new
+    submissions, while the old one finishes its pending jobs and exits.  A worker pool
+    that breaks (e.g. due to a crashed worker) is restarted on the next submission.
+
+    If a ``warm_up`` profile is given, each worker runs :func:`warm_up` on startup,
+    before accepting any jobs, and reports the timings in its :class:`WorkerHealth`.
+
+    Example::
+
+        with RenderFarm(sdk_path) as farm:
+            futures = [farm.submit(RenderJob(800, 600, html=html)) for html in pages]
+            for future in futures:
+                pixels = future.result().read_pixels()
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        sdk_path: pathlib.Path | str | None = None,
+        *,
+        max_workers: int | None = None,
+        jobs_per_worker: int | None = 100,
+        backend: Backend = 'auto',
+        transport: Transport = 'zlib',
+        pool_size: int = 4,
+        warm_up: WarmUpProfile | None = None,
+        start_method: str = 'spawn',
+        initializer: Callable[[], None] | None = None,
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.jobs_per_worker = jobs_per_worker
+        self._mp_context = multiprocessing.get_context(start_method)
+        self._init_args = (
+            None if sdk_path is None else pathlib.Path(sdk_path),
+            backend,
+            transport,
+            pool_size,
+            warm_up,
+            initializer,
+        )
+        self.restart_count = 0
+        """The number of times the worker pool was restarted after breaking."""
+        self.recycle_count = 0
+        """The number of times the worker pool was recycled (after
+        ``jobs_per_worker``)."""
+        # (Shared by recycled worker pools, whose workers may still be starting up.)
+        self._health_channel = self._create_health_channel()
+        self._executor = self._create_executor()
+        self._num_submitted = 0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+    def submit(self, job: RenderJob) -> concurrent.futures.Future[RenderResult]:
+        """Schedules a job, and returns a future for its result."""
+        if (
+            self.jobs_per_worker is not None
+            and self._num_submitted >= self.jobs_per_worker * self.max_workers
+        ):
+            self._recycle()
+        self._num_submitted += 1
+        return self._submit(_render, job)
+
+    def render(self, job: RenderJob) -> RenderResult:
+        """Renders a job, and waits for the result."""
+        return self.submit(job).result()
+
+    def map(self, jobs: Iterable[RenderJob]) -> Iterator[RenderResult]:
+        """Renders jobs concurrently, and yields the results in order."""
+        futures = [self.submit(job) for job in jobs]
+        for future in futures:
+            yield future.result()
+
+    def check_health(self, timeout: float = 10.0) -> list[WorkerHealth]:
+        """Queries the workers' health, in the order that they report it.
+
+        A query is sent for each worker.  Each worker that reports then waits until
+        all of them have, so that the executor can't hand two queries to the same
+        worker.  If not every worker has reported within ``timeout`` seconds (e.g.
+        it's stuck, or it crashed and broke the pool), the worker pool is restarted.
+        """
+        deadline = time.monotonic() + timeout
+        self._health_channel.release.clear()
+        restart_count = self.restart_count
+        futures = [
+            self._submit(_check_health, timeout) for _ in range(self.max_workers)
+        ]
+        if self.restart_count != restart_count:
+            # (The worker pool was broken, so the queries sent before it was restarted
+            # are lost.)
+            futures = [
+                self._submit(_check_health, timeout) for _ in range(self.max_workers)
+            ]
+        channel = self._health_channel
+        healths: dict[int, WorkerHealth] = {}
+        with contextlib.suppress(queue.Empty):
+            while len(healths) < self.max_workers:
+                health = channel.queue.get(timeout=max(deadline - time.monotonic(), 0))
+                healths[health.pid] = health
+        channel.release.set()
+        _, not_done = concurrent.futures.wait(
+            futures, max(deadline - time.monotonic(), 0)
+        )
+        if len(healths) < self.max_workers or not_done:
+            self.restart()
+        return list(healths.values())
+
+    def restart(self) -> None:
+        """Replaces the worker pool, terminating the current workers."""
+        # (A fresh channel, since the terminated workers could leave late or partial
+        # reports in the queue.)
+        self._health_channel = self._create_health_channel()
+        old_executor, self._executor = self._executor, self._create_executor()
+        self._num_submitted = 0
+        # (There's no public API for the worker processes, so this relies on a private
+        # attribute - which is cleared by `shutdown`, hence before it.  Without it, the
+        # workers just exit once they finish their current jobs.)
+        processes = getattr(old_executor, '_processes', None) or {}
+        old_executor.shutdown(wait=False, cancel_futures=True)
+        for process in list(processes.values()):
+            process.terminate()
+        self.restart_count += 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shuts the workers down."""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _create_health_channel(self) -> _HealthChannel:
+        return _HealthChannel(self._mp_context.Queue(), self._mp_context.Event())
+
+    def _create_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        return concurrent.futures.ProcessPoolExecutor(
+            self.max_workers,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(*self._init_args, self._health_channel),
+        )
+
+    def _recycle(self) -> None:
+        # (Rather than `max_tasks_per_child`, which can hang in some Python versions
+        # when it's time to replace the last worker.)
+        old_executor, self._executor = self._executor, self._create_executor()
+        self._num_submitted = 0
+        old_executor.shutdown(wait=False)
+        self.recycle_count += 1
+
+    def _submit(
+        self,
+        func: Callable[..., _T],
+        *args: object,
+    ) -> concurrent.futures.Future[_T]:
+        try:
+            future = self._executor.submit(func, *args)
+        except BrokenProcessPool:
+            self.restart()
+            future = self._executor.submit(func, *args)
+        return future
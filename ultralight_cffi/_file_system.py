@@ -0,0 +1,411 @@
+"""Python-level ``ULFileSystem`` implementations, for serving ``file:///`` URLs and
+other resource lookups from Python rather than from a directory on disk."""
+
+from __future__ import annotations
+
+import abc
+import collections
+import functools
+import itertools
+import mimetypes
+import mmap
+import os
+import pathlib
+import posixpath
+from . import _base
+from . import _stubs
+from ._base import NULL
+from ._base import CData
+from ._base import ffi
+from ._string import create_string
+from ._string import get_string
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+from typing import Self
+from typing import cast
+from typing_extensions import Buffer
+
+_DEFAULT_MIME_TYPE = 'application/octet-stream'
+
+
+class CustomFileSystem(abc.ABC):
+    """Python-level abstraction for user-defined file systems, akin to
+    :class:`CustomSurface`.
+
+    Ultralight supports a single, process-wide file system, and its callbacks don't
+    carry a ``user_data`` pointer, so the callbacks dispatch to whichever instance was
+    most recently :meth:`install`-ed.  Paths are relative to the file system's root,
+    e.g. ``'app/index.html'`` for ``file:///app/index.html``.
+    """
+
+    def install(self) -> None:
+        """Makes this the active file system (:func:`ulPlatformSetFileSystem`).
+
+        This must be done before creating the renderer.
+        """
+        global _active  # pylint: disable=global-statement
+        _active = self
+        _stubs.ulPlatformSetFileSystem(cast(Any, _get_definition())[0])
+
+    @abc.abstractmethod
+    def file_exists(self, path: str) -> bool:
+        raise NotImplementedError()
+
+    def get_file_mime_type(self, path: str) -> str:
+        """Returns the file's MIME type; guessed from its extension by default (see
+        :func:`guess_mime_type`)."""
+        return guess_mime_type(path)
+
+    def get_file_charset(self, path: str) -> str:
+        """Returns the file's charset; UTF-8 by default."""
+        del path
+        return 'utf-8'
+
+    @abc.abstractmethod
+    def open_file(self, path: str) -> Buffer | None:
+        """Returns the file's contents, or ``None`` if it can't be opened.
+
+        The returned buffer is passed to Ultralight without copying, and is kept alive
+        (and must not be modified) until Ultralight destroys the ``ULBuffer``.
+        """
+        raise NotImplementedError()
+
+
+class AssetFileSystem(CustomFileSystem):
+    """A file system that serves preloaded assets from memory, by path.
+
+    Example::
+
+        AssetFileSystem({'index.html': b'<h1>Hello</h1>'}).install()
+        ...
+        ulViewLoadURL(view, url_string)  # for 'file:///index.html'
+    """
+
+    def __init__(
+        self,
+        assets: Mapping[str, Buffer] | None = None,
+        *,
+        charset: str = 'utf-8',
+    ) -> None:
+        self.assets: dict[str, Buffer] = {}
+        self.charset = charset
+        for path, data in (assets or {}).items():
+            self.add(path, data)
+
+    @classmethod
+    def from_directory(cls, root: pathlib.Path | str, **kwargs: Any) -> Self:
+        """Preloads all the files under a directory."""
+        root = pathlib.Path(root)
+        return cls(
+            {
+                path.relative_to(root).as_posix(): path.read_bytes()
+                for path in sorted(root.rglob('*'))
+                if path.is_file()
+            },
+            **kwargs,
+        )
+
+    def add(self, path: str, data: Buffer) -> None:
+        """Adds (or replaces) an asset."""
+        self.assets[normalize_path(path)] = data
+
+    def file_exists(self, path: str) -> bool:
+        return normalize_path(path) in self.assets
+
+    def get_file_charset(self, path: str) -> str:
+        return self.charset
+
+    def open_file(self, path: str) -> Buffer | None:
+        return self.assets.get(normalize_path(path))
+
+
+class MappedFileSystem(CustomFileSystem):
+    """A file system that serves the files under a directory by memory-mapping them,
+    rather than reading them into Python objects.
+
+    The mappings are handed to Ultralight without copying, and closed once Ultralight
+    releases them, so large assets (fonts, images, script bundles) don't need to be
+    held in memory twice, and processes serving the same files share the page cache's
+    pages.  Files smaller than ``mmap_threshold`` bytes are just read, since each
+    mapping takes at least a whole page.
+
+    Paths that escape ``root`` (e.g. via ``..``) are treated as nonexistent.
+    """
+
+    def __init__(
+        self,
+        root: pathlib.Path | str,
+        *,
+        mmap_threshold: int = 16 * 1024,
+        charset: str = 'utf-8',
+    ) -> None:
+        self.root = pathlib.Path(root).resolve()
+        self.mmap_threshold = mmap_threshold
+        self.charset = charset
+
+    def file_exists(self, path: str) -> bool:
+        file_path = self._resolve(path)
+        return file_path is not None and file_path.is_file()
+
+    def get_file_charset(self, path: str) -> str:
+        return self.charset
+
+    def open_file(self, path: str) -> Buffer | None:
+        file_path = self._resolve(path)
+        data: Buffer | None = None
+        if file_path is not None and file_path.is_file():
+            with file_path.open('rb') as file:
+                size = os.fstat(file.fileno()).st_size
+                # (Empty files can't be mapped.)
+                if size < max(self.mmap_threshold, 1):
+                    data = file.read()
+                else:
+                    data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return data
+
+    def _resolve(self, path: str) -> pathlib.Path | None:
+        file_path = (self.root / normalize_path(path)).resolve()
+        return file_path if file_path.is_relative_to(self.root) else None
+
+
+@dataclass
+class FileSystemCacheStats:
+    """Counters for a :class:`CachingFileSystem`."""
+
+    hits: int = 0
+    """:meth:`~CachingFileSystem.open_file` calls served from the cache."""
+    misses: int = 0
+    """:meth:`~CachingFileSystem.open_file` calls passed on to the wrapped file
+    system."""
+    evictions: int = 0
+    """Files evicted from the cache to stay within ``max_bytes``."""
+    negative_hits: int = 0
+    """:meth:`~CachingFileSystem.file_exists` calls answered by the negative cache."""
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of :meth:`~CachingFileSystem.open_file` calls that were hits
+        (or 0 if there were none)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CachingFileSystem(CustomFileSystem):
+    """Wraps another file system with an in-memory cache, since WebCore requests the
+    same stylesheets, fonts, images, etc. over and over across views and reloads.
+
+    - Opened files are kept, zero-copy, in an LRU cache of at most ``max_bytes`` bytes
+      in total, and files that don't fit are just passed through.
+    - Paths found to be missing are remembered (up to ``max_missing`` of them), so
+      repeated :meth:`file_exists` checks for them don't reach the wrapped file
+      system.
+    - MIME types and charsets are memoized by path.
+
+    Call :meth:`clear` if the underlying files change.
+
+    Example::
+
+        CachingFileSystem(MappedFileSystem('assets'), max_bytes=256 << 20).install()
+    """
+
+    def __init__(
+        self,
+        file_system: CustomFileSystem,
+        *,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_missing: int = 4096,
+    ) -> None:
+        self.file_system = file_system
+        self.max_bytes = max_bytes
+        self.max_missing = max_missing
+        self.stats = FileSystemCacheStats()
+        self.num_bytes = 0
+        """The total size of the cached files."""
+        self._files: collections.OrderedDict[str, memoryview] = (
+            collections.OrderedDict()
+        )
+        self._missing: collections.OrderedDict[str, None] = collections.OrderedDict()
+        self._mime_types: dict[str, str] = {}
+        self._charsets: dict[str, str] = {}
+
+    def clear(self) -> None:
+        """Empties all the caches."""
+        self._files.clear()
+        self._missing.clear()
+        self._mime_types.clear()
+        self._charsets.clear()
+        self.num_bytes = 0
+
+    def file_exists(self, path: str) -> bool:
+        key = normalize_path(path)
+        if key in self._files:
+            exists = True
+        elif key in self._missing:
+            self._missing.move_to_end(key)
+            self.stats.negative_hits += 1
+            exists = False
+        else:
+            exists = self.file_system.file_exists(path)
+            if not exists:
+                self._add_missing(key)
+        return exists
+
+    def get_file_mime_type(self, path: str) -> str:
+        key = normalize_path(path)
+        mime_type = self._mime_types.get(key)
+        if mime_type is None:
+            mime_type = self._mime_types[key] = self.file_system.get_file_mime_type(
+                path
+            )
+        return mime_type
+
+    def get_file_charset(self, path: str) -> str:
+        key = normalize_path(path)
+        charset = self._charsets.get(key)
+        if charset is None:
+            charset = self._charsets[key] = self.file_system.get_file_charset(path)
+        return charset
+
+    def open_file(self, path: str) -> Buffer | None:
+        key = normalize_path(path)
+        data: Buffer | None = self._files.get(key)
+        if data is not None:
+            self._files.move_to_end(key)
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+            data = self.file_system.open_file(path)
+            if data is None:
+                self._add_missing(key)
+            else:
+                view = memoryview(data).cast('B')
+                if view.nbytes <= self.max_bytes:
+                    # (The view keeps the data, e.g. a memory map, alive and open.)
+                    data = view
+                    self._add_file(key, view)
+        return data
+
+    def _add_file(self, key: str, view: memoryview) -> None:
+        self._files[key] = view
+        self.num_bytes += view.nbytes
+        while self.num_bytes > self.max_bytes:
+            _, evicted = self._files.popitem(last=False)
+            self.num_bytes -= evicted.nbytes
+            self.stats.evictions += 1
+
+    def _add_missing(self, key: str) -> None:
+        self._missing[key] = None
+        self._missing.move_to_end(key)
+        while len(self._missing) > self.max_missing:
+            self._missing.popitem(last=False)
+
+
+@functools.cache
+def _get_mime_types() -> dict[str, str]:
+    """Returns the file extension to MIME type table, built once from
+    :mod:`mimetypes`."""
+    mimetypes.init()
+    return dict(mimetypes.types_map)
+
+
+def guess_mime_type(path: str) -> str:
+    """Guesses a file's MIME type from its extension, with a precomputed table (rather
+    than :func:`mimetypes.guess_type`, which parses the path as a URL each time)."""
+    extension = posixpath.splitext(path)[1]
+    mime_types = _get_mime_types()
+    return (
+        mime_types.get(extension)
+        or mime_types.get(extension.lower())
+        or _DEFAULT_MIME_TYPE
+    )
+
+
+def normalize_path(path: str) -> str:
+    """Normalizes a file system path to the ``'dir/file'`` form used as keys."""
+    return path.replace('\\', '/').lstrip('/')
+
+
+_active: CustomFileSystem | None = None
+
+
+def get_active_file_system() -> CustomFileSystem | None:
+    """Returns the most recently installed :class:`CustomFileSystem`, if any."""
+    return _active
+
+
+def _get_active() -> CustomFileSystem:
+    if _active is None:
+        raise RuntimeError('No CustomFileSystem installed')
+    return _active
+
+
+_buffer_ids = itertools.count(1)
+_open_buffers: dict[int, tuple[CData, Buffer]] = {}
+"""The ``ffi.from_buffer`` objects backing the open ``ULBuffer``s, and the underlying
+Python buffers, by ID, which are kept alive until Ultralight destroys the
+``ULBuffer``s."""
+
+
+def _create_buffer(data: Buffer) -> _stubs.ULBuffer:
+    """Wraps a Python buffer in a ``ULBuffer`` without copying it.
+
+    Memory maps (:class:`mmap.mmap`) are closed once the ``ULBuffer`` is destroyed.
+    """
+    buffer_id = next(_buffer_ids)
+    pointer = ffi.from_buffer(data)
+    _open_buffers[buffer_id] = (pointer, data)
+    return _stubs.ulCreateBuffer(
+        pointer,
+        len(pointer),
+        ffi.cast('void*', buffer_id),
+        _on_destroy_buffer,
+    )
+
+
+@_base.callback('void(void*, void*)')
+def _on_destroy_buffer(user_data: CData, data: CData) -> None:
+    del data
+    entry = _open_buffers.pop(_base.get_address(user_data), None)
+    if entry is not None:
+        pointer, buffer = entry
+        ffi.release(pointer)
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+
+
+@_base.callback('_Bool(ULString)')
+def _cb__file_exists(path: _stubs.ULString) -> bool:
+    return _get_active().file_exists(get_string(path))
+
+
+@_base.callback('ULString(ULString)')
+def _cb__get_file_mime_type(path: _stubs.ULString) -> _stubs.ULString:
+    # (Ultralight takes ownership of the returned string.)
+    return create_string(_get_active().get_file_mime_type(get_string(path)))
+
+
+@_base.callback('ULString(ULString)')
+def _cb__get_file_charset(path: _stubs.ULString) -> _stubs.ULString:
+    return create_string(_get_active().get_file_charset(get_string(path)))
+
+
+@_base.callback('ULBuffer(ULString)')
+def _cb__open_file(path: _stubs.ULString) -> _stubs.ULBuffer:
+    data = _get_active().open_file(get_string(path))
+    return NULL if data is None else _create_buffer(data)
+
+
+_definition: _stubs.ULFileSystem | None = None
+
+
+def _get_definition() -> _stubs.ULFileSystem:
+    """Returns the singleton ``ULFileSystem`` definition, creating it on first use."""
+    global _definition  # pylint: disable=global-statement
+    if _definition is None:
+        _definition = cast(_stubs.ULFileSystem, ffi.new('ULFileSystem*'))
+        _definition.file_exists = _cb__file_exists
+        _definition.get_file_mime_type = _cb__get_file_mime_type
+        _definition.get_file_charset = _cb__get_file_charset
+        _definition.open_file = _cb__open_file
+    return _definition
@@ -0,0 +1,196 @@
+"""Instrumentation for file systems, to find out how much time page loads spend on
+resource loading, and on which files."""
+
+from __future__ import annotations
+
+import collections
+import random
+import time
+from ._file_system import CustomFileSystem
+from ._file_system import normalize_path
+from collections.abc import Callable
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Literal
+from typing import NamedTuple
+from typing import TypeVar
+from typing import cast
+from typing_extensions import Buffer
+
+_T = TypeVar('_T')
+
+FileSystemOp = Literal[
+    'file_exists', 'get_file_mime_type', 'get_file_charset', 'open_file'
+]
+
+
+class FileSystemEvent(NamedTuple):
+    """A recorded :class:`CustomFileSystem` call."""
+
+    path: str
+    op: FileSystemOp
+    size: int
+    """The number of bytes returned by ``open_file`` (or 0 for the other calls, and for
+    missing files)."""
+    duration: float
+    """In seconds."""
+
+
+@dataclass(frozen=True)
+class PathSummary:
+    """The recorded calls for a single path."""
+
+    path: str
+    calls: int
+    opens: int
+    total_bytes: int
+    total_duration: float
+    max_duration: float
+
+
+@dataclass(frozen=True)
+class FileSystemReport:
+    """A summary of the events recorded by an :class:`InstrumentedFileSystem`."""
+
+    num_events: int
+    total_duration: float
+    slowest: list[PathSummary]
+    """The paths with the most total time spent, in descending order."""
+    largest: list[PathSummary]
+    """The paths with the most bytes opened, in descending order."""
+    repeated: list[PathSummary]
+    """The paths opened more than once, most often first."""
+
+    def format(self) -> str:
+        """Formats the report as text, e.g. for logging."""
+        lines = [
+            f'{self.num_events} file system calls, '
+            f'{self.total_duration * 1000:.3f} ms in total'
+        ]
+        for title, summaries in (
+            ('Slowest', self.slowest),
+            ('Largest', self.largest),
+            ('Repeatedly opened', self.repeated),
+        ):
+            lines.append(f'{title}:')
+            lines.extend(
+                f'  {summary.path}: {summary.opens} opens, {summary.calls} calls, '
+                f'{summary.total_bytes} bytes, {summary.total_duration * 1000:.3f} ms '
+                f'(max {summary.max_duration * 1000:.3f} ms)'
+                for summary in summaries
+            )
+        return '\n'.join(lines)
+
+
+def _summarize_events(
+    events: Iterable[FileSystemEvent], top_n: int = 10
+) -> FileSystemReport:
+    """Aggregates recorded events by path into a :class:`FileSystemReport`."""
+    calls: collections.Counter[str] = collections.Counter()
+    opens: collections.Counter[str] = collections.Counter()
+    total_bytes: collections.Counter[str] = collections.Counter()
+    total_durations: dict[str, float] = collections.defaultdict(float)
+    max_durations: dict[str, float] = collections.defaultdict(float)
+    num_events = 0
+    for event in events:
+        num_events += 1
+        calls[event.path] += 1
+        if event.op == 'open_file':
+            opens[event.path] += 1
+            total_bytes[event.path] += event.size
+        total_durations[event.path] += event.duration
+        max_durations[event.path] = max(max_durations[event.path], event.duration)
+
+    summaries = {
+        path: PathSummary(
+            path,
+            calls[path],
+            opens[path],
+            total_bytes[path],
+            total_durations[path],
+            max_durations[path],
+        )
+        for path in calls
+    }
+    return FileSystemReport(
+        num_events,
+        sum(total_durations.values()),
+        sorted(summaries.values(), key=lambda s: -s.total_duration)[:top_n],
+        sorted(
+            (s for s in summaries.values() if s.total_bytes),
+            key=lambda s: -s.total_bytes,
+        )[:top_n],
+        sorted((s for s in summaries.values() if s.opens > 1), key=lambda s: -s.opens)[
+            :top_n
+        ],
+    )
+
+
+class InstrumentedFileSystem(CustomFileSystem):
+    """Wraps another file system, recording each call (path, operation, bytes returned
+    and duration) as a :class:`FileSystemEvent` in a ring buffer of the most recent
+    ``capacity`` events.
+
+    The overhead is a couple of clock reads and a :class:`collections.deque` append per
+    recorded call.  To reduce it further, set ``sample_rate`` to record only that
+    fraction of the calls, chosen at random.
+
+    (Ultralight's own platform file system, from :func:`ulEnablePlatformFileSystem`,
+    can't be wrapped, since it's native; :class:`MappedFileSystem` is a drop-in
+    replacement that can be.)
+
+    Example::
+
+        file_system = InstrumentedFileSystem(MappedFileSystem('assets'))
+        file_system.install()
+        ...
+        print(file_system.report().format())
+    """
+
+    def __init__(
+        self,
+        file_system: CustomFileSystem,
+        *,
+        capacity: int = 10_000,
+        sample_rate: float = 1.0,
+    ) -> None:
+        self.file_system = file_system
+        self.sample_rate = sample_rate
+        self.events: collections.deque[FileSystemEvent] = collections.deque(
+            maxlen=capacity
+        )
+
+    def report(self, top_n: int = 10) -> FileSystemReport:
+        """Summarizes the recorded events."""
+        return _summarize_events(self.events, top_n)
+
+    def file_exists(self, path: str) -> bool:
+        return self._call('file_exists', path, self.file_system.file_exists)
+
+    def get_file_mime_type(self, path: str) -> str:
+        return self._call(
+            'get_file_mime_type', path, self.file_system.get_file_mime_type
+        )
+
+    def get_file_charset(self, path: str) -> str:
+        return self._call('get_file_charset', path, self.file_system.get_file_charset)
+
+    def open_file(self, path: str) -> Buffer | None:
+        return self._call('open_file', path, self.file_system.open_file)
+
+    def _call(self, op: FileSystemOp, path: str, func: Callable[[str], _T]) -> _T:
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            result = func(path)
+        else:
+            start = time.perf_counter()
+            result = func(path)
+            duration = time.perf_counter() - start
+            size = (
+                memoryview(cast(Buffer, result)).nbytes
+                if op == 'open_file' and result is not None
+                else 0
+            )
+            self.events.append(
+                FileSystemEvent(normalize_path(path), op, size, duration)
+            )
+        return result
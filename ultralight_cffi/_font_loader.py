@@ -0,0 +1,639 @@
+"""Python-level ``ULFontLoader`` implementations, for loading fonts from a prebuilt
+index of a font directory rather than via the OS font lookup."""
+
+from __future__ import annotations
+
+import abc
+import bisect
+import collections
+import json
+import os
+import pathlib
+import struct
+from . import _base
+from . import _stubs
+from ._base import NULL
+from ._base import ffi
+from ._base import logger
+from ._file_system import _create_buffer
+from ._string import create_string
+from ._string import get_string
+from array import array
+from collections.abc import Iterable
+from collections.abc import Mapping
+from typing import Any
+from typing import NamedTuple
+from typing import Self
+from typing import cast
+from typing_extensions import Buffer
+
+_INDEX_VERSION = 1
+
+_FONT_SUFFIXES = frozenset({'.otf', '.ttc', '.ttf'})
+
+_SFNT_HEADER = struct.Struct('>4sH6x')  # sfntVersion, numTables
+_SFNT_TABLE_RECORD = struct.Struct('>4s4xII')  # tag, offset, length
+_TTC_HEADER = struct.Struct('>4s4xII')  # 'ttcf', numFonts, first offset
+_NAME_HEADER = struct.Struct('>2xHH')  # count, storageOffset
+_NAME_RECORD = struct.Struct(
+    '>HHHHHH'
+)  # platform, encoding, language, ID, length, offset
+
+_NAME_ID_FAMILY = 1
+_NAME_ID_TYPOGRAPHIC_FAMILY = 16
+_PLATFORM_UNICODE = 0
+_PLATFORM_MAC = 1
+_PLATFORM_WINDOWS = 3
+_LANGUAGE_WINDOWS_EN_US = 0x409
+
+_OS2_WEIGHT_CLASS = struct.Struct('>4xH')
+_OS2_FS_SELECTION = struct.Struct('>62xH')
+_OS2_FS_SELECTION_ITALIC = 0x1 | 0x200  # (Italic or oblique.)
+_HEAD_MAC_STYLE = struct.Struct('>44xH')
+_HEAD_MAC_STYLE_BOLD = 0x1
+_HEAD_MAC_STYLE_ITALIC = 0x2
+
+_CMAP_HEADER = struct.Struct('>2xH')  # numTables
+_CMAP_ENCODING_RECORD = struct.Struct('>HHI')  # platform, encoding, offset
+_CMAP_FORMAT_4_HEADER = struct.Struct('>6xH6x')  # segCountX2
+_CMAP_FORMAT_12_HEADER = struct.Struct('>8x4xI')  # numGroups
+_CMAP_FORMAT_12_GROUP = struct.Struct('>II4x')  # startCharCode, endCharCode
+_CMAP_ENCODINGS = [
+    # (In order of preference: full Unicode, then BMP-only.)
+    (_PLATFORM_WINDOWS, 10),
+    (_PLATFORM_UNICODE, 6),
+    (_PLATFORM_UNICODE, 4),
+    (_PLATFORM_WINDOWS, 1),
+    (_PLATFORM_UNICODE, 3),
+    (_PLATFORM_UNICODE, 2),
+    (_PLATFORM_UNICODE, 1),
+    (_PLATFORM_UNICODE, 0),
+]
+
+
+class FontCoverage:
+    """The Unicode codepoints that a font has glyphs for, as sorted, disjoint ranges,
+    so that membership tests are a binary search."""
+
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()) -> None:
+        """Merges the given (inclusive) ranges, which may overlap."""
+        self.starts = array('I')
+        self.ends = array('I')
+        for start, end in sorted(ranges):
+            if self.ends and start <= self.ends[-1] + 1:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __contains__(self, codepoint: object) -> bool:
+        i = bisect.bisect_right(self.starts, cast(int, codepoint)) - 1
+        return i >= 0 and cast(int, codepoint) <= self.ends[i]
+
+    def __len__(self) -> int:
+        """Returns the number of codepoints covered."""
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, FontCoverage)
+            and self.starts == other.starts
+            and self.ends == other.ends
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.starts.tobytes(), self.ends.tobytes()))
+
+    @classmethod
+    def from_list(cls, values: list[int]) -> Self:
+        """The inverse of :meth:`to_list`."""
+        return cls(zip(values[::2], values[1::2]))
+
+    def to_list(self) -> list[int]:
+        """Returns the ranges as a flat ``[start, end, start, end, ...]`` list, for
+        serialization."""
+        return [value for pair in zip(self.starts, self.ends) for value in pair]
+
+
+class FontFace(NamedTuple):
+    """A font file's family and style, as recorded in a :class:`FontIndex`."""
+
+    family: str
+    weight: int
+    """From 100 (thin) to 900 (black); 400 is regular, and 700 is bold."""
+    italic: bool
+    path: str
+    """The file's path relative to the index's root, with forward slashes."""
+
+
+def _read_tables(data: bytes, offset: int) -> dict[bytes, bytes]:
+    """Reads the tables of the sfnt font at the given offset."""
+    _, num_tables = _SFNT_HEADER.unpack_from(data, offset)
+    tables = {}
+    for i in range(num_tables):
+        tag, table_offset, length = _SFNT_TABLE_RECORD.unpack_from(
+            data, offset + _SFNT_HEADER.size + i * _SFNT_TABLE_RECORD.size
+        )
+        tables[tag] = data[table_offset : table_offset + length]
+    return tables
+
+
+def _decode_name(platform: int, encoding: int, raw: bytes) -> str | None:
+    name: str | None = None
+    if platform in (_PLATFORM_UNICODE, _PLATFORM_WINDOWS) and encoding in (0, 1, 3, 10):
+        name = raw.decode('utf-16-be', 'replace')
+    elif platform == _PLATFORM_MAC and encoding == 0:
+        name = raw.decode('mac_roman', 'replace')
+    return name
+
+
+def _read_family_names(name_table: bytes) -> list[str]:
+    """Returns the typographic family name (e.g. ``'Roboto'``) and legacy family name
+    (e.g. ``'Roboto Light'``) from a ``name`` table, preferring US English."""
+    count, storage_offset = _NAME_HEADER.unpack_from(name_table)
+    candidates: dict[int, list[tuple[bool, str]]] = {
+        _NAME_ID_TYPOGRAPHIC_FAMILY: [],
+        _NAME_ID_FAMILY: [],
+    }
+    for i in range(count):
+        platform, encoding, language, name_id, length, offset = (
+            _NAME_RECORD.unpack_from(
+                name_table, _NAME_HEADER.size + i * _NAME_RECORD.size
+            )
+        )
+        if name_id in candidates:
+            raw = name_table[storage_offset + offset : storage_offset + offset + length]
+            name = _decode_name(platform, encoding, raw)
+            if name:
+                is_english = (platform, language) in (
+                    (_PLATFORM_WINDOWS, _LANGUAGE_WINDOWS_EN_US),
+                    (_PLATFORM_MAC, 0),
+                )
+                candidates[name_id].append((not is_english, name))
+    names = []
+    for name_id in (_NAME_ID_TYPOGRAPHIC_FAMILY, _NAME_ID_FAMILY):
+        if candidates[name_id]:
+            name = min(candidates[name_id])[1]
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def _read_cmap_ranges(cmap: bytes, offset: int) -> list[tuple[int, int]]:
+    """Reads the codepoint ranges of a format 4 or 12 ``cmap`` subtable."""
+    (subtable_format,) = struct.unpack_from('>H', cmap, offset)
+    ranges = []
+    if subtable_format == 4:
+        ranges = _read_cmap_format_4_ranges(cmap, offset)
+    elif subtable_format == 12:
+        (num_groups,) = _CMAP_FORMAT_12_HEADER.unpack_from(cmap, offset)
+        ranges = [
+            _CMAP_FORMAT_12_GROUP.unpack_from(
+                cmap,
+                offset + _CMAP_FORMAT_12_HEADER.size + i * _CMAP_FORMAT_12_GROUP.size,
+            )
+            for i in range(num_groups)
+        ]
+    return ranges
+
+
+def _read_cmap_format_4_ranges(cmap: bytes, offset: int) -> list[tuple[int, int]]:
+    """Reads the codepoint ranges of a format 4 ``cmap`` subtable."""
+    (seg_count_x2,) = _CMAP_FORMAT_4_HEADER.unpack_from(cmap, offset)
+    array_format = f'>{seg_count_x2 // 2}H'
+    # (The arrays are endCode, reservedPad, startCode, idDelta and idRangeOffset.)
+    end_codes_offset = offset + _CMAP_FORMAT_4_HEADER.size
+    id_range_offsets_offset = end_codes_offset + seg_count_x2 * 3 + 2
+    end_codes = struct.unpack_from(array_format, cmap, end_codes_offset)
+    start_codes = struct.unpack_from(
+        array_format, cmap, end_codes_offset + seg_count_x2 + 2
+    )
+    id_deltas = struct.unpack_from(
+        array_format, cmap, id_range_offsets_offset - seg_count_x2
+    )
+    id_range_offsets = struct.unpack_from(array_format, cmap, id_range_offsets_offset)
+    ranges = []
+    for i, (start, end) in enumerate(zip(start_codes, end_codes)):
+        # (Ignoring the final 0xFFFF segment, which is only there as a terminator.)
+        if start == 0xFFFF:
+            continue
+        if id_range_offsets[i]:
+            # (The offset is relative to its own position in the idRangeOffset array.)
+            ranges += _read_cmap_format_4_glyph_ids(
+                cmap,
+                id_range_offsets_offset + i * 2 + id_range_offsets[i],
+                start,
+                end,
+                id_deltas[i],
+            )
+        else:
+            ranges.append((start, end))
+    return ranges
+
+
+def _read_cmap_format_4_glyph_ids(
+    cmap: bytes, offset: int, start: int, end: int, id_delta: int
+) -> list[tuple[int, int]]:
+    """Reads the codepoint ranges of a format 4 segment that maps through the glyph ID
+    array (at ``offset``), leaving out the codepoints that map to the missing glyph
+    (0)."""
+    ranges: list[tuple[int, int]] = []
+    for codepoint in range(start, end + 1):
+        glyph_id_offset = offset + (codepoint - start) * 2
+        glyph_id = 0
+        if glyph_id_offset + 2 <= len(cmap):
+            (glyph_id,) = struct.unpack_from('>H', cmap, glyph_id_offset)
+        if glyph_id and (glyph_id + id_delta) & 0xFFFF:
+            if ranges and ranges[-1][1] == codepoint - 1:
+                ranges[-1] = (ranges[-1][0], codepoint)
+            else:
+                ranges.append((codepoint, codepoint))
+    return ranges
+
+
+def _read_font_coverage(tables: dict[bytes, bytes]) -> FontCoverage:
+    """Reads the codepoints covered by the preferred Unicode ``cmap`` subtable (empty
+    if there's none)."""
+    cmap = tables.get(b'cmap', b'')
+    subtables: dict[tuple[int, int], int] = {}
+    if cmap:
+        (num_tables,) = _CMAP_HEADER.unpack_from(cmap)
+        for i in range(num_tables):
+            platform, encoding, offset = _CMAP_ENCODING_RECORD.unpack_from(
+                cmap, _CMAP_HEADER.size + i * _CMAP_ENCODING_RECORD.size
+            )
+            subtables.setdefault((platform, encoding), offset)
+    ranges: list[tuple[int, int]] = []
+    for encoding in _CMAP_ENCODINGS:
+        if encoding in subtables:
+            ranges = _read_cmap_ranges(cmap, subtables[encoding])
+            if ranges:
+                break
+    return FontCoverage(ranges)
+
+
+def _read_sfnt_tables(data: bytes) -> dict[bytes, bytes]:
+    """Reads the tables of a TrueType/OpenType font file.
+
+    For font collections (``.ttc``), only the first font is read, since that's the one
+    Ultralight loads from the file.
+
+    Raises:
+        :class:`ValueError`: If the data isn't a supported font file.
+    """
+    offset = 0
+    if data[:4] == b'ttcf':
+        _, num_fonts, offset = _TTC_HEADER.unpack_from(data)
+        if not num_fonts:
+            raise ValueError('Empty font collection')
+    elif data[:4] not in (b'\x00\x01\x00\x00', b'OTTO', b'true'):
+        raise ValueError('Not a TrueType/OpenType font')
+    try:
+        tables = _read_tables(data, offset)
+    except struct.error as e:
+        raise ValueError(f'Malformed font: {e!r}') from e
+    return tables
+
+
+def _read_font(data: bytes) -> tuple[list[tuple[str, int, bool]], FontCoverage]:
+    """Reads the family names, weight and italicness of a TrueType/OpenType font file,
+    as ``(family, weight, italic)`` tuples - one per family name - and its coverage.
+
+    Raises:
+        :class:`ValueError`: If the data isn't a supported font file.
+    """
+    tables = _read_sfnt_tables(data)
+    try:
+        families = _read_family_names(tables[b'name'])
+        if b'OS/2' in tables:
+            (weight,) = _OS2_WEIGHT_CLASS.unpack_from(tables[b'OS/2'])
+            (fs_selection,) = _OS2_FS_SELECTION.unpack_from(tables[b'OS/2'])
+            italic = bool(fs_selection & _OS2_FS_SELECTION_ITALIC)
+        else:
+            (mac_style,) = _HEAD_MAC_STYLE.unpack_from(tables[b'head'])
+            weight = 700 if mac_style & _HEAD_MAC_STYLE_BOLD else 400
+            italic = bool(mac_style & _HEAD_MAC_STYLE_ITALIC)
+        coverage = _read_font_coverage(tables)
+    except (KeyError, struct.error) as e:
+        raise ValueError(f'Malformed font: {e!r}') from e
+    return [
+        (family, min(max(weight, 1), 1000), italic) for family in families
+    ], coverage
+
+
+def _get_weight_rank(desired: int, weight: int) -> tuple[int, int]:
+    """Ranks a font weight (lower is better) by the CSS font matching rules."""
+    if desired > 500:
+        rank = (0, weight - desired) if weight >= desired else (1, desired - weight)
+    elif desired < 400:
+        rank = (0, desired - weight) if weight <= desired else (1, weight - desired)
+    elif desired <= weight <= 500:
+        rank = (0, weight - desired)
+    else:
+        rank = (1, desired - weight) if weight < desired else (2, weight - desired)
+    return rank
+
+
+class FontIndex:
+    """An index of the fonts in a directory, by family, weight and italicness, along
+    with each font file's :class:`FontCoverage`.
+
+    Building the index reads every font file's headers, so it's best done offline (e.g.
+    when building a container image), and :meth:`save`-d next to the fonts; loading a
+    saved index is just a matter of parsing the JSON.
+
+    Example::
+
+        FontIndex.build('fonts').save('fonts/index.json')  # (Offline.)
+        ...
+        IndexedFontLoader(FontIndex.load('fonts/index.json')).install()
+    """
+
+    def __init__(
+        self,
+        root: pathlib.Path | str,
+        faces: Iterable[FontFace],
+        coverage: Mapping[str, FontCoverage] | None = None,
+    ) -> None:
+        self.root = pathlib.Path(root)
+        self.faces = list(faces)
+        self.coverage = dict(coverage or {})
+        """Each font file's coverage, by path."""
+        self._faces_by_family: dict[str, list[FontFace]] = {}
+        for face in self.faces:
+            self._faces_by_family.setdefault(face.family.casefold(), []).append(face)
+        self._coverage_by_family = {
+            family: [
+                self.coverage[path]
+                for path in dict.fromkeys(
+                    face.path
+                    for face in self._faces_by_family[family.casefold()]
+                    if face.path in self.coverage
+                )
+            ]
+            for family in self.families
+        }
+
+    @classmethod
+    def build(cls, root: pathlib.Path | str) -> Self:
+        """Indexes the font files (``.otf``, ``.ttc`` and ``.ttf``) under ``root``,
+        recursively, skipping any that can't be read."""
+        root = pathlib.Path(root)
+        faces: list[FontFace] = []
+        coverage = {}
+        for path in sorted(root.rglob('*')):
+            if path.suffix.lower() in _FONT_SUFFIXES and path.is_file():
+                try:
+                    styles, coverage_ = _read_font(path.read_bytes())
+                except (OSError, ValueError) as e:
+                    logger.warning('Skipping font file %s: %s', path, e)
+                    continue
+                relative_path = path.relative_to(root).as_posix()
+                faces.extend(
+                    FontFace(family, weight, italic, relative_path)
+                    for family, weight, italic in styles
+                )
+                coverage[relative_path] = coverage_
+        return cls(root, faces, coverage)
+
+    @classmethod
+    def load(
+        cls,
+        path: pathlib.Path | str,
+        root: pathlib.Path | str | None = None,
+    ) -> Self:
+        """Loads a saved index.  The font paths are relative to ``root``, which
+        defaults to the index file's directory."""
+        path = pathlib.Path(path)
+        saved = json.loads(path.read_text(encoding='utf-8'))
+        if saved.get('version') != _INDEX_VERSION:
+            raise ValueError(f'Unsupported font index version: {saved.get("version")}')
+        return cls(
+            path.parent if root is None else root,
+            (FontFace(*face) for face in saved['faces']),
+            {
+                path: FontCoverage.from_list(ranges)
+                for path, ranges in saved.get('coverage', {}).items()
+            },
+        )
+
+    def save(self, path: pathlib.Path | str) -> None:
+        """Saves the index as JSON (atomically, for concurrently starting workers)."""
+        path = pathlib.Path(path)
+        temp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        temp_path.write_text(
+            json.dumps(
+                {
+                    'version': _INDEX_VERSION,
+                    'faces': self.faces,
+                    'coverage': {
+                        path: coverage.to_list()
+                        for path, coverage in self.coverage.items()
+                    },
+                }
+            ),
+            encoding='utf-8',
+        )
+        os.replace(temp_path, path)
+
+    @property
+    def families(self) -> list[str]:
+        """The indexed family names, sorted."""
+        return sorted({face.family for face in self.faces}, key=str.casefold)
+
+    def get_covering_families(self, codepoint: int) -> list[str]:
+        """Returns the families (in :attr:`families` order) with a font file that
+        covers the codepoint."""
+        return [
+            family
+            for family, coverages in self._coverage_by_family.items()
+            if any(codepoint in coverage for coverage in coverages)
+        ]
+
+    def match(self, family: str, weight: int, italic: bool) -> FontFace | None:
+        """Finds the family's closest matching face, by the CSS font matching rules
+        (italicness first, then weight), or ``None`` if the family isn't indexed."""
+        faces = self._faces_by_family.get(family.casefold())
+        return (
+            None
+            if faces is None
+            else min(
+                faces,
+                key=lambda face: (
+                    face.italic != italic,
+                    _get_weight_rank(weight, face.weight),
+                ),
+            )
+        )
+
+
+class CustomFontLoader(abc.ABC):
+    """Python-level abstraction for user-defined font loaders, akin to
+    :class:`CustomFileSystem`: Ultralight supports a single, process-wide font loader,
+    so its callbacks dispatch to whichever instance was most recently
+    :meth:`install`-ed."""
+
+    def install(self) -> None:
+        """Makes this the active font loader (:func:`ulPlatformSetFontLoader`).
+
+        This must be done before creating the renderer.
+        """
+        global _active  # pylint: disable=global-statement
+        _active = self
+        _stubs.ulPlatformSetFontLoader(cast(Any, _get_definition())[0])
+
+    @abc.abstractmethod
+    def get_fallback_font(self) -> str:
+        """Returns the family name to fall back to when no other font matches."""
+        raise NotImplementedError()
+
+    def get_fallback_font_for_characters(
+        self, characters: str, weight: int, italic: bool
+    ) -> str:
+        """Returns the family name of a font that can render the given characters;
+        :meth:`get_fallback_font` by default."""
+        del characters, weight, italic
+        return self.get_fallback_font()
+
+    @abc.abstractmethod
+    def load(self, family: str, weight: int, italic: bool) -> Buffer | None:
+        """Returns the contents of the font file best matching the description, or
+        ``None`` if there's none.
+
+        The returned buffer is passed to Ultralight without copying, and is kept alive
+        (and must not be modified) until Ultralight releases the font.
+        """
+        raise NotImplementedError()
+
+
+class IndexedFontLoader(CustomFontLoader):
+    """A font loader that serves the fonts in a :class:`FontIndex`.
+
+    Each font file is read once, and its contents are cached for subsequent
+    :meth:`load` calls (e.g. from other renderers or views).
+
+    Fallback fonts for characters are chosen by the indexed coverage: the fallback
+    family if it covers them all, or else the first family that does, or else the
+    family covering the most of them.  The covering families are memoized by
+    codepoint, since text shaping asks for the same characters over and over (e.g. on
+    CJK or emoji heavy pages).
+
+    Raises:
+        :class:`ValueError`: If ``fallback_family`` isn't indexed (by default, the
+        first indexed family is used).
+    """
+
+    def __init__(self, index: FontIndex, *, fallback_family: str | None = None) -> None:
+        if not index.faces:
+            raise ValueError('The font index is empty')
+        fallback_face = index.match(fallback_family or index.families[0], 400, False)
+        if fallback_face is None:
+            raise ValueError(f'Fallback font family not indexed: {fallback_family!r}')
+        self.index = index
+        self.fallback_family = fallback_face.family
+        self._files: dict[str, bytes] = {}
+        self._family_order = [self.fallback_family] + [
+            family for family in index.families if family != self.fallback_family
+        ]
+        self._covering_families: dict[int, frozenset[str]] = {}
+
+    def get_fallback_font(self) -> str:
+        return self.fallback_family
+
+    def get_fallback_font_for_characters(
+        self, characters: str, weight: int, italic: bool
+    ) -> str:
+        """Chooses a family covering the (non-whitespace) characters; see above."""
+        del weight, italic
+        coverings = [
+            self.get_covering_families(ord(character))
+            for character in dict.fromkeys(characters)
+            if not character.isspace()
+        ]
+        counts = collections.Counter(
+            family for covering in coverings for family in covering
+        )
+        return max(
+            self._family_order,
+            key=lambda family: counts[family],  # (The first of the maximal ones.)
+        )
+
+    def get_covering_families(self, codepoint: int) -> frozenset[str]:
+        """Returns the indexed families covering a codepoint (memoized)."""
+        families = self._covering_families.get(codepoint)
+        if families is None:
+            families = frozenset(self.index.get_covering_families(codepoint))
+            self._covering_families[codepoint] = families
+        return families
+
+    def load(self, family: str, weight: int, italic: bool) -> Buffer | None:
+        face = self.index.match(family, weight, italic)
+        return None if face is None else self.read_font(face)
+
+    def read_font(self, face: FontFace) -> bytes:
+        """Returns the face's font file contents, reading it on first use."""
+        data = self._files.get(face.path)
+        if data is None:
+            data = (self.index.root / face.path).read_bytes()
+            self._files[face.path] = data
+        return data
+
+
+_active: CustomFontLoader | None = None
+
+
+def get_active_font_loader() -> CustomFontLoader | None:
+    """Returns the most recently installed :class:`CustomFontLoader`, if any."""
+    return _active
+
+
+def _get_active() -> CustomFontLoader:
+    if _active is None:
+        raise RuntimeError('No CustomFontLoader installed')
+    return _active
+
+
+@_base.callback('ULString()')
+def _cb__get_fallback_font() -> _stubs.ULString:
+    # (Ultralight takes ownership of the returned string.)
+    return create_string(_get_active().get_fallback_font())
+
+
+@_base.callback('ULString(ULString, int, _Bool)')
+def _cb__get_fallback_font_for_characters(
+    characters: _stubs.ULString, weight: int, italic: bool
+) -> _stubs.ULString:
+    return create_string(
+        _get_active().get_fallback_font_for_characters(
+            get_string(characters), weight, italic
+        )
+    )
+
+
+@_base.callback('ULFontFile(ULString, int, _Bool)')
+def _cb__load(family: _stubs.ULString, weight: int, italic: bool) -> _stubs.ULFontFile:
+    data = _get_active().load(get_string(family), weight, italic)
+    font_file: _stubs.ULFontFile = NULL
+    if data is not None:
+        # (Ultralight takes ownership of the font file, which keeps its own reference
+        # to the buffer.)
+        buffer = _create_buffer(data)
+        font_file = _stubs.ulFontFileCreateFromBuffer(buffer)
+        _stubs.ulDestroyBuffer(buffer)
+    return font_file
+
+
+_definition: _stubs.ULFontLoader | None = None
+
+
+def _get_definition() -> _stubs.ULFontLoader:
+    """Returns the singleton ``ULFontLoader`` definition, creating it on first use."""
+    global _definition  # pylint: disable=global-statement
+    if _definition is None:
+        _definition = cast(_stubs.ULFontLoader, ffi.new('ULFontLoader*'))
+        _definition.get_fallback_font = _cb__get_fallback_font
+        _definition.get_fallback_font_for_characters = (
+            _cb__get_fallback_font_for_characters
+        )
+        _definition.load = _cb__load
+    return _definition
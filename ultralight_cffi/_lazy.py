@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import enum
+from . import _base
+from ._base import Lib
+from ._base import Pointer
+from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import MutableMapping
+from typing import Any
+from typing import cast
+
+
+class _AliasScope(Mapping[str, Any]):
+    """Name lookup scope for evaluating the generated type alias expressions, which
+    materializes referenced symbols on demand rather than requiring them to already
+    exist in the module namespace."""
+
+    _BUILTIN_NAMES = {'Any': Any, 'Callable': Callable, 'Pointer': Pointer}
+
+    def __init__(self, symbols: LazySymbols) -> None:
+        self._symbols = symbols
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._BUILTIN_NAMES:
+            value = self._BUILTIN_NAMES[key]
+        elif key in self._symbols:
+            value = self._symbols.resolve(key)
+        else:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._BUILTIN_NAMES)
+
+    def __len__(self) -> int:
+        return len(self._BUILTIN_NAMES)
+
+
+class LazySymbols:
+    """Materializes the generated ``_stubs`` symbols on first access.
+
+    Executing the fully expanded annotation layer up front means building every
+    ``enum.IntEnum``, struct class, and wrapper function at import time, even though a
+    typical program only touches a handful of them.  Instead, ``scripts/_build.py``
+    generates compact tables describing each symbol, and the ``_stubs`` module's PEP 562
+    ``__getattr__`` delegates to :meth:`resolve`, which builds the requested symbol and
+    caches it in the module namespace so that subsequent lookups are ordinary attribute
+    accesses.  Static typing is provided separately by the generated ``_stubs.pyi``.
+    """
+
+    def __init__(
+        self,
+        namespace: MutableMapping[str, Any],
+        *,
+        functions: frozenset[str],
+        enums: Mapping[str, Mapping[str, int]],
+        enum_members: Mapping[str, str],
+        classes: Mapping[str, Mapping[str, str]],
+        type_aliases: Mapping[str, str],
+    ) -> None:
+        self._namespace = namespace
+        self._module_name: str = namespace['__name__']
+        self._functions = functions
+        self._enums = enums
+        self._enum_members = enum_members
+        self._classes = classes
+        self._type_aliases = type_aliases
+        self._wrappers: dict[str, Callable[..., Any]] = {}
+        self._bound_lib: Lib | None = None
+
+    def __contains__(self, name: object) -> bool:
+        return (
+            name in self._functions
+            or name in self._enums
+            or name in self._enum_members
+            or name in self._classes
+            or name in self._type_aliases
+        )
+
+    @property
+    def functions(self) -> frozenset[str]:
+        """The names of all the wrapper functions."""
+        return self._functions
+
+    @property
+    def enum_members(self) -> frozenset[str]:
+        """The names of all the enum members/constants."""
+        return frozenset(self._enum_members)
+
+    def names(self) -> list[str]:
+        """Returns the names of all the symbols, materialized or not."""
+        return sorted(
+            {
+                *self._functions,
+                *self._enums,
+                *self._enum_members,
+                *self._classes,
+                *self._type_aliases,
+            }
+        )
+
+    def resolve(self, name: str) -> Any:
+        """Materializes the symbol called ``name``, caches it in the module namespace,
+        and returns it.
+
+        Raises:
+            :class:`AttributeError`: If there's no such symbol.
+        """
+        value: Any
+        if name in self._namespace:
+            value = self._namespace[name]
+        elif name in self._functions:
+            value = self._get_function(name)
+        elif name in self._enums:
+            value = self._make_enum(name)
+        elif name in self._enum_members:
+            value = getattr(self.resolve(self._enum_members[name]), name)
+        elif name in self._classes:
+            value = type(
+                name,
+                (),
+                {
+                    '__annotations__': dict(self._classes[name]),
+                    '__module__': self._module_name,
+                    '__qualname__': name,
+                },
+            )
+        elif name in self._type_aliases:
+            # The expressions are generated by `scripts/_build.py` from the C headers,
+            # so evaluating them is no riskier than importing an eagerly generated
+            # module would be.
+            value = eval(  # pylint: disable=eval-used
+                self._type_aliases[name],
+                {'__builtins__': __builtins__},
+                _AliasScope(self),
+            )
+        else:
+            raise AttributeError(
+                f'module {self._module_name!r} has no attribute {name!r}'
+            )
+        self._namespace[name] = value
+        return value
+
+    def _make_enum(self, name: str) -> type[enum.IntEnum]:
+        # (mypy only understands the functional enum API with a literal name.)
+        return cast(
+            type[enum.IntEnum],
+            enum.IntEnum(name, dict(self._enums[name]), module=self._module_name),
+        )
+
+    def _get_wrapper(self, name: str) -> Callable[..., Any]:
+        """Returns the (cached) wrapper function that dispatches to the loaded library's
+        function called ``name`` via :func:`_base.get_lib` on every call."""
+        if name not in self._wrappers:
+
+            def wrapper(*args: Any) -> Any:
+                return getattr(_base.get_lib(), name)(*args)
+
+            wrapper.__name__ = wrapper.__qualname__ = name
+            wrapper.__module__ = self._module_name
+            self._wrappers[name] = wrapper
+        return self._wrappers[name]
+
+    def _get_function(self, name: str) -> Callable[..., Any]:
+        func = self._get_wrapper(name)
+        if self._bound_lib is not None:
+            func = getattr(self._bound_lib, name, func)
+        return func
+
+    def bind(
+        self,
+        lib: Lib | None,
+        *namespaces: MutableMapping[str, Any],
+    ) -> None:
+        """Binds the functions directly to ``lib``'s CFFI function objects, or restores
+        the wrappers if ``lib`` is ``None``.
+
+        Functions that were already materialized - in the module namespace or in any of
+        the extra ``namespaces`` that re-export them (e.g. the package) - are rebound in
+        place; the rest are bound accordingly when first accessed.
+        """
+        self._bound_lib = lib
+        for namespace in (self._namespace, *namespaces):
+            for name in self._functions & namespace.keys():
+                namespace[name] = self._get_function(name)
@@ -0,0 +1,229 @@
+"""A ``ULLogger`` that forwards Ultralight's log messages to the :mod:`logging` module,
+without blocking the thread that Ultralight logs from."""
+
+from __future__ import annotations
+
+import collections
+import logging
+import queue
+import threading
+import time
+from . import _base
+from . import _stubs
+from ._base import ffi
+from ._string import get_string
+from types import TracebackType
+from typing import Any
+from typing import Self
+from typing import cast
+
+_LOG_LEVELS = (logging.ERROR, logging.WARNING, logging.INFO)
+"""The :mod:`logging` levels, by ``ULLogLevel`` (``kLogLevel_Error``, etc.)."""
+
+_MAX_TRACKED_MESSAGES = 1024
+
+_Message = tuple[float, int, str]
+"""A queued message: ``(monotonic time, logging level, text)``."""
+
+
+class LoggerBridge:
+    """Forwards Ultralight's log messages (see :func:`ulPlatformSetLogger`) to a
+    :class:`logging.Logger`.
+
+    The ``ULLogger`` callback just copies the message into a
+    :class:`queue.SimpleQueue`, which never blocks; a background thread does the
+    actual logging, so slow log handlers never stall rendering.  If more than
+    ``max_pending`` messages are waiting, further ones are dropped.
+
+    To keep chatty warnings from dominating, repeats of a message within
+    ``dedup_interval`` seconds are suppressed (and counted in the next occurrence that
+    gets through, or else reported once the message is forgotten or the bridge is
+    closed), and at most ``max_rate`` messages per second (with bursts of as
+    many) are emitted, with the excess dropped and periodically reported.
+
+    Ultralight supports a single, process-wide logger, so the callback dispatches to
+    whichever instance was most recently :meth:`install`-ed.
+
+    Example::
+
+        bridge = LoggerBridge(logging.getLogger('ultralight'))
+        bridge.install()  # (Before creating the renderer.)
+        ...
+        bridge.close()
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        *,
+        max_pending: int = 10_000,
+        dedup_interval: float = 1.0,
+        max_rate: float = 100.0,
+    ) -> None:
+        self.logger = logger or logging.getLogger('ultralight')
+        self.max_pending = max_pending
+        self.dedup_interval = dedup_interval
+        self.max_rate = max_rate
+        self.num_dropped = 0
+        """The number of messages dropped due to a full queue."""
+        self.num_rate_limited = 0
+        """The number of messages dropped due to the rate limit."""
+        self.num_suppressed = 0
+        """The number of duplicate messages suppressed."""
+        self._queue: queue.SimpleQueue[_Message | None] = queue.SimpleQueue()
+        self._last_seen: dict[tuple[int, str], float] = {}
+        self._suppressed: collections.Counter[tuple[int, str]] = collections.Counter()
+        self._tokens = max_rate
+        self._last_refill = time.monotonic()
+        self._num_rate_limited = 0
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def install(self) -> None:
+        """Makes this the active logger (:func:`ulPlatformSetLogger`), and starts the
+        background thread.
+
+        This must be done before creating the renderer.
+        """
+        global _active  # pylint: disable=global-statement
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name='ultralight-logger', daemon=True
+            )
+            self._thread.start()
+        _active = self
+        _stubs.ulPlatformSetLogger(cast(Any, _get_definition())[0])
+
+    def close(self) -> None:
+        """Logs the pending messages, and stops the background thread.
+
+        Messages logged by Ultralight afterwards are dropped.
+        """
+        global _active  # pylint: disable=global-statement
+        if _active is self:
+            _active = None
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def log_message(self, level: int, message: str) -> None:
+        """Queues a message (with a :mod:`logging` level) to be logged."""
+        if self._thread is None or self._queue.qsize() >= self.max_pending:
+            self.num_dropped += 1
+        else:
+            self._queue.put((time.monotonic(), level, message))
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            self._emit(*item)
+        for key in list(self._suppressed):
+            self._report_suppressed(key)
+        self._report_rate_limited()
+
+    def _emit(self, timestamp: float, level: int, message: str) -> None:
+        key = (level, message)
+        last_seen = self._last_seen.get(key)
+        if last_seen is not None and timestamp - last_seen < self.dedup_interval:
+            self._suppressed[key] += 1
+            self.num_suppressed += 1
+        elif self._take_token(timestamp):
+            self._track(key, timestamp)
+            num_suppressed = self._suppressed.pop(key, 0)
+            if num_suppressed:
+                self.logger.log(
+                    level, '%s (%d duplicates suppressed)', message, num_suppressed
+                )
+            else:
+                self.logger.log(level, '%s', message)
+        else:
+            self._num_rate_limited += 1
+            self.num_rate_limited += 1
+
+    def _take_token(self, timestamp: float) -> bool:
+        self._tokens = min(
+            self.max_rate,
+            self._tokens + (timestamp - self._last_refill) * self.max_rate,
+        )
+        self._last_refill = timestamp
+        has_token = self._tokens >= 1
+        if has_token:
+            self._tokens -= 1
+            self._report_rate_limited()
+        return has_token
+
+    def _track(self, key: tuple[int, str], timestamp: float) -> None:
+        self._last_seen[key] = timestamp
+        if len(self._last_seen) > _MAX_TRACKED_MESSAGES:
+            # (Forget the messages that are past the deduplication interval.)
+            expired_keys = [
+                expired_key
+                for expired_key, last_seen in self._last_seen.items()
+                if timestamp - last_seen >= self.dedup_interval
+            ]
+            for expired_key in expired_keys:
+                del self._last_seen[expired_key]
+                self._report_suppressed(expired_key)
+
+    def _report_suppressed(self, key: tuple[int, str]) -> None:
+        num_suppressed = self._suppressed.pop(key, 0)
+        if num_suppressed:
+            level, message = key
+            self.logger.log(
+                level,
+                'Suppressed %d duplicates of Ultralight log message: %s',
+                num_suppressed,
+                message,
+            )
+
+    def _report_rate_limited(self) -> None:
+        if self._num_rate_limited:
+            self.logger.warning(
+                'Dropped %d Ultralight log messages (rate limit)',
+                self._num_rate_limited,
+            )
+            self._num_rate_limited = 0
+
+
+_active: LoggerBridge | None = None
+
+
+def get_active_logger_bridge() -> LoggerBridge | None:
+    """Returns the most recently installed :class:`LoggerBridge`, if any."""
+    return _active
+
+
+@_base.callback('void(ULLogLevel, ULString)')
+def _cb__log_message(log_level: int, message: _stubs.ULString) -> None:
+    bridge = _active
+    if bridge is not None:
+        bridge.log_message(
+            (
+                _LOG_LEVELS[log_level]
+                if 0 <= log_level < len(_LOG_LEVELS)
+                else logging.INFO
+            ),
+            get_string(message),
+        )
+
+
+_definition: _stubs.ULLogger | None = None
+
+
+def _get_definition() -> _stubs.ULLogger:
+    """Returns the singleton ``ULLogger`` definition, creating it on first use."""
+    global _definition  # pylint: disable=global-statement
+    if _definition is None:
+        _definition = cast(_stubs.ULLogger, ffi.new('ULLogger*'))
+        _definition.log_message = _cb__log_message
+    return _definition
@@ -0,0 +1,408 @@
+""":class:`CustomSurface` implementations backed by ordinary memory, whose storage is
+reused across resizes rather than reallocated each time - including a ring-buffered
+one, for reading frames from other threads without blocking the renderer."""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from ._surface import CustomSurface
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import ClassVar
+from typing import NamedTuple
+from typing import Self
+from typing_extensions import Buffer
+
+_BPP = 4
+
+
+def get_row_bytes(width: int, alignment: int = 16) -> int:
+    """Returns the row stride of a BGRA image, padded to a multiple of ``alignment``
+    bytes - like Ultralight's own bitmaps with :func:`ulConfigSetBitmapAlignment` (0
+    for tightly packed rows)."""
+    row_bytes = width * _BPP
+    if alignment > 1:
+        row_bytes = -(-row_bytes // alignment) * alignment
+    return row_bytes
+
+
+class PixelStorage:
+    """A byte buffer that grows geometrically, and shrinks lazily.
+
+    :meth:`reserve` reuses the current allocation whenever the requested size fits,
+    and otherwise over-allocates by ``growth_factor``, so that e.g. dragging a window
+    edge doesn't reallocate on every step.  The allocation is only shrunk once it's
+    been more than ``growth_factor`` squared times too large for ``shrink_delay``
+    seconds (as of a :meth:`reserve` or :meth:`shrink` call), so that views bouncing
+    between sizes keep their storage.
+    """
+
+    def __init__(
+        self, *, growth_factor: float = 1.5, shrink_delay: float = 5.0
+    ) -> None:
+        if growth_factor < 1.0:
+            raise ValueError(f'growth_factor must be at least 1; got {growth_factor}')
+        self.growth_factor = growth_factor
+        self.shrink_delay = shrink_delay
+        self.num_allocations = 0
+        """The number of times the storage has been (re)allocated."""
+        self._data = bytearray()
+        self._oversized_since: float | None = None
+
+    @property
+    def capacity(self) -> int:
+        """The size of the current allocation, in bytes."""
+        return len(self._data)
+
+    def reserve(self, size: int) -> memoryview:
+        """Returns a view of the first ``size`` bytes of the storage, (re)allocating it
+        as needed.
+
+        The contents are unspecified: they're left over from earlier use if the
+        allocation is reused, and zeroed otherwise.
+        """
+        if size > len(self._data) or self._should_shrink(size):
+            self._allocate(size)
+        return memoryview(self._data)[:size]
+
+    def shrink(self, size: int) -> memoryview | None:
+        """Reallocates the storage to fit the first ``size`` bytes, keeping their
+        contents, if it's been oversized for long enough - for storage that isn't
+        :meth:`reserve`-d again for a while, e.g. after a view is resized just once.
+
+        Returns a view of the new allocation, or ``None`` if it wasn't reallocated.
+        """
+        view = None
+        if self._should_shrink(size):
+            old_data = self._data
+            self._allocate(size)
+            view = memoryview(self._data)[:size]
+            view[:] = memoryview(old_data)[:size]
+        return view
+
+    def clear(self) -> None:
+        """Releases the allocation."""
+        self._data = bytearray()
+        self._oversized_since = None
+
+    def _allocate(self, size: int) -> None:
+        self._data = bytearray(int(size * self.growth_factor))
+        self._oversized_since = None
+        self.num_allocations += 1
+
+    def _should_shrink(self, size: int) -> bool:
+        oversized = size * self.growth_factor**2 < len(self._data)
+        now = time.monotonic()
+        if not oversized:
+            self._oversized_since = None
+        elif self._oversized_since is None:
+            self._oversized_since = now
+        return (
+            self._oversized_since is not None
+            and now - self._oversized_since >= self.shrink_delay
+        )
+
+
+class MemorySurface(CustomSurface):
+    """A custom surface whose BGRA pixels are stored in a :class:`PixelStorage`, which
+    is reused across resizes (see :attr:`growth_factor` and :attr:`shrink_delay`) -
+    e.g. for views that are resized often, at responsive breakpoints or while dragging
+    a window edge.
+
+    Like Ultralight's own bitmap surfaces, the rows are padded to a multiple of
+    :attr:`bitmap_alignment` bytes, and the pixels are unspecified after resizing,
+    until the next paint.
+
+    The tuning knobs are class variables, since Ultralight creates the surfaces;
+    subclass to change them::
+
+        class TightSurface(MemorySurface):
+            growth_factor = 1.0
+            bitmap_alignment = 0
+
+        ultralight_cffi.ulPlatformSetSurfaceDefinition(
+            TightSurface.get_definition()[0]
+        )
+    """
+
+    cache_metrics = True
+    growth_factor: ClassVar[float] = 1.5
+    """How much to over-allocate by when growing."""
+    shrink_delay: ClassVar[float] = 5.0
+    """How long (in seconds) the storage must be oversized before it's shrunk."""
+    bitmap_alignment: ClassVar[int] = 16
+    """The row alignment, in bytes; match the renderer's
+    :func:`ulConfigSetBitmapAlignment` (which defaults to 16)."""
+
+    def __init__(self, width: int, height: int) -> None:
+        super().__init__()
+        self.storage = PixelStorage(
+            growth_factor=self.growth_factor, shrink_delay=self.shrink_delay
+        )
+        self.width = width
+        self.height = height
+        self.row_bytes = get_row_bytes(width, self.bitmap_alignment)
+        self.pixels = self.storage.reserve(self.row_bytes * height)
+
+    @classmethod
+    def create(cls, width: int, height: int) -> Self:
+        return cls(width, height)
+
+    def destroy(self) -> None:
+        self.storage.clear()
+
+    def get_width(self) -> int:
+        return self.width
+
+    def get_height(self) -> int:
+        return self.height
+
+    def get_size(self) -> int:
+        return self.row_bytes * self.height
+
+    def get_row_bytes(self) -> int:
+        return self.row_bytes
+
+    def lock_pixels(self) -> Buffer:
+        return self.pixels
+
+    def unlock_pixels(self) -> None:
+        # (So that the storage is shrunk even if the surface isn't resized again.)
+        pixels = self.storage.shrink(self.get_size())
+        if pixels is not None:
+            self.pixels = pixels
+
+    def resize(self, width: int, height: int) -> None:
+        if (width, height) != (self.width, self.height):
+            self.width = width
+            self.height = height
+            self.row_bytes = get_row_bytes(width, self.bitmap_alignment)
+            self.pixels = self.storage.reserve(self.row_bytes * height)
+            # (In case this isn't called by Ultralight.)
+            self.update_metrics()
+
+
+class SurfaceFrame(NamedTuple):
+    """A complete frame published by a :class:`RingBufferSurface`."""
+
+    pixels: memoryview
+    """The BGRA pixels (read-only), which are only valid within the
+    :meth:`RingBufferSurface.latest_frame` block."""
+    width: int
+    height: int
+    row_bytes: int
+    generation: int
+    """The frame's sequence number, starting at 1."""
+
+
+@dataclass
+class RingBufferStats:
+    """Counters for a :class:`RingBufferSurface`."""
+
+    published: int = 0
+    """Frames painted and published (i.e. the current generation)."""
+    read: int = 0
+    """Frames acquired by :meth:`RingBufferSurface.latest_frame` (counting each
+    frame once)."""
+    dropped: int = 0
+    """Frames replaced by a newer one before any reader acquired them."""
+    copies: int = 0
+    """Front buffers copied into a back buffer, before painting into it."""
+
+
+class _Buffer:
+    """One of the buffers of a :class:`RingBufferSurface`."""
+
+    def __init__(self, storage: PixelStorage) -> None:
+        self.storage = storage
+        self.pixels = memoryview(bytearray())
+        self.width = 0
+        self.height = 0
+        self.row_bytes = 0
+        self.generation = 0
+        self.readers = 0
+        self.read = False
+
+    def reserve(self, width: int, height: int, row_bytes: int) -> None:
+        self.pixels = self.storage.reserve(row_bytes * height)
+        self.width = width
+        self.height = height
+        self.row_bytes = row_bytes
+        self.generation = 0
+
+
+class RingBufferSurface(CustomSurface):
+    """A custom surface with several BGRA buffers, so that other threads (e.g. an
+    encoder) can read complete frames while the renderer paints the next one, without
+    either waiting for the other or tearing.
+
+    :meth:`lock_pixels` hands the renderer a back buffer that's neither the latest
+    frame nor being read, :meth:`unlock_pixels` publishes it as the latest frame, and
+    :meth:`latest_frame` pins the latest frame for reading.  Ultralight only repaints
+    the dirty parts of a surface, so a back buffer is first brought up to date by
+    copying the latest frame into it (see :attr:`RingBufferStats.copies`).
+
+    There are :attr:`num_buffers` buffers to begin with - enough for one frame being
+    painted, the latest one, and one older one that's still being read - and more are
+    added if readers hold on to more frames than that.  Each buffer's storage is a
+    :class:`PixelStorage`, tuned like :class:`MemorySurface`'s.
+
+    Example::
+
+        ultralight_cffi.ulPlatformSetSurfaceDefinition(
+            RingBufferSurface.get_definition()[0]
+        )
+        ...
+        surface = RingBufferSurface.from_ffi(lib, ulViewGetSurface(view))
+
+        # In the encoder thread:
+        generation = 0
+        while surface.wait_for_frame(generation, timeout=1.0):
+            with surface.latest_frame() as frame:
+                encode(frame.pixels, frame.width, frame.height, frame.row_bytes)
+                generation = frame.generation
+    """
+
+    cache_metrics = True
+    num_buffers: ClassVar[int] = 3
+    growth_factor: ClassVar[float] = 1.5
+    shrink_delay: ClassVar[float] = 5.0
+    bitmap_alignment: ClassVar[int] = 16
+
+    def __init__(self, width: int, height: int) -> None:
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.row_bytes = get_row_bytes(width, self.bitmap_alignment)
+        self.stats = RingBufferStats()
+        self._condition = threading.Condition()
+        self._buffers = [self._create_buffer() for _ in range(self.num_buffers)]
+        self._front: _Buffer | None = None
+        self._back: _Buffer | None = None
+
+    @property
+    def generation(self) -> int:
+        """The generation of the latest frame (0 until the first one)."""
+        return self.stats.published
+
+    @classmethod
+    def create(cls, width: int, height: int) -> Self:
+        return cls(width, height)
+
+    def destroy(self) -> None:
+        for buffer in self._buffers:
+            buffer.storage.clear()
+
+    def get_width(self) -> int:
+        return self.width
+
+    def get_height(self) -> int:
+        return self.height
+
+    def get_size(self) -> int:
+        return self.row_bytes * self.height
+
+    def get_row_bytes(self) -> int:
+        return self.row_bytes
+
+    def lock_pixels(self) -> Buffer:
+        with self._condition:
+            back = next(
+                (
+                    buffer
+                    for buffer in self._buffers
+                    if buffer is not self._front and not buffer.readers
+                ),
+                None,
+            )
+            if back is None:
+                back = self._create_buffer()
+                self._buffers.append(back)
+        # (Only this thread writes to the buffers, so the rest needs no lock; readers
+        # only get the front buffer, which isn't written to.)
+        if (back.width, back.height, back.row_bytes) != (
+            self.width,
+            self.height,
+            self.row_bytes,
+        ):
+            back.reserve(self.width, self.height, self.row_bytes)
+        front = self._front
+        if (
+            front is not None
+            and front.generation != back.generation
+            and (front.width, front.height) == (back.width, back.height)
+        ):
+            back.pixels[:] = front.pixels
+            back.generation = front.generation
+            self.stats.copies += 1
+        self._back = back
+        return back.pixels
+
+    def unlock_pixels(self) -> None:
+        back = self._back
+        if back is not None:
+            self._back = None
+            # (See `MemorySurface.unlock_pixels`.)
+            pixels = back.storage.shrink(len(back.pixels))
+            if pixels is not None:
+                back.pixels = pixels
+            with self._condition:
+                if self._front is not None and not self._front.read:
+                    self.stats.dropped += 1
+                self.stats.published += 1
+                back.generation = self.stats.published
+                back.read = False
+                self._front = back
+                self._condition.notify_all()
+
+    def resize(self, width: int, height: int) -> None:
+        # (The back buffers are resized as they're locked.)
+        self.width = width
+        self.height = height
+        self.row_bytes = get_row_bytes(width, self.bitmap_alignment)
+        self.update_metrics()  # (See `MemorySurface.resize`.)
+
+    @contextlib.contextmanager
+    def latest_frame(self) -> Iterator[SurfaceFrame | None]:
+        """Pins the latest complete frame (or ``None`` if nothing has been painted yet)
+        for the duration of the ``with`` block, without blocking the renderer."""
+        with self._condition:
+            buffer = self._front
+            if buffer is not None:
+                buffer.readers += 1
+                if not buffer.read:
+                    buffer.read = True
+                    self.stats.read += 1
+        try:
+            yield (
+                None
+                if buffer is None
+                else SurfaceFrame(
+                    buffer.pixels.toreadonly(),
+                    buffer.width,
+                    buffer.height,
+                    buffer.row_bytes,
+                    buffer.generation,
+                )
+            )
+        finally:
+            if buffer is not None:
+                with self._condition:
+                    buffer.readers -= 1
+
+    def wait_for_frame(self, generation: int, timeout: float | None = None) -> bool:
+        """Waits until a frame newer than ``generation`` is published, and returns
+        whether one was (rather than timing out)."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self.stats.published > generation, timeout
+            )
+
+    def _create_buffer(self) -> _Buffer:
+        return _Buffer(
+            PixelStorage(
+                growth_factor=self.growth_factor, shrink_delay=self.shrink_delay
+            )
+        )
@@ -0,0 +1,250 @@
+"""Pooling of ``ULView`` objects, to amortize the cost of view creation (and WebCore
+frame setup) across many renders."""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+from . import _base
+from . import _stubs
+from ._base import NULL
+from ._base import CData
+from ._string import get_string
+from ._string import temp_string
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+from typing import NamedTuple
+from typing import cast
+
+_BLANK_URL = 'about:blank'
+
+_MAX_RESET_UPDATES = 100
+"""The number of :func:`ulUpdate` calls that a released view's ``about:blank`` load
+may take before the view is destroyed rather than pooled."""
+
+
+class ViewKey(NamedTuple):
+    """The properties that pooled views are matched by."""
+
+    width: int
+    height: int
+    transparent: bool
+    device_scale: float
+
+
+@dataclass
+class ViewPoolStats:
+    """Counters for a :class:`ViewPool`."""
+
+    hits: int = 0
+    """Acquisitions served by an idle pooled view."""
+    misses: int = 0
+    """Acquisitions that had to create a new view."""
+    evictions: int = 0
+    """Idle views destroyed to stay within ``max_size``."""
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of acquisitions that were hits (or 0 if there were none)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+_resetting: set[int] = set()
+"""The addresses of the views whose ``about:blank`` load (see :func:`_reset_view`)
+hasn't finished yet."""
+
+
+@_base.callback('void(void*, ULView, unsigned long long, _Bool, ULString)')
+def _on_reset_loaded(
+    user_data: CData,
+    caller: _stubs.ULView,
+    frame_id: int,
+    is_main_frame: bool,
+    url: _stubs.ULString,
+) -> None:
+    # (Checking the URL, in case stopping the previous load reports it as failed.)
+    if is_main_frame and get_string(url) == _BLANK_URL:
+        _resetting.discard(_base.get_address(caller))
+
+
+@_base.callback(
+    'void(void*, ULView, unsigned long long, _Bool, ULString, ULString, ULString, int)'
+)
+def _on_reset_failed(  # pylint: disable=too-many-arguments
+    user_data: CData,
+    caller: _stubs.ULView,
+    frame_id: int,
+    is_main_frame: bool,
+    url: _stubs.ULString,
+    description: _stubs.ULString,
+    error_domain: _stubs.ULString,
+    error_code: int,
+) -> None:
+    _on_reset_loaded(user_data, caller, frame_id, is_main_frame, url)
+
+
+def _clear_callbacks(view: _stubs.ULView) -> None:
+    """Detaches all of the view's ``ulViewSet*Callback`` callbacks."""
+    for name in _stubs._symbols.functions:  # pylint: disable=protected-access
+        if name.startswith('ulViewSet') and name.endswith('Callback'):
+            getattr(_stubs, name)(view, cast(Any, NULL), NULL)
+
+
+class ViewPool:
+    """A pool of reusable views for a renderer, keyed by size, transparency and device
+    scale (see :class:`ViewKey`).
+
+    :meth:`release` resets a view - stopping any load, detaching its callbacks and
+    loading ``about:blank`` - and keeps it for the next :meth:`acquire` of the same
+    key.  It updates the renderer (:func:`ulUpdate`) until the blank page has loaded,
+    so that its load events can't reach the next user's callbacks; other views'
+    callbacks may fire in the meantime.  At most ``max_size`` idle views are kept;
+    beyond that, the least recently released ones are destroyed.
+
+    Example::
+
+        pool = ViewPool(renderer, max_size=8)
+        with pool.view(800, 600) as view:
+            ...  # load, render, etc.
+        print(pool.stats)
+    """
+
+    def __init__(
+        self,
+        renderer: _stubs.ULRenderer,
+        *,
+        max_size: int = 16,
+        session: _stubs.ULSession | None = None,
+    ) -> None:
+        if max_size < 0:
+            raise ValueError(f'Invalid max_size: {max_size}')
+        self.renderer = renderer
+        self.max_size = max_size
+        self.session = session
+        self.stats = ViewPoolStats()
+        # Idle views, by address, in LRU order (least recently released first):
+        self._idle: collections.OrderedDict[int, tuple[ViewKey, _stubs.ULView]] = (
+            collections.OrderedDict()
+        )
+        self._idle_by_key: dict[ViewKey, list[int]] = {}
+        self._in_use: dict[int, ViewKey] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of idle views."""
+        return len(self._idle)
+
+    def acquire(
+        self,
+        width: int,
+        height: int,
+        *,
+        transparent: bool = False,
+        device_scale: float = 1.0,
+    ) -> _stubs.ULView:
+        """Returns an idle view with the given properties, or creates a new one.
+
+        The view must be given back with :meth:`release` (rather than destroyed).
+        """
+        key = ViewKey(width, height, transparent, device_scale)
+        addresses = self._idle_by_key.get(key)
+        if addresses:
+            # (Reuse the most recently released view, which is the likeliest to be
+            # warm.)
+            address = addresses.pop()
+            _, view = self._idle.pop(address)
+            self.stats.hits += 1
+        else:
+            view = self._create_view(key)
+            address = _base.get_address(view)
+            self.stats.misses += 1
+        self._in_use[address] = key
+        return view
+
+    def release(self, view: _stubs.ULView) -> None:
+        """Resets a view obtained from :meth:`acquire`, and returns it to the pool
+        (or destroys it, if the blank page doesn't load)."""
+        address = _base.get_address(view)
+        key = self._in_use.pop(address, None)
+        if key is None:
+            raise ValueError(f'View not acquired from this pool: {view}')
+        if not self._reset_view(view):
+            _stubs.ulDestroyView(view)
+            return
+        self._idle[address] = (key, view)
+        self._idle_by_key.setdefault(key, []).append(address)
+        while len(self._idle) > self.max_size:
+            self._evict()
+
+    @contextlib.contextmanager
+    def view(
+        self,
+        width: int,
+        height: int,
+        *,
+        transparent: bool = False,
+        device_scale: float = 1.0,
+    ) -> Iterator[_stubs.ULView]:
+        """Acquires a view for the duration of the ``with`` block."""
+        view = self.acquire(
+            width, height, transparent=transparent, device_scale=device_scale
+        )
+        try:
+            yield view
+        finally:
+            self.release(view)
+
+    def clear(self) -> None:
+        """Destroys all of the idle views.  (Views currently in use are unaffected.)"""
+        while self._idle:
+            _, (_, view) = self._idle.popitem()
+            _stubs.ulDestroyView(view)
+        self._idle_by_key.clear()
+
+    def _create_view(self, key: ViewKey) -> _stubs.ULView:
+        view_config = _stubs.ulCreateViewConfig()
+        try:
+            _stubs.ulViewConfigSetIsTransparent(view_config, key.transparent)
+            _stubs.ulViewConfigSetInitialDeviceScale(view_config, key.device_scale)
+            return _stubs.ulCreateView(
+                self.renderer,
+                key.width,
+                key.height,
+                view_config,
+                NULL if self.session is None else self.session,
+            )
+        finally:
+            _stubs.ulDestroyViewConfig(view_config)
+
+    def _reset_view(self, view: _stubs.ULView) -> bool:
+        """Returns a view to a blank state for reuse, and returns whether the blank
+        page finished loading."""
+        address = _base.get_address(view)
+        _stubs.ulViewStop(view)
+        _clear_callbacks(view)
+        _stubs.ulViewUnfocus(view)
+        _stubs.ulViewSetFinishLoadingCallback(view, _on_reset_loaded, NULL)
+        _stubs.ulViewSetFailLoadingCallback(view, _on_reset_failed, NULL)
+        _resetting.add(address)
+        try:
+            with temp_string(_BLANK_URL) as url_string:
+                _stubs.ulViewLoadURL(view, url_string)
+            for _ in range(_MAX_RESET_UPDATES):
+                if address not in _resetting:
+                    break
+                _stubs.ulUpdate(self.renderer)
+            return address not in _resetting
+        finally:
+            _resetting.discard(address)
+            _stubs.ulViewSetFinishLoadingCallback(view, cast(Any, NULL), NULL)
+            _stubs.ulViewSetFailLoadingCallback(view, cast(Any, NULL), NULL)
+
+    def _evict(self) -> None:
+        address, (key, view) = self._idle.popitem(last=False)
+        addresses = self._idle_by_key[key]
+        addresses.remove(address)
+        if not addresses:
+            del self._idle_by_key[key]
+        _stubs.ulDestroyView(view)
+        self.stats.evictions += 1
@@ -0,0 +1,163 @@
+"""A :class:`CustomSurface` backed by shared memory, so that frames rendered in one
+process can be read in another without copying or pickling the pixels."""
+
+from __future__ import annotations
+
+import contextlib
+import sys
+from ._bitmap import wrap_pixels
+from ._surface import CustomSurface
+from collections.abc import Iterator
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any
+from typing import Self
+from typing import cast
+from typing_extensions import Buffer
+
+_BPP = 4
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attaches to an existing shared memory block, without taking ownership of it.
+
+    Before Python 3.13, attaching registers the block with the process' resource
+    tracker regardless, which is harmless for processes sharing the creator's tracker
+    (e.g. :mod:`multiprocessing` children and parents), but makes unrelated processes
+    unlink it when they exit.
+    """
+    if sys.version_info >= (3, 13):
+        block = shared_memory.SharedMemory(  # pylint: disable=unexpected-keyword-arg
+            name, track=False
+        )
+    else:
+        block = shared_memory.SharedMemory(name)
+    return block
+
+
+@dataclass(frozen=True)
+class SharedFrame:
+    """A small, picklable descriptor of a :class:`SharedMemorySurface`'s frame, for
+    passing to another process, which can then access the pixels with
+    :func:`shared_frame_pixels`."""
+
+    name: str
+    """The shared memory block's name."""
+    width: int
+    height: int
+    row_bytes: int
+    generation: int
+    """Incremented each time the surface's pixels are unlocked (i.e. potentially
+    modified) or reallocated, so that readers can tell frames apart."""
+
+
+class SharedMemorySurface(CustomSurface):
+    """A custom surface whose BGRA pixels are stored in a
+    :class:`multiprocessing.shared_memory.SharedMemory` block, which the surface owns.
+
+    Only the :class:`SharedFrame` descriptor (see :meth:`get_frame`) needs to cross
+    the process boundary.  Resizing the surface allocates a new block, with a new name,
+    and unlinks the old one; readers that are still attached to the old block keep
+    their mapping (on POSIX) until they detach.
+
+    Example::
+
+        ultralight_cffi.ulPlatformSetSurfaceDefinition(
+            SharedMemorySurface.get_definition()[0]
+        )
+        ...
+        surface = SharedMemorySurface.from_ffi(lib, ulViewGetSurface(view))
+        send_to_parent(surface.get_frame())
+    """
+
+    cache_metrics = True
+
+    def __init__(self, width: int, height: int) -> None:
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.row_bytes = width * _BPP
+        self.generation = 0
+        self.block = self._allocate()
+
+    @classmethod
+    def create(cls, width: int, height: int) -> Self:
+        return cls(width, height)
+
+    def destroy(self) -> None:
+        # (The block can't be closed while the cached pointer to it exists.)
+        self.invalidate_buffer()
+        self.block.close()
+        self.block.unlink()
+
+    def get_width(self) -> int:
+        return self.width
+
+    def get_height(self) -> int:
+        return self.height
+
+    def get_size(self) -> int:
+        return self.row_bytes * self.height
+
+    def get_row_bytes(self) -> int:
+        return self.row_bytes
+
+    def lock_pixels(self) -> Buffer:
+        return cast(memoryview, self.block.buf)
+
+    def unlock_pixels(self) -> None:
+        self.generation += 1
+
+    def resize(self, width: int, height: int) -> None:
+        if (width, height) != (self.width, self.height):
+            self.invalidate_buffer()
+            self.destroy()
+            self.width = width
+            self.height = height
+            self.row_bytes = width * _BPP
+            self.generation += 1
+            self.block = self._allocate()
+            # (In case this isn't called by Ultralight.)
+            self.update_metrics()
+
+    def get_frame(self) -> SharedFrame:
+        """Returns a descriptor of the current frame."""
+        return SharedFrame(
+            self.block.name, self.width, self.height, self.row_bytes, self.generation
+        )
+
+    def _allocate(self) -> shared_memory.SharedMemory:
+        # (Zero-sized blocks aren't allowed.)
+        return shared_memory.SharedMemory(create=True, size=max(self.get_size(), 1))
+
+
+@contextlib.contextmanager
+def shared_frame_pixels(frame: SharedFrame) -> Iterator[Any]:
+    """Attaches to a :class:`SharedMemorySurface`'s shared memory block, and provides
+    zero-copy access to the frame's pixels for the duration of the ``with`` block - as
+    a ``(height, width, 4)`` NumPy array if NumPy is installed, or a
+    ``(height, row_bytes)`` :class:`memoryview` otherwise, with the same caveats as
+    :func:`bitmap_pixels`.
+
+    The surface's process may render into the same memory concurrently; compare the
+    ``generation`` of a fresh descriptor afterwards to detect that, if needed.
+
+    Raises:
+        :class:`FileNotFoundError`: If the block no longer exists, e.g. because the
+        surface was destroyed or resized.
+    """
+    block = _attach(frame.name)
+    try:
+        with wrap_pixels(
+            cast(memoryview, block.buf),
+            frame.width,
+            frame.height,
+            _BPP,
+            frame.row_bytes,
+        ) as pixels:
+            yield pixels
+    finally:
+        # (Fails with `BufferError` if the NumPy array is still alive; the mapping is
+        # then released once it's garbage collected.)
+        with contextlib.suppress(BufferError):
+            block.close()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import contextlib
+from . import _stubs
+from ._base import ffi
+from collections.abc import Iterator
+from typing import Any
+from typing import cast
+
+
+def create_string(value: str | bytes) -> _stubs.ULString:
+    """Creates a ``ULString`` from a Python string (or UTF-8 bytes).
+
+    The caller owns the result, and must eventually destroy it with
+    :func:`ulDestroyString`; see also :func:`temp_string`.
+    """
+    data = value.encode() if isinstance(value, str) else value
+    return _stubs.ulCreateStringUTF8(data, len(data))
+
+
+def get_string(string: _stubs.ULString) -> str:
+    """Decodes a ``ULString`` into a Python string (without destroying it)."""
+    return get_string_bytes(string).decode(errors='replace')
+
+
+def get_string_bytes(string: _stubs.ULString) -> bytes:
+    """Copies a ``ULString``'s UTF-8 data (without decoding it) - e.g. for strings that
+    only live as long as a callback, but may never need to be decoded."""
+    data: Any = _stubs.ulStringGetData(string)  # (really a `char*` at runtime)
+    return cast(bytes, ffi.unpack(data, _stubs.ulStringGetLength(string)))
+
+
+@contextlib.contextmanager
+def temp_string(value: str | bytes) -> Iterator[_stubs.ULString]:
+    """Creates a ``ULString`` that's destroyed when the ``with`` block exits - for
+    passing strings to functions that copy them, like :func:`ulViewLoadHTML`."""
+    string = create_string(value)
+    try:
+        yield string
+    finally:
+        _stubs.ulDestroyString(string)
@@ -3,7 +3,7 @@ import inspect
 from . import _base
 from . import _stubs
 from ._base import CData
-from ._bindings import ffi
+from ._base import ffi
 from typing import Any
 from typing import ClassVar
 from typing import Self
@@ -17,14 +17,32 @@ CustomSurfaceHandle: TypeAlias = CData
 class CustomSurface(abc.ABC):
     """Python-level abstraction for Pythonically defining user-defined, custom surface
     implementations using ordinary Python (data)classes.
+
+    WebCore calls the getters (:meth:`get_width`, :meth:`get_height`,
+    :meth:`get_row_bytes` and :meth:`get_size`) over and over while painting, so
+    subclasses can opt into :attr:`cache_metrics`, in which case their results are
+    cached by :meth:`update_metrics` after :meth:`create` and :meth:`resize`, and the
+    callbacks return the cached values without calling into the subclass - and with the
+    compiled API-mode bindings, without entering Python at all.
+    """
+
+    cache_metrics: ClassVar[bool] = False
+    """Whether the getter callbacks return the metrics cached by
+    :meth:`update_metrics`, rather than calling the getters each time.
+
+    Only enable this for surfaces whose metrics change solely by :meth:`resize` (or
+    else call :meth:`update_metrics` whenever they change).  The cache is only
+    refreshed automatically when Ultralight resizes the surface, so surfaces that may
+    also be resized directly should call :meth:`update_metrics` at the end of
+    :meth:`resize`, like the built-in ones do.
     """
 
     _cb__create: ClassVar[_stubs.ULSurfaceDefinitionCreateCallback | None] = None
     """A subclass-specific reference to the creation callback.
 
     Unlike the other custom surface callbacks that have only a single definition (e.g.
-    :meth:`._cb__lock_pixels`) that dispatches to the appropriate Python subclass, the
-    creation callback is special because each concrete subclass of
+    :meth:`._dispatch__lock_pixels`) that dispatches to the appropriate Python
+    subclass, the creation callback is special because each concrete subclass of
     :class:`CustomSurface` needs its own creation callback that knows how to instantiate
     that particular subclass - hence why this is a class variable rather than a class
     method.  See :meth:`_generate_cb__create`.
@@ -34,10 +52,24 @@ class CustomSurface(abc.ABC):
 
     def __init__(self) -> None:
         self._handle = ffi.new_handle(self)
+        self._cached_metrics = (0, 0, 0, 0)
+        """The cached ``(width, height, row_bytes, size)``."""
+        self._surface_data: Any = None
+        """The ``_ULPySurfaceData`` struct, with the compiled getters."""
+        self._surface_user_data: CData = self._handle
+        self._locked_buffer: Buffer | None = None
+        """The buffer last returned by :meth:`lock_pixels`."""
+        self._locked_pixels: CData | None = None
+        """The ``ffi.from_buffer`` pointer to ``_locked_buffer``."""
+        if _use_surface_data:
+            self._surface_data = ffi.new('_ULPySurfaceData*', {'handle': self._handle})
+            self._surface_user_data = self._surface_data
 
     @classmethod
     def from_user_data(cls, user_data: CData) -> Self:
-        obj = ffi.from_handle(user_data)
+        if _use_surface_data:
+            user_data = ffi.cast('_ULPySurfaceData*', user_data)
+        obj = _get_surface(user_data)
         if not isinstance(obj, cls):
             raise TypeError(
                 f'Expected FFI handle to point to {cls.__qualname__} instance; got {obj}'
@@ -53,6 +85,18 @@ class CustomSurface(abc.ABC):
         user_data = lib.ulSurfaceGetUserData(ul_surface)  # type: ignore[attr-defined]
         return cls.from_user_data(user_data)
 
+    @classmethod
+    def find(cls, ul_surface: _stubs.ULSurface) -> Self | None:
+        """Returns the instance of this class that implements a ``ULSurface``, or
+        ``None`` if it's implemented otherwise (e.g. by a bitmap surface).
+
+        Unlike :meth:`from_ffi`, this never dereferences the surface's user data, so
+        it's safe to call on any surface.
+        """
+        user_data = _stubs.ulSurfaceGetUserData(ul_surface)
+        surface = _live_surfaces.get(_base.get_address(user_data))
+        return surface if isinstance(surface, cls) else None
+
     @classmethod
     @abc.abstractmethod
     def create(cls, width: int, height: int) -> Self:
@@ -90,54 +134,111 @@ class CustomSurface(abc.ABC):
     def resize(self, width: int, height: int) -> None:
         raise NotImplementedError()
 
+    def invalidate_buffer(self) -> None:
+        """Releases the cached pointer to the pixel buffer.
+
+        The ``lock_pixels`` callback keeps the pointer (and thereby the buffer) for as
+        long as :meth:`lock_pixels` keeps returning the same buffer object, rather than
+        calling :func:`ffi.from_buffer` on every lock.  The cache is released
+        automatically before :meth:`resize` and :meth:`destroy`; call this before
+        swapping or releasing the storage otherwise - e.g. before closing a
+        :class:`mmap.mmap`, which fails while the pointer exists.
+        """
+        self._locked_buffer = None
+        self._locked_pixels = None
+
+    def _get_pixels(self) -> CData:
+        buffer = self.lock_pixels()
+        if buffer is not self._locked_buffer or self._locked_pixels is None:
+            self._locked_pixels = ffi.from_buffer(buffer)
+            self._locked_buffer = buffer
+        return self._locked_pixels
+
+    def update_metrics(self) -> None:
+        """Caches the current results of the getters, for the getter callbacks (see
+        :attr:`cache_metrics`).
+
+        This is called automatically after :meth:`create` and :meth:`resize`.
+        """
+        self._cached_metrics = (
+            self.get_width(),
+            self.get_height(),
+            self.get_row_bytes(),
+            self.get_size(),
+        )
+        if self._surface_data is not None:
+            (
+                self._surface_data.width,
+                self._surface_data.height,
+                self._surface_data.row_bytes,
+                self._surface_data.size,
+            ) = self._cached_metrics
+
     @staticmethod
-    @_base.callback('void(void*)')
-    def _cb__destroy(user_data: CData) -> None:
-        surface = ffi.from_handle(user_data)
+    def _dispatch__destroy(user_data: CData) -> None:
+        surface = _get_surface(user_data)
+        surface.invalidate_buffer()
         surface.destroy()
+        _live_surfaces.pop(_base.get_address(user_data), None)
         del surface
 
     @staticmethod
-    @_base.callback('unsigned int(void*)')
-    def _cb__get_width(user_data: CData) -> int:
-        surface: CustomSurface = ffi.from_handle(user_data)
+    def _dispatch__get_width(user_data: CData) -> int:
+        surface = _get_surface(user_data)
         return surface.get_width()
 
     @staticmethod
-    @_base.callback('unsigned int(void*)')
-    def _cb__get_height(user_data: CData) -> int:
-        surface: CustomSurface = ffi.from_handle(user_data)
+    def _dispatch__get_height(user_data: CData) -> int:
+        surface = _get_surface(user_data)
         return surface.get_height()
 
     @staticmethod
-    @_base.callback('unsigned int(void*)')
-    def _cb__get_row_bytes(user_data: CData) -> int:
-        surface: CustomSurface = ffi.from_handle(user_data)
+    def _dispatch__get_row_bytes(user_data: CData) -> int:
+        surface = _get_surface(user_data)
         return surface.get_row_bytes()
 
     @staticmethod
-    @_base.callback('size_t(void*)')
-    def _cb__get_size(user_data: CData) -> int:
-        surface: CustomSurface = ffi.from_handle(user_data)
+    def _dispatch__get_size(user_data: CData) -> int:
+        surface = _get_surface(user_data)
         return surface.get_size()
 
     @staticmethod
-    @_base.callback('void*(void*)')
-    def _cb__lock_pixels(user_data: CData) -> Any:
+    def _dispatch__lock_pixels(user_data: CData) -> Any:
+        surface = _get_surface(user_data)
+        return surface._get_pixels()  # pylint: disable=protected-access
+
+    @staticmethod
+    def _dispatch__unlock_pixels(user_data: CData) -> None:
+        surface = _get_surface(user_data)
+        surface.unlock_pixels()
+
+    @staticmethod
+    def _dispatch__resize(user_data: CData, width: int, height: int) -> None:
+        surface = _get_surface(user_data)
+        surface.invalidate_buffer()
+        surface.resize(width, height)
+        if surface.cache_metrics:
+            surface.update_metrics()
+
+    @staticmethod
+    def _cached__get_width(user_data: CData) -> int:
         surface: CustomSurface = ffi.from_handle(user_data)
-        return ffi.from_buffer(surface.lock_pixels())
+        return surface._cached_metrics[0]  # pylint: disable=protected-access
 
     @staticmethod
-    @_base.callback('void(void*)')
-    def _cb__unlock_pixels(user_data: CData) -> None:
+    def _cached__get_height(user_data: CData) -> int:
         surface: CustomSurface = ffi.from_handle(user_data)
-        surface.unlock_pixels()
+        return surface._cached_metrics[1]  # pylint: disable=protected-access
 
     @staticmethod
-    @_base.callback('void(void*, unsigned int, unsigned int)')
-    def _cb__resize(user_data: CData, width: int, height: int) -> None:
+    def _cached__get_row_bytes(user_data: CData) -> int:
         surface: CustomSurface = ffi.from_handle(user_data)
-        return surface.resize(width, height)
+        return surface._cached_metrics[2]  # pylint: disable=protected-access
+
+    @staticmethod
+    def _cached__get_size(user_data: CData) -> int:
+        surface: CustomSurface = ffi.from_handle(user_data)
+        return surface._cached_metrics[3]  # pylint: disable=protected-access
 
     @classmethod
     def _generate_cb__create(cls) -> _stubs.ULSurfaceDefinitionCreateCallback:
@@ -155,12 +256,24 @@ class CustomSurface(abc.ABC):
         @_base.callback('void*(unsigned int, unsigned int)')
         def _cb__create(width: int, height: int) -> CData:
             surface = cls.create(width, height)
-            return surface._handle  # pylint: disable=protected-access
+            if surface.cache_metrics:
+                surface.update_metrics()
+            user_data = surface._surface_user_data  # pylint: disable=protected-access
+            _live_surfaces[_base.get_address(user_data)] = surface
+            return user_data
 
         return _cb__create
 
     @classmethod
     def get_definition(cls) -> _stubs.ULSurfaceDefinition:
+        """Returns a ``ULSurfaceDefinition`` for the class, for
+        :func:`ulPlatformSetSurfaceDefinition`.
+
+        The callbacks follow the backend selected by :func:`load` (see
+        :func:`_base.uses_api_callbacks`), so call this afterwards.
+        """
+        global _use_surface_data  # pylint: disable=global-statement
+        _use_surface_data = _base.uses_api_callbacks() and _HAS_COMPILED_GETTERS
         defn: _stubs.ULSurfaceDefinition = cast(
             _stubs.ULSurfaceDefinition, ffi.new('ULSurfaceDefinition*')
         )
@@ -170,21 +283,129 @@ class CustomSurface(abc.ABC):
             )
 
         # Generate a per-subclass `_cb__create` ffi callback, while avoiding
-        # accidentally inheriting the super class' `_cb__create`.  (FIXME: find a less
-        # tricky/clever way to do this)
-        if cls._cb__create is None or (
-            cls._cb__create is super()._cb__create  # type: ignore[misc] # pylint: disable=no-member
-        ):
+        # accidentally inheriting the super class' `_cb__create`:
+        if cls.__dict__.get('_cb__create') is None:
             cls._cb__create = cls._generate_cb__create()
 
         assert cls._cb__create is not None
         defn.create = cls._cb__create
-        defn.destroy = cls._cb__destroy
-        defn.get_width = cls._cb__get_width
-        defn.get_height = cls._cb__get_height
-        defn.get_row_bytes = cls._cb__get_row_bytes
-        defn.get_size = cls._cb__get_size
-        defn.lock_pixels = cls._cb__lock_pixels
-        defn.unlock_pixels = cls._cb__unlock_pixels
-        defn.resize = cls._cb__resize
+        for field, callback in _get_callbacks().items():
+            setattr(defn, field, callback)
+        if cls.cache_metrics:
+            for field, callback in _get_cached_getters().items():
+                setattr(defn, field, callback)
         return defn
+
+
+_api_bindings = _base.get_api_bindings()
+_HAS_COMPILED_GETTERS = _api_bindings is not None and hasattr(
+    _api_bindings.lib, '_surface_get_width'
+)
+"""Whether the compiled API-mode bindings are available, and recent enough to include
+the compiled getters (see ``scripts/_build.py``)."""
+
+_use_surface_data = _base.uses_api_callbacks() and _HAS_COMPILED_GETTERS
+"""Whether the ``user_data`` of the surfaces is a ``_ULPySurfaceData`` struct, i.e.
+whether the callbacks are the compiled API-mode ones; set by
+:meth:`CustomSurface.get_definition`."""
+
+_live_surfaces: dict[int, CustomSurface] = {}
+"""The surfaces created by Ultralight, by ``user_data`` address, which are kept alive
+until Ultralight destroys them.  (A surface's FFI handle only keeps it alive as long as
+the handle itself is alive, and the handle is referenced only by the surface - so
+without this, the pair would be garbage collected as a reference cycle while Ultralight
+still uses it.)"""
+
+_CALLBACK_CDECLS = {
+    'destroy': 'void(void*)',
+    'get_width': 'unsigned int(void*)',
+    'get_height': 'unsigned int(void*)',
+    'get_row_bytes': 'unsigned int(void*)',
+    'get_size': 'size_t(void*)',
+    'lock_pixels': 'void*(void*)',
+    'unlock_pixels': 'void(void*)',
+    'resize': 'void(void*, unsigned int, unsigned int)',
+}
+"""Signatures of the :class:`CustomSurface` callbacks other than ``create``, by
+``ULSurfaceDefinition`` field name."""
+
+_callbacks: dict[bool, dict[str, CData]] = {}
+"""The callbacks, by whether they're the compiled API-mode ones."""
+
+
+def _get_callbacks() -> dict[str, CData]:
+    """Returns the singleton ``ULSurfaceDefinition`` callbacks (other than ``create``),
+    creating them on first use.
+
+    With the API-mode backend (see :func:`_base.uses_api_callbacks`), the callbacks
+    are the ``extern "Python"`` functions declared by ``scripts/_build.py``, which
+    avoid the libffi closure trampolines of ordinary ``ffi.callback`` callbacks.
+    (Those take the ``_ULPySurfaceData*`` that is the ``user_data``, so they're cast
+    to the field types.)
+    """
+    use_api = _base.uses_api_callbacks()
+    callbacks = _callbacks.get(use_api)
+    if callbacks is None:
+        api = _api_bindings
+        callbacks = _callbacks[use_api] = {}
+        for field, cdecl in _CALLBACK_CDECLS.items():
+            func = getattr(CustomSurface, f'_dispatch__{field}')
+            if not use_api:
+                callbacks[field] = _base.callback(cdecl)(func)
+            else:
+                assert api is not None
+                name = f'_cb__surface_{field}'
+                api.ffi.def_extern(name=name)(func)
+                callbacks[field] = api.ffi.cast(
+                    _get_field_type(field), api.ffi.addressof(api.lib, name)
+                )
+    return callbacks
+
+
+def _get_field_type(field: str) -> Any:
+    """Returns the type of a ``ULSurfaceDefinition`` field."""
+    fields = dict(ffi.typeof('ULSurfaceDefinition').fields)
+    field_type = fields[field].type
+    return field_type
+
+
+_GETTER_CDECLS = {
+    field: cdecl
+    for field, cdecl in _CALLBACK_CDECLS.items()
+    if field.startswith('get_')
+}
+
+_cached_getters: dict[bool, dict[str, CData]] = {}
+"""The cached getter callbacks, by whether they're the compiled ones."""
+
+
+def _get_cached_getters() -> dict[str, CData]:
+    """Returns the singleton getter callbacks for :attr:`CustomSurface.cache_metrics`,
+    creating them on first use.
+
+    With the API-mode backend, these are plain C functions that read the
+    ``_ULPySurfaceData`` struct declared by ``scripts/_build.py``; otherwise, they're
+    ``ffi.callback`` callbacks that read the cached tuple.  (The libffi trampoline
+    dominates the cost of the latter, so e.g. an integer-keyed registry of the surfaces
+    instead of :func:`ffi.from_handle`, or reading a C struct via :func:`ffi.cast`,
+    would only make it slower; see ``benchmarks/surface_dispatch.py``.)
+    """
+    cached_getters = _cached_getters.get(_use_surface_data)
+    if cached_getters is None:
+        cached_getters = _cached_getters[_use_surface_data] = {}
+        for field, cdecl in _GETTER_CDECLS.items():
+            if _use_surface_data:
+                assert _api_bindings is not None
+                cached_getters[field] = getattr(_api_bindings.lib, f'_surface_{field}')
+            else:
+                func = getattr(CustomSurface, f'_cached__{field}')
+                cached_getters[field] = _base.callback(cdecl)(func)
+    return cached_getters
+
+
+def _get_surface(user_data: CData) -> CustomSurface:
+    """Returns the surface that a callback's ``user_data`` refers to."""
+    if _use_surface_data:
+        user_data = cast(Any, user_data).handle
+    surface: CustomSurface = ffi.from_handle(user_data)
+    return surface
@@ -0,0 +1,128 @@
+"""Warm-up routine for fresh renderers, whose first render is several times slower than
+later ones while fonts, shaders and WebCore's caches are cold."""
+
+from __future__ import annotations
+
+import asyncio
+import html
+import time
+from . import _stubs
+from ._asyncio import RendererDriver
+from dataclasses import dataclass
+
+_DEFAULT_CSS = """
+.box {
+  width: 120px;
+  height: 40px;
+  margin: 8px;
+  display: inline-block;
+  border-radius: 8px;
+  border: 2px solid #345;
+  box-shadow: 0 2px 6px rgba(0, 0, 0, 0.5);
+  background: linear-gradient(to right, #fa0, #0af);
+  opacity: 0.9;
+  transform: rotate(3deg);
+}
+"""
+
+
+@dataclass(frozen=True)
+class WarmUpProfile:
+    """What :func:`warm_up` exercises: by default, a document with a paragraph of
+    ``text`` for each combination of the ``font_families``, ``weights`` and (optionally)
+    italics, followed by some boxes styled with commonly used CSS features (rounded
+    borders, shadows, gradients, opacity and transforms).
+
+    Tailor it to the fonts and features that the real pages use, or pass a complete
+    document as ``html``.
+    """
+
+    font_families: tuple[str, ...] = ('serif', 'sans-serif', 'monospace')
+    """CSS ``font-family`` values, e.g. ``'"DejaVu Sans"'``."""
+    weights: tuple[int, ...] = (400, 700)
+    italic: bool = True
+    text: str = 'The quick brown fox jumps over the lazy dog. 0123456789 ÀÉÎÕÜ'
+    css: str = _DEFAULT_CSS
+    body: str = '<div class="box"></div>' * 4
+    """Extra HTML, after the text."""
+    html: str | None = None
+    """A complete document to load instead of the generated one."""
+    width: int = 800
+    height: int = 600
+
+    def get_html(self) -> str:
+        """Returns the warm-up document."""
+        document = self.html
+        if document is None:
+            styles = ('normal', 'italic') if self.italic else ('normal',)
+            paragraphs = ''.join(
+                f'<p style="font-family: {html.escape(family)}; '
+                f'font-weight: {weight}; font-style: {style}">'
+                f'{html.escape(self.text)}</p>'
+                for family in self.font_families
+                for weight in self.weights
+                for style in styles
+            )
+            document = (
+                f'<!DOCTYPE html><html><head><style>{self.css}</style></head>'
+                f'<body>{paragraphs}{self.body}</body></html>'
+            )
+        return document
+
+
+@dataclass(frozen=True)
+class WarmUpReport:
+    """The timings of a :func:`warm_up` run, in seconds."""
+
+    load_time: float
+    """From creating the view until the document finished loading."""
+    render_time: float
+    """The first :func:`ulRender`."""
+    total_time: float
+
+
+def warm_up(
+    renderer: _stubs.ULRenderer,
+    profile: WarmUpProfile | None = None,
+    *,
+    timeout: float = 30.0,
+) -> WarmUpReport:
+    """Loads and renders a warm-up document (see :class:`WarmUpProfile`) in a temporary
+    view, so that the first real render doesn't pay for cold fonts, shaders and caches;
+    e.g. while initializing a worker process, before it accepts any work.
+
+    This runs its own event loop (via :class:`RendererDriver`), so it can't be called
+    from a running one; the :class:`RenderFarm` workers run it as needed (see its
+    ``warm_up`` parameter).
+
+    Raises:
+        :class:`LoadError`: If the document fails to load.
+        :class:`TimeoutError`: If it doesn't load within ``timeout`` seconds.
+    """
+
+    async def run() -> WarmUpReport:
+        async with RendererDriver(renderer) as driver:
+            return await warm_up_async(driver, profile, timeout=timeout)
+
+    return asyncio.run(run())
+
+
+async def warm_up_async(
+    driver: RendererDriver,
+    profile: WarmUpProfile | None = None,
+    *,
+    timeout: float = 30.0,
+) -> WarmUpReport:
+    """Like :func:`warm_up`, but for a renderer driven by a running
+    :class:`RendererDriver`."""
+    profile = profile or WarmUpProfile()
+    start = time.perf_counter()
+    view = driver.create_view(profile.width, profile.height)
+    try:
+        await asyncio.wait_for(view.load_html(profile.get_html()), timeout)
+        loaded = time.perf_counter()
+        driver.render()
+        rendered = time.perf_counter()
+    finally:
+        view.destroy()
+    return WarmUpReport(loaded - start, rendered - loaded, time.perf_counter() - start)